@@ -0,0 +1,72 @@
+import sys
+import os
+import time
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.models.avl_tree import AVLTree
+from src.models.task import Task
+
+"""
+Benchmarks de AVLTree.
+Mide la ingesta sostenida de IDs secuenciales (como los que genera
+TaskController.next_id) con el corte temprano del rebalanceo y
+rebalanceando todo el camino de cada inserción.
+
+Uso:
+    python benchmarks/bench_avl_tree.py [n1 n2 ...]
+"""
+
+
+class FullPathTree(AVLTree):
+    """AVLTree que rebalancea todo el camino de cada inserción (sin corte temprano)"""
+
+    def _rebalance_insert_path(self, path):
+        return self._rebalance_path(path)
+
+
+def make_tasks(n):
+    """Genera n tareas con IDs secuenciales"""
+    return [Task(i, f"Tarea {i}", "MEDIA", "2024-12-31") for i in range(1, n + 1)]
+
+
+def bench_sequential_ingest(tasks, tree_class=AVLTree):
+    """
+    Inserta las tareas una a una en orden creciente de ID.
+
+    Returns:
+        float: Segundos empleados
+    """
+    tree = tree_class()
+    start = time.perf_counter()
+    for task in tasks:
+        tree.insert(task)
+    return time.perf_counter() - start
+
+
+def bench_append(sizes):
+    """Ingesta de IDs secuenciales: camino completo vs corte temprano del rebalanceo"""
+    print("=" * 70)
+    print(" BENCHMARK AVL: ingesta de IDs secuenciales")
+    print("=" * 70)
+    print(f"{'n':>10} | {'camino':<20} | {'inserciones/s':>14} | {'speedup':>8}")
+    print("-" * 70)
+
+    for n in sizes:
+        tasks = make_tasks(n)
+        general = min(bench_sequential_ingest(tasks, FullPathTree) for _ in range(3))
+        fast = min(bench_sequential_ingest(tasks) for _ in range(3))
+
+        print(f"{n:>10} | {'camino completo':<20} | {n / general:>14,.0f} | {'1.00x':>8}")
+        print(f"{n:>10} | {'corte temprano':<20} | {n / fast:>14,.0f} | {general / fast:>7.2f}x")
+
+    print("=" * 70)
+
+
+def main():
+    sizes = [int(arg) for arg in sys.argv[1:]] or [10_000, 100_000, 1_000_000]
+
+    bench_append(sizes)
+
+
+if __name__ == "__main__":
+    main()
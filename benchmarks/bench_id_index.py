@@ -0,0 +1,106 @@
+import sys
+import os
+import random
+import time
+import tracemalloc
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.models.avl_tree import AVLTree
+from src.models.sorted_block_index import SortedBlockIndex
+from src.models.task import Task
+
+"""
+Benchmarks de los índices por ID (AVLTree vs SortedBlockIndex).
+Compara la memoria por tarea de cada estructura (sin contar las tareas) y
+las operaciones por segundo de inserción secuencial, búsqueda y eliminación
+aleatorias.
+
+Uso:
+    python benchmarks/bench_id_index.py [n1 n2 ...]
+"""
+
+BACKENDS = [
+    ("AVLTree", lambda: AVLTree(log_operations=False)),
+    ("SortedBlockIndex", lambda: SortedBlockIndex(log_operations=False)),
+]
+
+
+def make_tasks(n):
+    """Genera n tareas con IDs secuenciales"""
+    return [Task(i, f"Tarea {i}", "MEDIA", "2024-12-31") for i in range(1, n + 1)]
+
+
+def measure_memory(factory, tasks):
+    """
+    Construye el índice por inserciones midiendo solo la memoria que
+    reserva la estructura (las tareas ya existen).
+
+    Returns:
+        float: Bytes por tarea
+    """
+    tracemalloc.start()
+    index = factory()
+    for task in tasks:
+        index.insert(task)
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del index
+    return current / len(tasks)
+
+
+def measure_ops(factory, tasks, lookups):
+    """
+    Mide inserción secuencial, búsqueda aleatoria y eliminación aleatoria.
+
+    Returns:
+        tuple: Operaciones por segundo (inserción, búsqueda, eliminación)
+    """
+    index = factory()
+    start = time.perf_counter()
+    for task in tasks:
+        index.insert(task)
+    insert_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for task_id in lookups:
+        index.search(task_id)
+    search_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for task_id in lookups:
+        index.delete(task_id)
+    delete_time = time.perf_counter() - start
+
+    return len(tasks) / insert_time, len(lookups) / search_time, len(lookups) / delete_time
+
+
+def bench_backends(sizes, lookups=10_000, seed=42):
+    """Memoria por tarea y operaciones por segundo de cada índice"""
+    print("=" * 86)
+    print(" BENCHMARK ÍNDICES POR ID: AVLTree vs SortedBlockIndex")
+    print("=" * 86)
+    print(f"{'n':>10} | {'índice':<18} | {'bytes/tarea':>11} | {'insert/s':>12} | "
+          f"{'search/s':>12} | {'delete/s':>12}")
+    print("-" * 86)
+
+    rng = random.Random(seed)
+    for n in sizes:
+        tasks = make_tasks(n)
+        ids = rng.sample(range(1, n + 1), min(lookups, n))
+        for name, factory in BACKENDS:
+            memory = measure_memory(factory, tasks)
+            inserts, searches, deletes = measure_ops(factory, tasks, ids)
+            print(f"{n:>10} | {name:<18} | {memory:>11.1f} | {inserts:>12,.0f} | "
+                  f"{searches:>12,.0f} | {deletes:>12,.0f}")
+
+    print("=" * 86)
+
+
+def main():
+    sizes = [int(arg) for arg in sys.argv[1:]] or [10_000, 100_000, 1_000_000]
+
+    bench_backends(sizes)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,176 @@
+import sys
+import os
+import time
+import random
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.models.max_heap import MaxHeap
+from src.models.bucket_queue import BucketQueue
+from src.models.task import Task
+
+"""
+Benchmarks de MaxHeap.
+Compara el heap que usa Task.__gt__ contra el heap con claves enteras, y el
+heap binario contra la cola por cubetas con distintas mezclas de prioridades,
+y una matriz aridad x n x proporción inserción/extracción para heaps d-arios.
+
+Uso:
+    python benchmarks/bench_max_heap.py [n1 n2 ...]
+"""
+
+PRIORITIES = ["BAJA", "MEDIA", "ALTA"]
+
+
+# Pesos (BAJA, MEDIA, ALTA) de cada mezcla de prioridades
+PRIORITY_MIXES = {
+    'uniforme': (1, 1, 1),
+    'mayoría ALTA': (1, 9, 90),
+    'mayoría BAJA': (90, 9, 1),
+}
+
+
+def make_tasks(n, seed=42, weights=(1, 1, 1)):
+    """Genera n tareas con prioridades y fechas aleatorias (reproducibles)"""
+    rng = random.Random(seed)
+    tasks = []
+    priorities = rng.choices(PRIORITIES, weights=weights, k=n)
+    for i in range(1, n + 1):
+        due_date = f"2024-{rng.randint(1, 12):02d}-{rng.randint(1, 28):02d}"
+        tasks.append(Task(i, f"Tarea {i}", priorities[i - 1], due_date))
+    return tasks
+
+
+def bench_insert_extract(tasks, factory=MaxHeap, **options):
+    """
+    Inserta todas las tareas y luego las extrae todas.
+
+    Returns:
+        tuple: (segundos de inserción, segundos de extracción)
+    """
+    heap = factory(**options)
+
+    start = time.perf_counter()
+    for task in tasks:
+        heap.insert(task)
+    insert_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    while not heap.is_empty():
+        heap.extract_max()
+    extract_time = time.perf_counter() - start
+
+    return insert_time, extract_time
+
+
+def bench_keyed(sizes):
+    """Task.__gt__ vs claves enteras precalculadas"""
+    print("=" * 78)
+    print(" BENCHMARK MAX-HEAP: Task.__gt__ vs claves enteras precalculadas")
+    print("=" * 78)
+    print(f"{'n':>10} | {'modo':<14} | {'insert ops/s':>14} | {'extract ops/s':>14} | {'speedup':>8}")
+    print("-" * 78)
+
+    for n in sizes:
+        tasks = make_tasks(n)
+        base_insert, base_extract = bench_insert_extract(tasks)
+        key_insert, key_extract = bench_insert_extract(tasks, keyed=True)
+
+        base_total = base_insert + base_extract
+        key_total = key_insert + key_extract
+
+        print(f"{n:>10} | {'Task.__gt__':<14} | {n / base_insert:>14,.0f} | {n / base_extract:>14,.0f} | {'1.00x':>8}")
+        print(f"{n:>10} | {'claves int':<14} | {n / key_insert:>14,.0f} | {n / key_extract:>14,.0f} | "
+              f"{base_total / key_total:>7.2f}x")
+
+    print("=" * 78)
+
+
+def bench_buckets(sizes):
+    """Heap binario indexado vs cola por cubetas, con mezclas sesgadas"""
+    print("=" * 78)
+    print(" BENCHMARK COLA DE PRIORIDAD: heap binario vs cubetas por prioridad")
+    print("=" * 78)
+    print(f"{'n':>10} | {'mezcla':<13} | {'cola':<8} | {'insert ops/s':>13} | {'extract ops/s':>13} | {'speedup':>7}")
+    print("-" * 78)
+
+    for n in sizes:
+        for mix, weights in PRIORITY_MIXES.items():
+            tasks = make_tasks(n, weights=weights)
+            heap_insert, heap_extract = bench_insert_extract(tasks, indexed=True, keyed=True)
+            bucket_insert, bucket_extract = bench_insert_extract(tasks, factory=BucketQueue)
+
+            speedup = (heap_insert + heap_extract) / (bucket_insert + bucket_extract)
+            print(f"{n:>10} | {mix:<13} | {'heap':<8} | {n / heap_insert:>13,.0f} | {n / heap_extract:>13,.0f} | "
+                  f"{'1.00x':>7}")
+            print(f"{n:>10} | {mix:<13} | {'cubetas':<8} | {n / bucket_insert:>13,.0f} | "
+                  f"{n / bucket_extract:>13,.0f} | {speedup:>6.2f}x")
+
+    print("=" * 78)
+
+
+# Proporciones (inserciones, extracciones) por ciclo de operaciones
+OPERATION_RATIOS = [(1, 1), (4, 1), (1, 4)]
+ARITIES = [2, 4, 8]
+
+
+def bench_mixed(heap, new_tasks, ratio):
+    """
+    Alterna inserciones y extracciones según la proporción dada.
+
+    Returns:
+        float: Segundos empleados
+    """
+    inserts, extracts = ratio
+    pending = iter(new_tasks)
+    operations = len(new_tasks)
+
+    start = time.perf_counter()
+    done = 0
+    while done < operations:
+        for _ in range(inserts):
+            heap.insert(next(pending))
+        for _ in range(extracts):
+            heap.extract_max()
+        done += inserts + extracts
+    return time.perf_counter() - start
+
+
+def bench_arity(sizes):
+    """Matriz aridad x n x proporción inserción/extracción"""
+    print("=" * 78)
+    print(" BENCHMARK HEAP D-ARIO: aridad x n x proporción inserción/extracción")
+    print("=" * 78)
+    header = " | ".join(f"{'d=' + str(d):>10}" for d in ARITIES)
+    print(f"{'n':>10} | {'ins:ext':>7} | {header}   (ops/s)")
+    print("-" * 78)
+
+    for n in sizes:
+        tasks = make_tasks(2 * n)
+        initial, new_tasks = tasks[:n], tasks[n:]
+        operations = min(n, 200_000)
+
+        for ratio in OPERATION_RATIOS:
+            results = []
+            for arity in ARITIES:
+                heap = MaxHeap.from_tasks(initial, indexed=True, keyed=True, arity=arity)
+                elapsed = bench_mixed(heap, new_tasks[:operations], ratio)
+                results.append(operations / elapsed)
+
+            row = " | ".join(f"{ops:>10,.0f}" for ops in results)
+            print(f"{n:>10} | {ratio[0]:>3}:{ratio[1]:<3} | {row}")
+
+    print("=" * 78)
+
+
+def main():
+    sizes = [int(arg) for arg in sys.argv[1:]] or [100_000, 1_000_000]
+
+    bench_keyed(sizes)
+    print()
+    bench_buckets(sizes)
+    print()
+    bench_arity(sizes)
+
+
+if __name__ == "__main__":
+    main()
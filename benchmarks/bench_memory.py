@@ -0,0 +1,112 @@
+import sys
+import os
+import tracemalloc
+from datetime import datetime
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.models.avl_tree import AVLTree
+from src.models.task import Task
+
+"""
+Benchmark de memoria por tarea (tracemalloc).
+Compara la representación compacta de Task y AVLNode (__slots__, nombres de
+prioridad internados, fechas como enteros) con una réplica de la
+representación anterior basada en __dict__.
+
+Uso:
+    python benchmarks/bench_memory.py [n1 n2 ...]
+"""
+
+PRIORITIES = ["BAJA", "MEDIA", "ALTA"]
+
+
+class DictTask:
+    """Réplica de la Task anterior: __dict__, datetime y nombre por instancia"""
+
+    def __init__(self, task_id, description, priority_name, due_date):
+        self.task_id = task_id
+        self.description = description
+        self.priority_name = priority_name.upper()
+        self.priority = PRIORITIES.index(self.priority_name) + 1
+        self.due_date = due_date
+        self.created_at = datetime.now()
+
+
+class DictNode:
+    """Réplica del AVLNode anterior, con __dict__"""
+
+    def __init__(self, task):
+        self.task = task
+        self.left = None
+        self.right = None
+        self.height = 1
+        self.size = 1
+
+
+def make_args(n):
+    """Genera los argumentos de n tareas (la entrada no se cuenta en la medición)"""
+    return [(i, f"Tarea {i}", PRIORITIES[i % 3].lower(), f"2024-{(i % 12) + 1:02d}-{(i % 28) + 1:02d}")
+            for i in range(1, n + 1)]
+
+
+def measure(build, args):
+    """
+    Mide la memoria retenida por lo que construye build(args).
+
+    Returns:
+        float: Bytes por tarea
+    """
+    tracemalloc.start()
+    result = build(args)
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del result
+    return current / len(args)
+
+
+def build_dict_tasks(args):
+    return [DictTask(*arg) for arg in args]
+
+
+def build_tasks(args):
+    return [Task(*arg) for arg in args]
+
+
+def build_dict_nodes(args):
+    return [DictNode(DictTask(*arg)) for arg in args]
+
+
+def build_tree(args):
+    return AVLTree.from_sorted((Task(*arg) for arg in args), log_operations=False)
+
+
+def bench_memory(sizes):
+    """Bytes por tarea antes (réplica con __dict__) y después (__slots__)"""
+    print("=" * 74)
+    print(" BENCHMARK MEMORIA: bytes por tarea (tracemalloc)")
+    print("=" * 74)
+    print(f"{'n':>10} | {'estructura':<26} | {'antes':>9} | {'después':>9} | {'ahorro':>7}")
+    print("-" * 74)
+
+    for n in sizes:
+        args = make_args(n)
+        cases = [
+            ("Task", build_dict_tasks, build_tasks),
+            ("Task + nodo AVL", build_dict_nodes, build_tree),
+        ]
+        for name, before_build, after_build in cases:
+            before = measure(before_build, args)
+            after = measure(after_build, args)
+            print(f"{n:>10} | {name:<26} | {before:>9.1f} | {after:>9.1f} | {1 - after / before:>6.0%}")
+
+    print("=" * 74)
+
+
+def main():
+    sizes = [int(arg) for arg in sys.argv[1:]] or [100_000, 1_000_000]
+
+    bench_memory(sizes)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,139 @@
+import sys
+import os
+import time
+import random
+from datetime import date
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.controllers.task_controller import TaskController
+from src.models.task import Task
+from src.models import task_store
+
+"""
+Benchmarks de TaskController.
+Mide operaciones de alto nivel que afectan al heap y al árbol AVL a la vez,
+y las estadísticas y filtros sobre el almacén columnar.
+
+Uso:
+    python benchmarks/bench_task_controller.py [n]
+"""
+
+PRIORITIES = ["BAJA", "MEDIA", "ALTA"]
+
+
+def make_controller(n, seed=42):
+    """Crea un controlador con n tareas de prioridades y fechas aleatorias"""
+    rng = random.Random(seed)
+    tasks = []
+    for i in range(1, n + 1):
+        due_date = f"2024-{rng.randint(1, 12):02d}-{rng.randint(1, 28):02d}"
+        tasks.append(Task(i, f"Tarea {i}", rng.choice(PRIORITIES), due_date))
+
+    controller = TaskController()
+    controller.load_tasks(tasks)
+    return controller
+
+
+def bench_batch_complete(n):
+    """Costo por tarea: complete_n_highest_priority_tasks(k) vs k llamadas individuales"""
+    print(f"\n--- Completar k tareas prioritarias (n = {n}) ---")
+    print(f"{'k':>8} | {'k llamadas (us/tarea)':>22} | {'lote (us/tarea)':>16} | {'speedup':>8}")
+
+    for k in [10, 100, 1_000, 10_000, n // 2]:
+        controller = make_controller(n)
+        start = time.perf_counter()
+        for _ in range(k):
+            controller.complete_highest_priority_task()
+        single_time = time.perf_counter() - start
+
+        controller = make_controller(n)
+        start = time.perf_counter()
+        controller.complete_n_highest_priority_tasks(k)
+        batch_time = time.perf_counter() - start
+
+        print(f"{k:>8} | {single_time / k * 1e6:>22.2f} | {batch_time / k * 1e6:>16.2f} | "
+              f"{single_time / batch_time:>7.2f}x")
+
+
+def bench_lookups(n, lookups=200_000, seed=7):
+    """Búsquedas puntuales por ID: descenso por el AVL vs mapa de IDs"""
+    print(f"\n--- Búsquedas por ID (n = {n}, {lookups} consultas) ---")
+    print(f"{'camino':<26} | {'búsquedas/s':>14} | {'speedup':>8}")
+
+    controller = make_controller(n)
+    rng = random.Random(seed)
+    ids = [rng.randint(1, n + n // 10) for _ in range(lookups)]  # ~10% inexistentes
+
+    start = time.perf_counter()
+    for task_id in ids:
+        controller.avl_tree.search(task_id)
+    avl_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for task_id in ids:
+        controller.search_task_by_id(task_id)
+    map_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    controller.get_tasks_by_ids(ids)
+    batch_time = time.perf_counter() - start
+
+    print(f"{'AVLTree.search':<26} | {lookups / avl_time:>14,.0f} | {'1.00x':>8}")
+    print(f"{'search_task_by_id':<26} | {lookups / map_time:>14,.0f} | {avl_time / map_time:>7.2f}x")
+    print(f"{'get_tasks_by_ids (lote)':<26} | {lookups / batch_time:>14,.0f} | {avl_time / batch_time:>7.2f}x")
+
+
+def bench_statistics(n, repeats=20):
+    """Estadísticas y filtros: recorrido de los objetos Task vs almacén columnar"""
+    print(f"\n--- Estadísticas y filtros (n = {n}, NumPy: {'sí' if task_store.np is not None else 'no'}) ---")
+    print(f"{'consulta':<30} | {'tareas (ms)':>12} | {'columnas (ms)':>14} | {'speedup':>8}")
+
+    controller = make_controller(n)
+    tasks = controller.get_all_tasks_by_priority()
+    today = "2024-06-30"
+    today_ordinal = date.fromisoformat(today).toordinal()
+
+    def count_loop():
+        counts = {'ALTA': 0, 'MEDIA': 0, 'BAJA': 0}
+        for task in tasks:
+            counts[task.priority_name] += 1
+        return counts
+
+    def filter_loop():
+        return sum(1 for task in tasks if task.priority_name == "ALTA" and task.due_ordinal <= today_ordinal)
+
+    cases = [
+        ("conteo por prioridad", count_loop, controller.task_store.count_by_priority),
+        ("ALTA y vencidas hasta hoy", filter_loop, lambda: controller.count_tasks("ALTA", due_to=today)),
+    ]
+    for name, loop, columnar in cases:
+        assert loop() == columnar(), "Ambos caminos deben dar el mismo resultado"
+        loop_time = min(_timed(loop) for _ in range(repeats))
+        columnar_time = min(_timed(columnar) for _ in range(repeats))
+        print(f"{name:<30} | {loop_time * 1e3:>12.2f} | {columnar_time * 1e3:>14.2f} | "
+              f"{loop_time / columnar_time:>7.2f}x")
+
+
+def _timed(function):
+    """Tiempo de una llamada, en segundos"""
+    start = time.perf_counter()
+    function()
+    return time.perf_counter() - start
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+
+    print("=" * 70)
+    print(" BENCHMARK TASK CONTROLLER")
+    print("=" * 70)
+
+    bench_batch_complete(n)
+    bench_lookups(n)
+    bench_statistics(n)
+
+    print("=" * 70)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,19 +1,119 @@
+from datetime import date
+from itertools import islice
+from operator import attrgetter
+
 from src.models.max_heap import MaxHeap
+from src.models.bucket_queue import BucketQueue
 from src.models.avl_tree import AVLTree
-from src.models.task import Task
+from src.models.sorted_block_index import SortedBlockIndex
+from src.models.due_date_index import DueDateIndex
+from src.models.task_store import TaskStore
+from src.models.task import Task, PRIORITY_VALUES, parse_due_date
 
 class TaskController:
     """
     Controlador que gestiona las operaciones sobre tareas.
-    Mantiene sincronizadas ambas estructuras de datos (MaxHeap y AVLTree).
+    Mantiene sincronizadas ambas estructuras de datos (MaxHeap y AVLTree),
+    junto con los índices secundarios (DueDateIndex).
     """
 
-    def __init__(self):
-        """Inicializa el controlador con las estructuras de datos vacías"""
-        self.max_heap = MaxHeap()  # Para gestión de prioridades
-        self.avl_tree = AVLTree()  # Para indexación por ID
+    QUEUE_BACKENDS = ('heap', 'buckets')
+    INDEX_BACKENDS = ('avl', 'blocks')
+    MERGE_POLICIES = ('remap', 'skip', 'error')
+
+    def __init__(self, queue_backend='heap', lazy_deletion=False, heap_arity=2, index_backend='avl',
+                 validate_index=True):
+        """
+        Inicializa el controlador con las estructuras de datos vacías.
+
+        Args:
+            queue_backend (str): Cola de prioridad a usar: 'heap' (MaxHeap
+                binario) o 'buckets' (BucketQueue, una cubeta por prioridad)
+            lazy_deletion (bool): Eliminar del heap con tombstones y
+                compactación automática (útil con muchas eliminaciones)
+            heap_arity (int): Hijos por nodo del heap (2, 4, 8...); una aridad
+                mayor produce un heap menos profundo
+            index_backend (str): Índice por ID a usar: 'avl' (AVLTree) o
+                'blocks' (SortedBlockIndex, lista ordenada por bloques)
+            validate_index (bool): Crear el árbol AVL en modo validado (con
+                False se omiten las comprobaciones locales de cada
+                rebalanceo, por ejemplo en procesos sin interfaz)
+        """
+        if queue_backend not in self.QUEUE_BACKENDS:
+            raise ValueError(f"Cola de prioridad inválida. Use: {', '.join(self.QUEUE_BACKENDS)}")
+        if index_backend not in self.INDEX_BACKENDS:
+            raise ValueError(f"Índice por ID inválido. Use: {', '.join(self.INDEX_BACKENDS)}")
+
+        self.queue_backend = queue_backend
+        self.lazy_deletion = lazy_deletion
+        self.heap_arity = heap_arity
+        self.index_backend = index_backend
+        self.validate_index = validate_index
+        self.max_heap = self._create_heap()  # Para gestión de prioridades
+        self.avl_tree = self._create_tree()  # Para indexación por ID
+        self.due_index = DueDateIndex()  # Para consultas por fecha de vencimiento
+        self.tasks_by_id = {}  # task_id -> tarea, para búsquedas puntuales en O(1)
+        self.task_store = TaskStore()  # Columnas para conteos y filtros en bloque
+        self.priority_counts = dict.fromkeys(PRIORITY_VALUES.values(), 0)  # Prioridad numérica -> tareas
         self.next_id = 1  # Generador de IDs únicos
 
+    def _create_heap(self, tasks=()):
+        """
+        Crea el heap de prioridades con la configuración del controlador.
+
+        Args:
+            tasks (iterable): Tareas iniciales (se cargan en O(n))
+
+        Returns:
+            MaxHeap | BucketQueue: Heap indexado y con claves precalculadas,
+                o cola por cubetas según queue_backend
+        """
+        if self.queue_backend == 'buckets':
+            return BucketQueue.from_tasks(tasks, lazy=self.lazy_deletion, arity=self.heap_arity)
+        return MaxHeap.from_tasks(tasks, indexed=True, keyed=True, lazy=self.lazy_deletion,
+                                  arity=self.heap_arity)
+
+    def _create_tree(self, tasks=()):
+        """
+        Crea el índice por ID según index_backend. Con validate_index, el
+        árbol AVL se crea en modo validado, para que la verificación de
+        balance y orden de cada actualización de la interfaz sea O(1).
+
+        Args:
+            tasks (iterable): Tareas iniciales ordenadas por ID (se cargan en O(n))
+
+        Returns:
+            AVLTree | SortedBlockIndex: Índice por ID
+        """
+        if self.index_backend == 'blocks':
+            return SortedBlockIndex.from_sorted(tasks) if tasks else SortedBlockIndex()
+        if not tasks:
+            return AVLTree(validate=self.validate_index)
+        return AVLTree.from_sorted(tasks, validate=self.validate_index)
+
+    def _index_task(self, task):
+        """Agrega una tarea a los índices secundarios"""
+        self.due_index.add(task)
+        self.tasks_by_id[task.task_id] = task
+        self.task_store.add(task)
+        self.priority_counts[task.priority] += 1
+
+    def _unindex_task(self, task_id):
+        """Elimina una tarea de los índices secundarios"""
+        self.due_index.remove(task_id)
+        task = self.tasks_by_id.pop(task_id)
+        self.task_store.remove(task_id)
+        self.priority_counts[task.priority] -= 1
+
+    @staticmethod
+    def _count_priorities(task_store):
+        """
+        Conteos por prioridad numérica a partir de la columna de prioridades.
+        Se usa la prioridad numérica (no el nombre) como en task_store: una
+        tarea cargada con un nombre desconocido cuenta con su valor (MEDIA).
+        """
+        return {PRIORITY_VALUES[name]: count for name, count in task_store.count_by_priority().items()}
+
     def add_task(self, description, priority_name, due_date):
         """
         Agrega una nueva tarea al sistema.
@@ -32,19 +132,144 @@ class TaskController:
         if not description or not description.strip():
             raise ValueError("La descripción no puede estar vacía")
 
-        if priority_name.upper() not in ['BAJA', 'MEDIA', 'ALTA']:
+        if priority_name.upper() not in PRIORITY_VALUES:
             raise ValueError("Prioridad inválida. Use: BAJA, MEDIA o ALTA")
 
-        # Crear la tarea
+        # Crear la tarea (valida la fecha de vencimiento)
         task = Task(self.next_id, description.strip(), priority_name, due_date)
         self.next_id += 1
 
         # Insertar en ambas estructuras
         self.max_heap.insert(task)
         self.avl_tree.insert(task)
+        self._index_task(task)
 
         return task
 
+    def load_tasks(self, tasks):
+        """
+        Carga masivamente tareas ya creadas (por ejemplo, al restaurar una
+        cola guardada), junto con las que ya existan en el sistema.
+        Reconstruye el heap con heapify de abajo hacia arriba y el AVL como
+        árbol perfectamente balanceado, sin inserciones individuales.
+
+        Args:
+            tasks (iterable): Tareas a cargar
+
+        Returns:
+            int: Número de tareas cargadas
+
+        Raises:
+            ValueError: Si hay IDs repetidos
+
+        Complejidad: O(n) para construir ambas estructuras (más el
+        ordenamiento por ID, lineal si la entrada ya viene ordenada)
+        """
+        new_tasks = list(tasks)
+        all_tasks = sorted(self.get_all_tasks_by_id() + new_tasks, key=attrgetter('task_id'))
+
+        # Construir todas las estructuras antes de reemplazar las actuales
+        avl_tree = self._create_tree(all_tasks)
+        max_heap = self._create_heap(all_tasks)
+        due_index = DueDateIndex.from_tasks(all_tasks)
+        task_store = TaskStore.from_tasks(all_tasks)
+
+        self.max_heap = max_heap
+        self.avl_tree = avl_tree
+        self.due_index = due_index
+        self.tasks_by_id = {task.task_id: task for task in all_tasks}
+        self.task_store = task_store
+        self.priority_counts = self._count_priorities(task_store)
+        if all_tasks:
+            self.next_id = max(self.next_id, all_tasks[-1].task_id + 1)
+
+        return len(new_tasks)
+
+    def merge(self, other, on_conflict='remap'):
+        """
+        Une al sistema todas las tareas de otro controlador (por ejemplo, al
+        combinar colas importadas). Las secuencias in-order de ambos AVL se
+        intercalan en una sola pasada y las estructuras se reconstruyen en
+        bloque: AVL balanceado, heap con heapify de abajo hacia arriba e
+        índice por fecha intercalando sus claves ordenadas. El otro
+        controlador queda vacío.
+
+        Args:
+            other (TaskController): Controlador cuyas tareas se incorporan
+            on_conflict (str): Qué hacer con las tareas de other cuyo ID ya
+                existe: 'remap' (asignarles IDs nuevos), 'skip' (descartarlas)
+                o 'error' (lanzar ValueError sin modificar nada)
+
+        Returns:
+            dict: IDs reasignados (ID original -> ID nuevo)
+
+        Raises:
+            ValueError: Si la política es inválida, si other es este mismo
+                controlador o si hay colisiones con on_conflict='error'
+
+        Complejidad: O(n + m) (más O(c log c) para las c colisiones)
+        """
+        if on_conflict not in self.MERGE_POLICIES:
+            raise ValueError(f"Política de colisión inválida. Use: {', '.join(self.MERGE_POLICIES)}")
+        if other is self:
+            raise ValueError("No se puede unir un controlador consigo mismo")
+
+        ours = self.avl_tree.get_all_tasks()
+        theirs = other.avl_tree.get_all_tasks()
+
+        # Intercalar ambas secuencias ordenadas por ID, separando colisiones
+        merged = []
+        collisions = []
+        i = j = 0
+        while i < len(ours) and j < len(theirs):
+            if ours[i].task_id < theirs[j].task_id:
+                merged.append(ours[i])
+                i += 1
+            elif ours[i].task_id > theirs[j].task_id:
+                merged.append(theirs[j])
+                j += 1
+            else:
+                merged.append(ours[i])
+                collisions.append(theirs[j])
+                i += 1
+                j += 1
+        merged.extend(ours[i:])
+        merged.extend(theirs[j:])
+
+        if collisions and on_conflict == 'error':
+            raise ValueError(f"IDs repetidos al unir: {', '.join(str(t.task_id) for t in collisions)}")
+
+        # Las colisiones de other no se incorporan con su ID original
+        other_index = other.due_index
+        other_index.remove_many(task.task_id for task in collisions)
+
+        next_id = max(self.next_id, other.next_id, merged[-1].task_id + 1 if merged else 1)
+        remapped = {}
+        if on_conflict == 'remap':
+            # Los IDs nuevos superan a todos los existentes: van al final.
+            # Se crean tareas nuevas en lugar de renumerar las de other, que
+            # pueden seguir referenciadas (por ejemplo, por instantáneas)
+            copies = []
+            for task in collisions:
+                remapped[task.task_id] = next_id
+                copies.append(task.with_id(next_id))
+                next_id += 1
+            merged.extend(copies)
+            remapped_index = DueDateIndex.from_tasks(copies)
+        else:
+            remapped_index = DueDateIndex()
+
+        self.avl_tree = self._create_tree(merged)
+        self.max_heap = self._create_heap(merged)
+        self.due_index = DueDateIndex.merge(self.due_index, other_index, remapped_index)
+        self.tasks_by_id = {task.task_id: task for task in merged}
+        self.task_store = TaskStore.from_tasks(merged)
+        self.priority_counts = self._count_priorities(self.task_store)
+        self.next_id = next_id
+        other.clear_all_tasks()
+
+        return remapped
+
     def complete_highest_priority_task(self):
         """
         Completa (elimina) la tarea con mayor prioridad.
@@ -60,9 +285,34 @@ class TaskController:
         if task:
             # Eliminar del árbol AVL
             self.avl_tree.delete(task.task_id)
+            self._unindex_task(task.task_id)
 
         return task
 
+    def complete_n_highest_priority_tasks(self, k):
+        """
+        Completa (elimina) en lote las k tareas con mayor prioridad.
+        Las tareas se extraen del heap en orden y se eliminan del árbol AVL
+        en un único recorrido por lote.
+
+        Args:
+            k (int): Número de tareas a completar
+
+        Returns:
+            list: Tareas completadas en orden de prioridad (hasta k)
+
+        Complejidad: O(k log n)
+        """
+        if k < 0:
+            raise ValueError("El número de tareas no puede ser negativo")
+
+        tasks = self.max_heap.extract_top(k)
+        self.avl_tree.delete_many(task.task_id for task in tasks)
+        for task in tasks:
+            self._unindex_task(task.task_id)
+
+        return tasks
+
     def get_highest_priority_task(self):
         """
         Obtiene la tarea con mayor prioridad sin eliminarla.
@@ -84,9 +334,32 @@ class TaskController:
         Returns:
             Task: La tarea encontrada o None si no existe
 
-        Complejidad: O(log n)
+        Complejidad: O(1) (mapa de IDs; el AVL queda para consultas ordenadas)
+        """
+        return self.tasks_by_id.get(task_id)
+
+    def has_task(self, task_id):
+        """
+        Verifica si existe una tarea con el ID dado.
+
+        Complejidad: O(1)
         """
-        return self.avl_tree.search(task_id)
+        return task_id in self.tasks_by_id
+
+    def get_tasks_by_ids(self, task_ids):
+        """
+        Busca en lote varias tareas por ID.
+
+        Args:
+            task_ids (iterable): IDs a buscar
+
+        Returns:
+            list: Tareas en el mismo orden que los IDs (None para los que no existen)
+
+        Complejidad: O(k) para k IDs
+        """
+        get = self.tasks_by_id.get
+        return [get(task_id) for task_id in task_ids]
 
     def delete_task_by_id(self, task_id):
         """
@@ -98,19 +371,111 @@ class TaskController:
         Returns:
             bool: True si se eliminó exitosamente, False si no existe
 
-        Complejidad: O(n) para el heap + O(log n) para el AVL
+        Complejidad: O(log n) para el heap indexado + O(log n) para el AVL
         """
         # Verificar que la tarea existe
-        task = self.avl_tree.search(task_id)
-        if not task:
+        if task_id not in self.tasks_by_id:
             return False
 
         # Eliminar de ambas estructuras
         self.max_heap.remove(task_id)
         self.avl_tree.delete(task_id)
+        self._unindex_task(task_id)
 
         return True
 
+    def archive_ids_below(self, task_id):
+        """
+        Archiva (elimina del sistema) todas las tareas con ID menor que task_id.
+        El AVL se divide en O(log n) en lugar de eliminar tarea por tarea, y
+        el heap se reconstruye una sola vez con las tareas restantes.
+
+        Args:
+            task_id (int): ID de corte; se archivan los IDs estrictamente menores
+
+        Returns:
+            list: Tareas archivadas, ordenadas por ID
+
+        Complejidad: O(log n) para el AVL + O(n) para reconstruir el heap
+        """
+        archived_tree, self.avl_tree = self.avl_tree.split(task_id)
+        archived = archived_tree.get_all_tasks()
+        if not archived:
+            return archived
+
+        remaining = [task for task in self.max_heap.get_all_tasks() if task.task_id >= task_id]
+        self.max_heap = self._create_heap(remaining)
+        self.due_index.remove_many(task.task_id for task in archived)
+        self.task_store.remove_many(task.task_id for task in archived)
+        for task in archived:
+            del self.tasks_by_id[task.task_id]
+            self.priority_counts[task.priority] -= 1
+
+        return archived
+
+    def update_task(self, task_id, priority=None, due_date=None):
+        """
+        Cambia la prioridad y/o la fecha de vencimiento de una tarea sin
+        eliminarla ni reinsertarla.
+        La tarea se modifica en su lugar: el nodo del AVL no se reestructura
+        porque el ID no cambia, y el heap la reubica desde su posición actual.
+        Si hay instantáneas del índice por ID que comparten la tarea, se
+        modifica una copia y se sustituye en todas las estructuras, de modo
+        que las instantáneas conservan los valores anteriores.
+
+        Args:
+            task_id (int): ID de la tarea a modificar
+            priority (str): Nueva prioridad ('BAJA', 'MEDIA', 'ALTA') o None
+            due_date (str): Nueva fecha de vencimiento (YYYY-MM-DD) o None
+
+        Returns:
+            Task: La tarea modificada o None si no existe
+
+        Raises:
+            ValueError: Si la prioridad o la fecha son inválidas (la tarea
+                no se modifica)
+
+        Complejidad: O(log n)
+        """
+        if priority is not None and priority.upper() not in PRIORITY_VALUES:
+            raise ValueError("Prioridad inválida. Use: BAJA, MEDIA o ALTA")
+
+        task = self.tasks_by_id.get(task_id)
+        if not task:
+            return None
+
+        shared = self.avl_tree.is_shared()
+        if shared:
+            task = task.with_id(task_id)
+        previous = (task.priority_name, task.priority, task.due_date)
+
+        try:
+            if priority is not None:
+                task.priority_name = priority.upper()
+                task.priority = PRIORITY_VALUES[priority.upper()]
+            if due_date is not None:
+                task.due_date = due_date
+            if shared:
+                self.max_heap.replace(task)
+            else:
+                self.max_heap.update_key(task_id)
+        except ValueError:
+            # Restaurar la tarea si la nueva fecha no es válida
+            task.priority_name, task.priority, task.due_date = previous
+            raise
+
+        if shared:
+            # Sustituir la copia; el índice por ID copia su camino
+            self.avl_tree.insert(task)
+            self.tasks_by_id[task_id] = task
+        if due_date is not None:
+            self.due_index.update(task)
+        self.task_store.update(task)
+        self.priority_counts[previous[1]] -= 1
+        self.priority_counts[task.priority] += 1
+
+        return task
+
     def get_all_tasks_by_priority(self):
         """
         Obtiene todas las tareas sin orden específico (del heap).
@@ -122,6 +487,21 @@ class TaskController:
         """
         return self.max_heap.get_all_tasks()
 
+    def iter_tasks_by_priority(self, limit=None):
+        """
+        Genera las tareas en orden de prioridad sin modificar el heap.
+        Útil para mostrar solo la primera página de tareas.
+
+        Args:
+            limit (int): Número máximo de tareas a generar (None = todas)
+
+        Returns:
+            iterator: Tareas de mayor a menor prioridad
+
+        Complejidad: O(k log k) para las primeras k tareas
+        """
+        return islice(self.max_heap.iter_sorted(), limit)
+
     def get_all_tasks_by_id(self):
         """
         Obtiene todas las tareas ordenadas por ID (del AVL).
@@ -133,6 +513,174 @@ class TaskController:
         """
         return self.avl_tree.get_all_tasks()
 
+    def iter_tasks_by_id(self, start_after=None, limit=None):
+        """
+        Genera tareas ordenadas por ID para paginación por cursor, sin
+        construir la lista completa de tareas.
+
+        Args:
+            start_after (int): ID de la última tarea de la página anterior
+                (None = desde el principio)
+            limit (int): Número máximo de tareas (None = todas las restantes)
+
+        Returns:
+            iterator: Tareas con ID mayor que start_after, ordenadas por ID
+
+        Complejidad: O(log n + k) para k tareas generadas
+        """
+        tasks = self.avl_tree.iter_tasks(lo=start_after)
+        if start_after is not None:
+            tasks = (task for task in tasks if task.task_id != start_after)
+        return islice(tasks, limit)
+
+    def get_tasks_by_position(self, offset, limit):
+        """
+        Obtiene una página de tareas ordenadas por ID a partir de su posición,
+        sin construir la lista completa de tareas.
+
+        Args:
+            offset (int): Posición (desde 0) de la primera tarea de la página
+            limit (int): Número máximo de tareas de la página
+
+        Returns:
+            list: Tareas de la página ordenadas por ID
+
+        Complejidad: O(limit log n)
+        """
+        end = min(offset + limit, self.avl_tree.size())
+        return [self.avl_tree.select(k) for k in range(max(offset, 0), end)]
+
+    def get_task_position(self, task_id):
+        """
+        Obtiene la posición (desde 0) de una tarea en el orden por ID.
+
+        Args:
+            task_id (int): ID de la tarea
+
+        Returns:
+            int: Posición de la tarea o None si no existe
+
+        Complejidad: O(log n)
+        """
+        if task_id not in self.tasks_by_id:
+            return None
+        return self.avl_tree.rank(task_id)
+
+    def tasks_due_between(self, start, end):
+        """
+        Obtiene las tareas que vencen entre dos fechas (ambas inclusive).
+
+        Args:
+            start (str): Fecha inicial (YYYY-MM-DD)
+            end (str): Fecha final (YYYY-MM-DD)
+
+        Returns:
+            list: Tareas ordenadas por fecha de vencimiento y luego por ID
+
+        Complejidad: O(log n + k)
+        """
+        tasks_by_id = self.tasks_by_id
+        return [tasks_by_id[task_id] for task_id in self.due_index.ids_due_between(start, end)]
+
+    def overdue(self, today=None):
+        """
+        Obtiene las tareas vencidas.
+
+        Args:
+            today (str): Fecha de referencia (YYYY-MM-DD); por defecto, hoy
+
+        Returns:
+            list: Tareas con fecha de vencimiento anterior a today
+
+        Complejidad: O(log n + k)
+        """
+        if today is None:
+            today = date.today().isoformat()
+        tasks_by_id = self.tasks_by_id
+        return [tasks_by_id[task_id] for task_id in self.due_index.overdue_ids(today)]
+
+    def _store_filter(self, priority, due_from, due_to):
+        """
+        Traduce un filtro de prioridad y rango de fechas a los valores
+        numéricos de las columnas de task_store.
+
+        Raises:
+            ValueError: Si la prioridad o alguna fecha son inválidas
+        """
+        if priority is not None:
+            if priority.upper() not in PRIORITY_VALUES:
+                raise ValueError("Prioridad inválida. Use: BAJA, MEDIA o ALTA")
+            priority = PRIORITY_VALUES[priority.upper()]
+        if due_from is not None:
+            due_from = parse_due_date(due_from)
+        if due_to is not None:
+            due_to = parse_due_date(due_to)
+        return priority, due_from, due_to
+
+    def filter_tasks(self, priority=None, due_from=None, due_to=None):
+        """
+        Obtiene las tareas que cumplen todas las condiciones indicadas (las
+        que son None se ignoran), por ejemplo prioridad ALTA y vencimiento
+        hasta hoy. El filtro se evalúa en bloque sobre las columnas de
+        task_store, sin recorrer los objetos Task.
+
+        Args:
+            priority (str): Prioridad exacta ('BAJA', 'MEDIA', 'ALTA')
+            due_from (str): Vencimiento mínimo (YYYY-MM-DD, inclusive)
+            due_to (str): Vencimiento máximo (YYYY-MM-DD, inclusive)
+
+        Returns:
+            list: Tareas que cumplen el filtro, ordenadas por ID
+
+        Raises:
+            ValueError: Si la prioridad o alguna fecha son inválidas
+
+        Complejidad: O(n) en bloque + O(k log k) para ordenar el resultado
+        """
+        ids = self.task_store.select_ids(*self._store_filter(priority, due_from, due_to))
+        ids.sort()
+        return self.get_tasks_by_ids(ids)
+
+    def count_tasks(self, priority=None, due_from=None, due_to=None):
+        """
+        Cuenta las tareas que cumplen el filtro (ver filter_tasks).
+
+        Raises:
+            ValueError: Si la prioridad o alguna fecha son inválidas
+
+        Complejidad: O(n) en bloque
+        """
+        return self.task_store.count(*self._store_filter(priority, due_from, due_to))
+
+    def due_histogram(self, width=1):
+        """
+        Histograma de fechas de vencimiento en intervalos de width días.
+
+        Args:
+            width (int): Días por intervalo
+
+        Returns:
+            dict: Fecha de inicio del intervalo (YYYY-MM-DD) -> número de
+                tareas, en orden de fecha
+
+        Raises:
+            ValueError: Si width no es positivo
+
+        Complejidad: O(n) en bloque
+        """
+        return self.task_store.due_histogram(width)
+
+    def count_due_by_day(self):
+        """
+        Cuenta cuántas tareas vencen cada día.
+
+        Returns:
+            dict: Fecha (YYYY-MM-DD) -> número de tareas, en orden de fecha
+
+        Complejidad: O(d), con d el número de días distintos
+        """
+        return self.due_index.count_due_by_day()
+
     def get_task_count(self):
         """
         Retorna el número total de tareas en el sistema.
@@ -158,44 +706,71 @@ class TaskController:
     def get_statistics(self):
         """
         Obtiene estadísticas del sistema de tareas.
+        Los conteos por prioridad se mantienen de forma incremental en cada
+        alta, baja y actualización, por lo que no se recorren las tareas.
 
         Returns:
             dict: Diccionario con estadísticas
 
-        Complejidad: O(n)
+        Complejidad: O(1) (más la consulta del máximo en el heap)
         """
-        tasks = self.get_all_tasks_by_id()
+        total = self.get_task_count()
 
-        if not tasks:
-            return {
-                'total': 0,
-                'alta': 0,
-                'media': 0,
-                'baja': 0,
-                'highest_priority': None
-            }
-
-        # Contar por prioridad
-        priority_count = {'ALTA': 0, 'MEDIA': 0, 'BAJA': 0}
-        for task in tasks:
-            priority_count[task.priority_name] += 1
+        return {
+            'total': total,
+            'alta': self.priority_counts[PRIORITY_VALUES['ALTA']],
+            'media': self.priority_counts[PRIORITY_VALUES['MEDIA']],
+            'baja': self.priority_counts[PRIORITY_VALUES['BAJA']],
+            'highest_priority': self.get_highest_priority_task() if total else None
+        }
+
+    def recompute_statistics(self):
+        """
+        Recalcula desde cero los conteos de get_statistics recorriendo el
+        índice por ID, sin usar los contadores incrementales.
+
+        Returns:
+            dict: Conteos 'total', 'alta', 'media' y 'baja'
+
+        Complejidad: O(n)
+        """
+        counts = dict.fromkeys(PRIORITY_VALUES.values(), 0)
+        for task in self.avl_tree.iter_tasks():
+            counts[task.priority] += 1
 
         return {
-            'total': len(tasks),
-            'alta': priority_count['ALTA'],
-            'media': priority_count['MEDIA'],
-            'baja': priority_count['BAJA'],
-            'highest_priority': self.get_highest_priority_task()
+            'total': sum(counts.values()),
+            'alta': counts[PRIORITY_VALUES['ALTA']],
+            'media': counts[PRIORITY_VALUES['MEDIA']],
+            'baja': counts[PRIORITY_VALUES['BAJA']]
         }
 
+    def verify_statistics(self):
+        """
+        Comprueba que los contadores incrementales coincidan con un recuento
+        completo (ver recompute_statistics).
+
+        Returns:
+            bool: True si las estadísticas son consistentes
+
+        Complejidad: O(n)
+        """
+        stats = self.get_statistics()
+        del stats['highest_priority']
+        return stats == self.recompute_statistics()
+
     def clear_all_tasks(self):
         """
         Elimina todas las tareas del sistema.
 
         Complejidad: O(1)
         """
-        self.max_heap = MaxHeap()
-        self.avl_tree = AVLTree()
+        self.max_heap = self._create_heap()
+        self.avl_tree = self._create_tree()
+        self.due_index = DueDateIndex()
+        self.tasks_by_id = {}
+        self.task_store = TaskStore()
+        self.priority_counts = dict.fromkeys(PRIORITY_VALUES.values(), 0)
 
     def get_heap_visualization(self):
         """
@@ -206,18 +781,35 @@ class TaskController:
         """
         return self.max_heap.get_heap_representation()
 
-    def get_avl_traversals(self):
+    def get_avl_snapshot(self):
+        """
+        Obtiene una instantánea del Árbol AVL para lecturas consistentes:
+        los recorridos y estadísticas calculados sobre ella corresponden al
+        mismo instante aunque el sistema siga modificándose.
+
+        Returns:
+            AVLTree: Versión del árbol en este instante
+
+        Complejidad: O(1)
+        """
+        return self.avl_tree.snapshot()
+
+    def get_avl_traversals(self, snapshot=None):
         """
         Obtiene los tres recorridos del Árbol AVL.
 
+        Args:
+            snapshot (AVLTree): Instantánea a recorrer (por defecto, el árbol actual)
+
         Returns:
             dict: Diccionario con preorden, inorden y postorden
         """
+        tree = self.avl_tree if snapshot is None else snapshot
         return {
-            'preorden': self.avl_tree.get_preorder(),
-            'inorden': self.avl_tree.get_inorder(),
-            'postorden': self.avl_tree.get_postorder(),
-            'is_sorted': self.avl_tree.is_inorder_sorted()
+            'preorden': tree.get_preorder(),
+            'inorden': tree.get_inorder(),
+            'postorden': tree.get_postorder(),
+            'is_sorted': tree.is_inorder_sorted()
         }
 
     def get_avl_operations(self, count=10):
@@ -232,15 +824,20 @@ class TaskController:
         """
         return self.avl_tree.get_recent_operations(count)
 
-    def get_avl_stats(self):
+    def get_avl_stats(self, snapshot=None):
         """
         Obtiene estadísticas del árbol AVL.
+
+        Args:
+            snapshot (AVLTree): Instantánea a analizar (por defecto, el árbol actual)
+
         Returns:
             dict: Diccionario con altura, nodos y estado de balance
         """
-        height = self.avl_tree.root.height if self.avl_tree.root else 0
-        nodes = self.avl_tree.size()
-        balanced = self.avl_tree.is_balanced()    
+        tree = self.avl_tree if snapshot is None else snapshot
+        height = tree.height()
+        nodes = tree.size()
+        balanced = tree.is_balanced()
         return {
             'altura': height,
             'nodos': nodes,
@@ -1,22 +1,139 @@
+from bisect import bisect_left
+from itertools import count
+from weakref import WeakSet
+
+from src.models.id_index import (
+    IdIndex, OPERATION_FORMATS, OP_INSERT, OP_DELETE, OP_ROTATE_RIGHT, OP_ROTATE_LEFT,
+    OP_BULK_BUILD, OP_BATCH_DELETE, OP_SPLIT, OP_JOIN,
+)
+
+
 class AVLNode:
     """Nodo del árbol AVL"""
 
-    def __init__(self, task):
+    __slots__ = ('task', 'left', 'right', 'height', 'size', 'version')
+
+    def __init__(self, task, version=0):
         self.task = task
         self.left = None
         self.right = None
         self.height = 1
+        self.size = 1  # Número de nodos del subárbol (estadístico de orden)
+        self.version = version  # Versión del árbol dueño del nodo (copia en escritura)
 
 
-class AVLTree:
+class AVLTree(IdIndex):
     """
     Árbol AVL auto-balanceado para indexar tareas por ID único.
     Mantiene el balance del árbol en cada operación.
+
+    Cada nodo guarda además el tamaño de su subárbol, actualizado junto con
+    la altura en rotaciones y rebalanceos. Esto permite size() en O(1) y las
+    consultas de estadístico de orden rank() y select() en O(log n).
+
+    Inserciones: el rebalanceo se detiene en cuanto la altura de un ancestro
+    no cambia (o una rotación la restaura); por encima solo se incrementan los
+    tamaños. Con IDs crecientes, como los que genera TaskController, esto
+    evita recalcular balances en casi toda la espina derecha.
+
+    Registro de operaciones: un buffer circular de capacidad fija
+    (log_capacity) con eventos compactos (código, ID, marca de tiempo) que
+    solo se formatean como texto al leerlos. Con log_operations=False no se
+    registra nada.
+
+    Instantáneas persistentes: snapshot() retorna en O(1) una versión del
+    árbol que comparte todos sus nodos con este. A partir de la primera
+    instantánea el árbol trabaja con copia en escritura: cada nodo guarda la
+    versión del árbol dueño y las modificaciones copian solo los nodos
+    compartidos del camino afectado (O(log n)), de modo que las versiones
+    anteriores pueden recorrerse mientras el árbol sigue cambiando. Los
+    árboles que comparten nodos forman una familia con referencias débiles:
+    cuando las demás versiones se liberan, el árbol deja de copiar nodos.
+
+    Modo validado (validate=True): cada nodo que se rebalancea se comprueba
+    localmente (balance, orden respecto a sus hijos, altura y tamaño) y las
+    violaciones se acumulan en contadores. Como los subárboles que no se
+    modifican conservan sus invariantes, is_balanced() e is_inorder_sorted()
+    responden en O(1). verify() hace la comprobación completa en O(n).
     """
 
-    def __init__(self):
+    _versions = count(1)  # Generador de versiones únicas entre todos los árboles
+
+    def __init__(self, log_capacity=100, log_operations=True, validate=False):
+        super().__init__(log_capacity, log_operations)
         self.root = None
-        self.operations = []  # Historial de operaciones (inserciones, eliminaciones, rotaciones)
+        self._version = next(self._versions)  # Los nodos con esta versión son propios
+        # Árboles vivos que pueden compartir nodos con este (incluido él mismo)
+        self._family = WeakSet([self])
+        self.validate = validate
+        # Violaciones de invariantes detectadas en modo validado
+        self._balance_violations = 0
+        self._order_violations = 0
+
+    @classmethod
+    def from_sorted(cls, tasks, **options):
+        """
+        Construye un árbol perfectamente balanceado a partir de tareas
+        ordenadas por ID, tomando siempre el elemento central como raíz.
+        No requiere rotaciones.
+        Complejidad: O(n)
+
+        Args:
+            tasks (iterable): Tareas ordenadas de forma estrictamente creciente por ID
+            **options: Opciones del constructor (log_capacity, validate...)
+
+        Returns:
+            AVLTree: Árbol con todas las tareas
+
+        Raises:
+            ValueError: Si los IDs no son estrictamente crecientes
+        """
+        tasks = list(tasks)
+        for i in range(len(tasks) - 1):
+            if tasks[i].task_id >= tasks[i + 1].task_id:
+                raise ValueError("Las tareas deben estar ordenadas por ID y sin repetidos")
+
+        tree = cls(**options)
+        tree._log(OP_BULK_BUILD, len(tasks))
+        tree.root = tree._build_balanced(tasks)
+        return tree
+
+    def _build_balanced(self, tasks):
+        """
+        Construye iterativamente el subárbol balanceado de una lista ordenada.
+        La altura de un subárbol de m nodos construido por la mitad es
+        m.bit_length(), por lo que no hace falta un recorrido posterior.
+
+        Returns:
+            AVLNode: Raíz del árbol construido (None si la lista está vacía)
+        """
+        if not tasks:
+            return None
+
+        root = None
+        # Pila de rangos pendientes: (inicio, fin, padre, es_hijo_izquierdo)
+        stack = [(0, len(tasks) - 1, None, False)]
+        while stack:
+            low, high, parent, is_left = stack.pop()
+            mid = (low + high) // 2
+
+            node = AVLNode(tasks[mid], self._version)
+            node.size = high - low + 1
+            node.height = node.size.bit_length()
+
+            if parent is None:
+                root = node
+            elif is_left:
+                parent.left = node
+            else:
+                parent.right = node
+
+            if mid + 1 <= high:
+                stack.append((mid + 1, high, node, False))
+            if low <= mid - 1:
+                stack.append((low, mid - 1, node, True))
+
+        return root
 
     def _get_height(self, node):
         """Retorna la altura de un nodo"""
@@ -33,21 +150,116 @@ class AVLTree:
             return 0
         return self._get_height(node.left) - self._get_height(node.right)
 
+    def _get_size(self, node):
+        """Retorna el tamaño del subárbol de un nodo"""
+        if not node:
+            return 0
+        return node.size
+
     def _update_height(self, node):
-        """Actualiza la altura de un nodo"""
+        """Actualiza la altura y el tamaño del subárbol de un nodo"""
         if not node:
             return
         node.height = 1 + max(self._get_height(node.left), self._get_height(node.right))
+        node.size = 1 + self._get_size(node.left) + self._get_size(node.right)
+
+    def _own(self, node):
+        """
+        Retorna el nodo si pertenece a esta versión del árbol, o una copia
+        propia si está compartido con una instantánea. El llamador debe
+        enlazar la copia en lugar del nodo original.
+        Complejidad: O(1)
+        """
+        if node.version == self._version or not self._persistent:
+            return node
+
+        copy = AVLNode(node.task, self._version)
+        copy.left = node.left
+        copy.right = node.right
+        copy.height = node.height
+        copy.size = node.size
+        return copy
+
+    @property
+    def _persistent(self):
+        """True si alguna otra versión viva puede compartir nodos con este árbol"""
+        return len(self._family) > 1
+
+    def is_shared(self):
+        """
+        Indica si alguna instantánea viva comparte nodos (y tareas) con este
+        árbol.
+        Complejidad: O(1)
+        """
+        return self._persistent
+
+    def _share_nodes(self, other):
+        """
+        Registra que este árbol y other pueden compartir nodos, uniendo sus
+        familias.
+        Complejidad: O(tamaño de la familia de other)
+        """
+        family = self._family
+        if other._family is family:
+            return
+        for tree in list(other._family):
+            tree._family = family
+            family.add(tree)
+
+    def _own_path(self, path):
+        """
+        Copia los nodos compartidos de un camino desde la raíz (pares
+        (nodo, fue_a_la_izquierda)), reenlazando cada copia con su padre.
+        El llamador reenlaza la raíz del camino (path[0]).
+        Complejidad: O(longitud del camino)
+        """
+        if not self._persistent:
+            return
+
+        for i, (node, went_left) in enumerate(path):
+            owned = self._own(node)
+            if owned is node:
+                continue
+
+            path[i] = (owned, went_left)
+            if i > 0:
+                parent, parent_went_left = path[i - 1]
+                if parent_went_left:
+                    parent.left = owned
+                else:
+                    parent.right = owned
+
+    def snapshot(self):
+        """
+        Crea una instantánea del árbol: un árbol independiente que comparte
+        todos los nodos actuales. Los cambios posteriores en cualquiera de
+        los dos copian solo los nodos compartidos que modifican, así que la
+        instantánea conserva el estado del momento en que se tomó.
+        Complejidad: O(1)
+
+        Returns:
+            AVLTree: Versión del árbol en este instante
+        """
+        snapshot = self._empty_like()
+        snapshot.root = self.root
+        self._share_nodes(snapshot)
+        snapshot._balance_violations = self._balance_violations
+        snapshot._order_violations = self._order_violations
+
+        # Los nodos actuales pasan a ser compartidos: este árbol estrena versión
+        self._version = next(self._versions)
+        return snapshot
 
     def _rotate_right(self, z):
         """
         Rotación simple a la derecha
         """
-        y = z.left
+        z = self._own(z)
+        y = self._own(z.left)
         B = y.right
 
         # Registrar operación
-        self.operations.append(f"Rotacion Derecha en nodo ID:{z.task.task_id}")
+        self._log(OP_ROTATE_RIGHT, z.task.task_id)
 
         # Realizar rotación
         y.right = z
@@ -63,11 +275,12 @@ class AVLTree:
         """
         Rotación simple a la izquierda
         """
-        y = z.right
+        z = self._own(z)
+        y = self._own(z.right)
         B = y.left
 
         # Registrar operación
-        self.operations.append(f"Rotacion Izquierda en nodo ID:{z.task.task_id}")
+        self._log(OP_ROTATE_LEFT, z.task.task_id)
 
         # Realizar rotación
         y.left = z
@@ -81,8 +294,47 @@ class AVLTree:
 
     def _rebalance(self, node):
         """
-        Rebalancea el nodo si es necesario después de una inserción o eliminación.
-        Detecta y corrige los 4 casos de desbalance.
+        Rebalancea el nodo si es necesario después de una inserción o
+        eliminación y, en modo validado, comprueba el subárbol resultante.
+
+        Returns:
+            AVLNode: Nueva raíz del subárbol
+        """
+        subtree = self._restore_balance(node)
+        if self.validate:
+            # Sin rotación, el hijo del camino ya se comprobó un nivel más
+            # abajo y el otro no cambió; tras una rotación, sí cambiaron
+            self._check_node(subtree, subtree is not node)
+        return subtree
+
+    def _check_node(self, node, with_children=False):
+        """
+        Comprueba los invariantes locales de un nodo recién rebalanceado (y,
+        con with_children, los de sus hijos, que una rotación pudo modificar):
+        factor de balance, orden de los IDs respecto a los hijos, altura y
+        tamaño.
+        Complejidad: O(1)
+        """
+        nodes = (node, node.left, node.right) if with_children else (node,)
+        for current in nodes:
+            if not current:
+                continue
+
+            left, right = current.left, current.right
+            left_height = left.height if left else 0
+            right_height = right.height if right else 0
+            if (abs(left_height - right_height) > 1
+                    or current.height != 1 + max(left_height, right_height)
+                    or current.size != 1 + (left.size if left else 0) + (right.size if right else 0)):
+                self._balance_violations += 1
+
+            task_id = current.task.task_id
+            if (left and left.task.task_id >= task_id) or (right and right.task.task_id <= task_id):
+                self._order_violations += 1
+
+    def _restore_balance(self, node):
+        """
+        Detecta y corrige los 4 casos de desbalance de un nodo.
         """
         # Actualizar altura del nodo actual
         self._update_height(node)
@@ -110,88 +362,416 @@ class AVLTree:
 
         return node
 
+    def _rebalance_path(self, path):
+        """
+        Rebalancea de abajo hacia arriba los nodos recorridos en una inserción
+        o eliminación, reenlazando cada subárbol rotado con su padre.
+
+        Args:
+            path: Pila de pares (nodo, fue_a_la_izquierda) desde la raíz
+                del subárbol
+
+        Returns:
+            AVLNode: Nueva raíz del subárbol que comienza en path[0]
+        """
+        subtree = None
+        for i in range(len(path) - 1, -1, -1):
+            node = path[i][0]
+            subtree = self._rebalance(node)
+
+            # La rotación cambió la raíz del subárbol: actualizar al padre
+            if subtree is not node and i > 0:
+                parent, went_left = path[i - 1]
+                if went_left:
+                    parent.left = subtree
+                else:
+                    parent.right = subtree
+
+        return subtree
+
+    def _rebalance_insert_path(self, path):
+        """
+        Rebalancea de abajo hacia arriba el camino de una inserción.
+        Tras una inserción, en cuanto un nodo conserva su altura (o una
+        rotación la restaura) los ancestros no cambian de altura: a partir de
+        ahí solo se incrementa el tamaño de sus subárboles.
+
+        Args:
+            path: Pila de pares (nodo, fue_a_la_izquierda) desde la raíz
+
+        Returns:
+            AVLNode: Nueva raíz del árbol
+        """
+        for i in range(len(path) - 1, -1, -1):
+            node = path[i][0]
+            old_height = node.height
+            subtree = self._rebalance(node)
+
+            if subtree is not node and i > 0:
+                parent, went_left = path[i - 1]
+                if went_left:
+                    parent.left = subtree
+                else:
+                    parent.right = subtree
+
+            if subtree is not node or subtree.height == old_height:
+                for j in range(i - 1, -1, -1):
+                    path[j][0].size += 1
+                return path[0][0] if i > 0 else subtree
+
+        return subtree
+
     def insert(self, task):
         """
         Inserta una tarea en el árbol AVL por su ID.
         Complejidad: O(log n)
         """
-        self.operations.append(f"Insercion ID:{task.task_id}")
-        self.root = self._insert_recursive(self.root, task)
+        self._log(OP_INSERT, task.task_id)
 
-    def _insert_recursive(self, node, task):
-        """Inserción recursiva con rebalanceo"""
-        # Caso base: insertar en posición vacía
-        if not node:
-            return AVLNode(task)
+        if not self.root:
+            self.root = AVLNode(task, self._version)
+            return
 
-        # Insertar en el subárbol correspondiente
-        if task.task_id < node.task.task_id:
-            node.left = self._insert_recursive(node.left, task)
-        elif task.task_id > node.task.task_id:
-            node.right = self._insert_recursive(node.right, task)
+        # Descender guardando el camino en una pila de padres
+        path = []
+        node = self.root
+        while node:
+            if task.task_id < node.task.task_id:
+                path.append((node, True))
+                node = node.left
+            elif task.task_id > node.task.task_id:
+                path.append((node, False))
+                node = node.right
+            else:
+                # ID duplicado - actualizar la tarea existente
+                path.append((node, False))
+                self._own_path(path)
+                path[-1][0].task = task
+                self.root = path[0][0]
+                return
+
+        # Insertar en la posición vacía
+        self._own_path(path)
+        parent, went_left = path[-1]
+        if went_left:
+            parent.left = AVLNode(task, self._version)
         else:
-            # ID duplicado - actualizar la tarea existente
-            node.task = task
-            return node
+            parent.right = AVLNode(task, self._version)
 
         # Rebalancear el árbol
-        return self._rebalance(node)
+        self.root = self._rebalance_insert_path(path)
 
     def search(self, task_id):
         """
         Busca una tarea por su ID.
         Complejidad: O(log n)
         """
-        return self._search_recursive(self.root, task_id)
+        node = self.root
+        while node:
+            if task_id == node.task.task_id:
+                return node.task
 
-    def _search_recursive(self, node, task_id):
-        """Búsqueda recursiva"""
-        # Caso base: nodo vacío o encontrado
-        if not node or node.task.task_id == task_id:
-            return node.task if node else None
+            # Buscar en subárbol izquierdo o derecho
+            if task_id < node.task.task_id:
+                node = node.left
+            else:
+                node = node.right
 
-        # Buscar en subárbol izquierdo o derecho
-        if task_id < node.task.task_id:
-            return self._search_recursive(node.left, task_id)
-        else:
-            return self._search_recursive(node.right, task_id)
+        return None
 
     def delete(self, task_id):
         """
         Elimina una tarea del árbol por su ID.
         Complejidad: O(log n)
         """
-        self.operations.append(f"Eliminacion ID:{task_id}")
-        self.root = self._delete_recursive(self.root, task_id)
+        self._log(OP_DELETE, task_id)
+
+        # Buscar el nodo a eliminar guardando el camino
+        path = []
+        node = self.root
+        while node and node.task.task_id != task_id:
+            went_left = task_id < node.task.task_id
+            path.append((node, went_left))
+            node = node.left if went_left else node.right
 
-    def _delete_recursive(self, node, task_id):
-        """Eliminación recursiva con rebalanceo"""
-        # Caso base: nodo no encontrado
+        # Nodo no encontrado
         if not node:
-            return node
+            return
+
+        target = None
+        if node.left and node.right:
+            # Nodo con dos hijos: copiar el sucesor in-order (mínimo del
+            # subárbol derecho) y eliminar el nodo del sucesor en su lugar
+            target = len(path)
+            path.append((node, False))
+            successor = node.right
+            while successor.left:
+                path.append((successor, True))
+                successor = successor.left
+            node = successor
+
+        self._own_path(path)
+        if target is not None:
+            path[target][0].task = node.task
+
+        # Nodo sin hijos o con un solo hijo: reemplazarlo por su hijo
+        replacement = node.left if node.left else node.right
+
+        if not path:
+            self.root = replacement
+            return
 
-        # Buscar el nodo a eliminar
-        if task_id < node.task.task_id:
-            node.left = self._delete_recursive(node.left, task_id)
-        elif task_id > node.task.task_id:
-            node.right = self._delete_recursive(node.right, task_id)
+        parent, went_left = path[-1]
+        if went_left:
+            parent.left = replacement
         else:
-            # Nodo encontrado - proceder a eliminarlo
+            parent.right = replacement
 
-            # Caso 1: Nodo sin hijos o con un solo hijo
-            if not node.left:
-                return node.right
-            elif not node.right:
-                return node.left
+        # Rebalancear el árbol
+        self.root = self._rebalance_path(path)
 
-            # Caso 2: Nodo con dos hijos
-            # Encontrar el sucesor in-order (mínimo del subárbol derecho)
-            successor = self._find_min(node.right)
-            node.task = successor.task
-            node.right = self._delete_recursive(node.right, successor.task.task_id)
+    def delete_many(self, task_ids):
+        """
+        Elimina un lote de tareas por ID en un único recorrido del árbol.
+        Los IDs se ordenan y se reparten entre los subárboles, de modo que el
+        camino común desde la raíz se recorre una sola vez y cada nodo se
+        rebalancea una vez por lote en lugar de una vez por eliminación.
+        Complejidad: O(k log(n/k) + k) en el caso típico, O(k log n) como máximo
 
-        # Rebalancear el árbol
-        return self._rebalance(node)
+        Args:
+            task_ids (iterable): IDs a eliminar (los inexistentes se ignoran)
+        """
+        ids = sorted(set(task_ids))
+        if not ids or not self.root:
+            return
+
+        self._log(OP_BATCH_DELETE, len(ids))
+        self.root = self._delete_many(self.root, ids)
+
+    def _delete_many(self, root, ids):
+        """
+        Elimina del árbol los IDs ids (ordenados) con un recorrido en
+        postorden iterativo: cada nodo afectado reparte su rango de IDs entre
+        sus hijos y, cuando ambos están resueltos, se reconstruye uniendo sus
+        subárboles (ver _rebalance_subtree).
+
+        Returns:
+            AVLNode: Nueva raíz del árbol
+        """
+        results = []  # Subárboles ya procesados, en el orden en que se resuelven
+        # Pila de (nodo, inicio, fin, encontrado); encontrado es None si el
+        # nodo aún no repartió sus IDs entre los hijos
+        stack = [(root, 0, len(ids), None)]
+        while stack:
+            node, low, high, found = stack.pop()
+
+            if found is None:
+                if not node or low >= high:
+                    results.append(node)
+                    continue
+                node = self._own(node)
+
+                # Repartir los IDs entre el subárbol izquierdo y el derecho
+                task_id = node.task.task_id
+                mid = bisect_left(ids, task_id, low, high)
+                found = mid < high and ids[mid] == task_id
+
+                stack.append((node, low, high, found))
+                stack.append((node.right, mid + 1 if found else mid, high, None))
+                stack.append((node.left, low, mid, None))
+                continue
+
+            # Ambos hijos resueltos: el izquierdo se apiló primero
+            node.right = results.pop()
+            node.left = results.pop()
+
+            if found:
+                # Nodo sin hijos o con un solo hijo: reemplazarlo por su hijo
+                if not node.left:
+                    results.append(node.right)
+                    continue
+                if not node.right:
+                    results.append(node.left)
+                    continue
+
+                # Nodo con dos hijos: ocupar su lugar con el sucesor in-order
+                node.right, successor = self._pop_min(node.right)
+                node.task = successor.task
+
+            results.append(self._rebalance_subtree(node))
+
+        return results.pop()
+
+    def _pop_min(self, node):
+        """
+        Separa el nodo mínimo de un subárbol, rebalanceando su rama izquierda.
+
+        Returns:
+            tuple: (nueva raíz del subárbol, nodo mínimo separado)
+        """
+        path = []
+        while node.left:
+            path.append((node, True))
+            node = node.left
+
+        if not path:
+            return node.right, node
+
+        self._own_path(path)
+        path[-1][0].left = node.right
+        return self._rebalance_path(path), node
+
+    def _rebalance_subtree(self, node):
+        """
+        Rebalancea un nodo cuyos subárboles son AVL válidos pero pueden
+        diferir en altura en más de 2 (tras eliminar varios nodos de un lado),
+        uniéndolos con el propio nodo como nodo intermedio (_join_with).
+        Complejidad: O(diferencia de alturas + 1)
+
+        Returns:
+            AVLNode: Nueva raíz del subárbol
+        """
+        return self._join_with(node.left, node, node.right)
+
+    def _empty_like(self):
+        """Crea un árbol vacío con la misma configuración que este"""
+        return type(self)(log_capacity=self.operations.maxlen,
+                          log_operations=self.log_operations,
+                          validate=self.validate)
+
+    def split(self, key):
+        """
+        Divide el árbol en dos: las tareas con ID menor que key y las tareas
+        con ID mayor o igual que key. Este árbol queda vacío y su registro de
+        operaciones pasa al árbol derecho (el que conserva el controlador al
+        archivar).
+        Complejidad: O(log n)
+
+        Args:
+            key (int): ID de corte
+
+        Returns:
+            tuple: (AVLTree con IDs < key, AVLTree con IDs >= key)
+        """
+        self._log(OP_SPLIT, key)
+
+        # Descender hacia key guardando el camino
+        path = []
+        node = self.root
+        while node:
+            path.append(node)
+            node = node.left if key <= node.task.task_id else node.right
+
+        # Recomponer de abajo hacia arriba: cada nodo del camino se une, junto
+        # con su subárbol fuera del camino, a la mitad que le corresponde
+        left = right = None
+        for node in reversed(path):
+            if key <= node.task.task_id:
+                right = self._join_with(right, node, node.right)
+            else:
+                left = self._join_with(node.left, node, left)
+
+        left_tree = self._empty_like()
+        right_tree = self._empty_like()
+        left_tree.root = left
+        right_tree.root = right
+        shared = self._persistent
+        for tree in (left_tree, right_tree):
+            if shared:
+                self._share_nodes(tree)
+            tree._balance_violations = self._balance_violations
+            tree._order_violations = self._order_violations
+        right_tree._take_operations(self)
+
+        self.root = None
+        return left_tree, right_tree
+
+    @classmethod
+    def join(cls, left, right):
+        """
+        Une dos árboles en uno nuevo, suponiendo que todos los IDs de left
+        son menores que todos los de right. Ambos árboles quedan vacíos y sus
+        registros de operaciones se combinan en el del árbol nuevo.
+        Complejidad: O(log n)
+
+        Args:
+            left (AVLTree): Árbol con los IDs menores
+            right (AVLTree): Árbol con los IDs mayores
+
+        Returns:
+            AVLTree: Árbol con todas las tareas
+
+        Raises:
+            ValueError: Si los rangos de IDs se solapan
+        """
+        if left.root and right.root:
+            if left._find_max(left.root).task.task_id >= right._find_min(right.root).task.task_id:
+                raise ValueError("Todos los IDs del árbol izquierdo deben ser menores que los del derecho")
+
+        tree = left._empty_like()
+        for other in (left, right):
+            if other._persistent:
+                tree._share_nodes(other)
+        tree._balance_violations = left._balance_violations + right._balance_violations
+        tree._order_violations = left._order_violations + right._order_violations
+        tree._take_operations(left, right)
+        tree._log(OP_JOIN, left.size() + right.size())
+
+        if not right.root:
+            tree.root = left.root
+        else:
+            # El mínimo del árbol derecho sirve de nodo de unión
+            rest, middle = tree._pop_min(right.root)
+            tree.root = tree._join_with(left.root, middle, rest)
+
+        left.root = right.root = None
+        return tree
+
+    def _join_with(self, left, middle, right):
+        """
+        Une dos subárboles AVL usando middle como nodo intermedio (todos los
+        IDs de left < middle < todos los de right).
+        Desciende por la espina del subárbol más alto hasta encontrar uno de
+        altura similar al otro, engancha ahí el nodo intermedio y rebalancea
+        el camino hacia arriba.
+        Complejidad: O(|altura(left) - altura(right)| + 1)
+
+        Returns:
+            AVLNode: Raíz del subárbol unido
+        """
+        middle = self._own(middle)
+        left_height = self._get_height(left)
+        right_height = self._get_height(right)
+
+        if abs(left_height - right_height) <= 1:
+            middle.left, middle.right = left, right
+            self._update_height(middle)
+            if self.validate:
+                self._check_node(middle)
+            return middle
+
+        path = []
+        if left_height > right_height:
+            # Bajar por la espina derecha del subárbol izquierdo
+            node = left
+            while self._get_height(node) > right_height + 1:
+                path.append((node, False))
+                node = node.right
+            middle.left, middle.right = node, right
+            self._own_path(path)
+            path[-1][0].right = middle
+        else:
+            # Bajar por la espina izquierda del subárbol derecho
+            node = right
+            while self._get_height(node) > left_height + 1:
+                path.append((node, True))
+                node = node.left
+            middle.left, middle.right = left, node
+            self._own_path(path)
+            path[-1][0].left = middle
+
+        self._update_height(middle)
+        return self._rebalance_path(path)
 
     def _find_min(self, node):
         """Encuentra el nodo con el valor mínimo (más a la izquierda)"""
@@ -200,35 +780,128 @@ class AVLTree:
             current = current.left
         return current
 
-    def get_all_tasks(self):
+    def _find_max(self, node):
+        """Encuentra el nodo con el valor máximo (más a la derecha)"""
+        current = node
+        while current.right:
+            current = current.right
+        return current
+
+    def iter_tasks(self, lo=None, hi=None):
         """
-        Retorna todas las tareas en orden (in-order traversal).
-        Las tareas estarán ordenadas por ID.
+        Genera perezosamente las tareas ordenadas por ID, opcionalmente
+        limitadas al rango [lo, hi] (ambos inclusive).
+        Complejidad: O(log n + k) para k tareas generadas
+
+        Args:
+            lo (int): ID mínimo (None = sin límite inferior)
+            hi (int): ID máximo (None = sin límite superior)
+
+        Yields:
+            Task: Tareas del rango en orden de ID
         """
-        tasks = []
-        self._inorder_traversal(self.root, tasks)
-        return tasks
+        for node in self._inorder_nodes(self.root, lo, hi):
+            yield node.task
 
-    def _inorder_traversal(self, node, tasks):
-        """Recorrido in-order recursivo"""
-        if node:
-            self._inorder_traversal(node.left, tasks)
-            tasks.append(node.task)
-            self._inorder_traversal(node.right, tasks)
+    def _inorder_nodes(self, node, lo=None, hi=None):
+        """
+        Genera los nodos en in-order usando una pila explícita, descartando
+        los subárboles que quedan fuera del rango [lo, hi].
+        """
+        stack = []
+        while stack or node:
+            if node:
+                if lo is not None and node.task.task_id < lo:
+                    # El nodo y su subárbol izquierdo quedan por debajo de lo
+                    node = node.right
+                    continue
+                stack.append(node)
+                node = node.left
+            else:
+                node = stack.pop()
+                if hi is not None and node.task.task_id > hi:
+                    return
+                yield node
+                node = node.right
 
     def is_empty(self):
         """Verifica si el árbol está vacío"""
         return self.root is None
 
     def size(self):
-        """Retorna el número de nodos en el árbol"""
-        return self._count_nodes(self.root)
+        """
+        Retorna el número de nodos en el árbol.
+        Complejidad: O(1)
+        """
+        return self._get_size(self.root)
+
+    def height(self):
+        """
+        Retorna la altura del árbol (0 si está vacío).
+        Complejidad: O(1)
+        """
+        return self._get_height(self.root)
+
+    def rank(self, task_id):
+        """
+        Retorna la posición (desde 0) que ocupa o ocuparía el ID en el
+        recorrido in-order, es decir, el número de tareas con ID menor.
+        Complejidad: O(log n)
+
+        Args:
+            task_id (int): ID a consultar (no necesita existir)
+
+        Returns:
+            int: Número de tareas con ID menor que task_id
+        """
+        rank = 0
+        node = self.root
+        while node:
+            if task_id <= node.task.task_id:
+                node = node.left
+            else:
+                rank += self._get_size(node.left) + 1
+                node = node.right
+        return rank
+
+    def select(self, k):
+        """
+        Retorna la tarea en la posición k (desde 0) del orden por ID.
+        Complejidad: O(log n)
+
+        Args:
+            k (int): Posición a consultar
+
+        Returns:
+            Task: La tarea en la posición k, o None si k está fuera de rango
+        """
+        if not 0 <= k < self.size():
+            return None
+
+        node = self.root
+        while node:
+            left_size = self._get_size(node.left)
+            if k < left_size:
+                node = node.left
+            elif k == left_size:
+                return node.task
+            else:
+                k -= left_size + 1
+                node = node.right
+        return None
 
     def _count_nodes(self, node):
-        """Cuenta recursivamente los nodos del árbol"""
-        if not node:
-            return 0
-        return 1 + self._count_nodes(node.left) + self._count_nodes(node.right)
+        """Cuenta iterativamente los nodos del árbol"""
+        count = 0
+        stack = [node] if node else []
+        while stack:
+            current = stack.pop()
+            count += 1
+            if current.left:
+                stack.append(current.left)
+            if current.right:
+                stack.append(current.right)
+        return count
 
     def get_tree_structure(self):
         """
@@ -247,7 +920,7 @@ class AVLTree:
 
     def _build_tree_string(self, node, prefix, is_tail, lines):
         """
-        Construye recursivamente la representación del árbol.
+        Construye iterativamente (en preorden) la representación del árbol.
 
         Args:
             node: Nodo actual
@@ -255,7 +928,9 @@ class AVLTree:
             is_tail: Si es el último hijo
             lines: Lista de líneas de salida
         """
-        if node:
+        stack = [(node, prefix, is_tail)] if node else []
+        while stack:
+            node, prefix, is_tail = stack.pop()
             lines.append(prefix + ("└── " if is_tail else "├── ") +
                         f"ID:{node.task.task_id} ({node.task.priority_name[0]}, h={node.height})")
 
@@ -265,10 +940,11 @@ class AVLTree:
             if node.right:
                 children.append(node.right)
 
-            for i, child in enumerate(children):
-                extension = "    " if is_tail else "│   "
+            # Apilar en orden inverso para visitar primero el hijo izquierdo
+            extension = "    " if is_tail else "│   "
+            for i in range(len(children) - 1, -1, -1):
                 is_last = (i == len(children) - 1)
-                self._build_tree_string(child, prefix + extension, is_last, lines)
+                stack.append((children[i], prefix + extension, is_last))
 
     def get_tree_stats(self):
         """
@@ -289,85 +965,138 @@ class AVLTree:
         return {
             'height': self.root.height,
             'nodes': self.size(),
-            'balanced': self._is_balanced(self.root),
+            'balanced': self.is_balanced(),
             'balance_factor': self._get_balance(self.root)
         }
 
     def _is_balanced(self, node):
         """
-        Verifica recursivamente si el árbol está balanceado.
+        Verifica iterativamente si el árbol está balanceado.
 
         Returns:
             bool: True si el árbol está balanceado
         """
-        if not node:
-            return True
-
-        balance = self._get_balance(node)
-        if abs(balance) > 1:
-            return False
-
-        return self._is_balanced(node.left) and self._is_balanced(node.right)
+        stack = [node] if node else []
+        while stack:
+            current = stack.pop()
+            if abs(self._get_balance(current)) > 1:
+                return False
+            if current.left:
+                stack.append(current.left)
+            if current.right:
+                stack.append(current.right)
+        return True
 
     def is_balanced(self):
-        """Verifica que el árbol esté balanceado (AVL válido)"""
+        """
+        Verifica que el árbol esté balanceado (AVL válido).
+        Complejidad: O(1) en modo validado, O(n) en otro caso
+        """
+        if self.validate:
+            return self._balance_violations == 0
         return self._is_balanced(self.root)
-    
-    def get_preorder(self):
-        """Retorna recorrido en preorden (raíz-izq-der)"""
-        result = []
-        self._preorder_ids(self.root, result)
-        return result
-
-    def _preorder_ids(self, node, result):
-        """Helper para preorden"""
-        if node:
-            result.append(node.task.task_id)
-            self._preorder_ids(node.left, result)
-            self._preorder_ids(node.right, result)
-
-    def get_inorder(self):
-        """Retorna recorrido en inorden (izq-raíz-der)"""
-        result = []
-        self._inorder_ids(self.root, result)
-        return result
 
-    def _inorder_ids(self, node, result):
-        """Helper para inorden"""
-        if node:
-            self._inorder_ids(node.left, result)
-            result.append(node.task.task_id)
-            self._inorder_ids(node.right, result)
-
-    def get_postorder(self):
-        """Retorna recorrido en postorden (izq-der-raíz)"""
-        result = []
-        self._postorder_ids(self.root, result)
-        return result
+    def iter_preorder(self, lo=None, hi=None):
+        """
+        Genera los IDs en preorden (raíz-izq-der) con una pila explícita,
+        opcionalmente limitados al rango [lo, hi].
+        Complejidad: O(log n + k) para k IDs generados
+        """
+        stack = [self.root] if self.root else []
+        while stack:
+            node = stack.pop()
+            task_id = node.task.task_id
+            if (lo is None or task_id >= lo) and (hi is None or task_id <= hi):
+                yield task_id
+
+            # Apilar primero el derecho para visitar antes el izquierdo,
+            # descartando los subárboles fuera del rango
+            if node.right and (hi is None or task_id < hi):
+                stack.append(node.right)
+            if node.left and (lo is None or task_id > lo):
+                stack.append(node.left)
+
+    def iter_inorder(self, lo=None, hi=None):
+        """
+        Genera los IDs en inorden (izq-raíz-der) con una pila explícita,
+        opcionalmente limitados al rango [lo, hi].
+        Complejidad: O(log n + k) para k IDs generados
+        """
+        for node in self._inorder_nodes(self.root, lo, hi):
+            yield node.task.task_id
 
-    def _postorder_ids(self, node, result):
-        """Helper para postorden"""
-        if node:
-            self._postorder_ids(node.left, result)
-            self._postorder_ids(node.right, result)
-            result.append(node.task.task_id)
+    def iter_postorder(self, lo=None, hi=None):
+        """
+        Genera los IDs en postorden (izq-der-raíz) con una pila explícita,
+        opcionalmente limitados al rango [lo, hi]. Un nodo se emite cuando
+        su subárbol derecho ya fue visitado.
+        Complejidad: O(log n + k) para k IDs generados
+        """
+        stack = []
+        node = self.root
+        last_visited = None
+        while stack or node:
+            if node:
+                stack.append(node)
+                node = node.left if lo is None or node.task.task_id > lo else None
+                continue
+
+            top = stack[-1]
+            task_id = top.task.task_id
+            right = top.right if hi is None or task_id < hi else None
+            if right and last_visited is not right:
+                node = right
+            else:
+                if (lo is None or task_id >= lo) and (hi is None or task_id <= hi):
+                    yield task_id
+                last_visited = stack.pop()
 
     def is_inorder_sorted(self):
-        """Verifica que el recorrido inorden esté ordenado (prueba de BST válido)"""
+        """
+        Verifica que el recorrido inorden esté ordenado (prueba de BST válido).
+        Complejidad: O(1) en modo validado, O(n) en otro caso
+        """
+        if self.validate:
+            return self._order_violations == 0
+
         inorder = self.get_inorder()
-        
         for i in range(len(inorder) - 1):
             if inorder[i] >= inorder[i + 1]:
                 return False
         return True
-    
-    def get_recent_operations(self, count=10):
+
+    def verify(self):
         """
-        Retorna las últimas N operaciones
-        Args:
-            count (int): Número de operaciones a retornar
+        Comprueba de forma completa todos los invariantes del árbol (para
+        depuración): orden de los IDs, factor de balance, alturas y tamaños
+        de cada nodo. En modo validado, reinicia además los contadores de
+        violaciones con el resultado.
+        Complejidad: O(n)
 
         Returns:
-            list: Últimas operaciones
+            dict: 'sorted', 'balanced', 'heights' y 'sizes' (True si se cumplen)
         """
-        return self.operations[-count:] if self.operations else []
+        result = {'sorted': True, 'balanced': True, 'heights': True, 'sizes': True}
+
+        # Recorrido inorden con pila: los IDs deben ser estrictamente crecientes
+        previous = None
+        for node in self._inorder_nodes(self.root):
+            task_id = node.task.task_id
+            if previous is not None and previous >= task_id:
+                result['sorted'] = False
+            previous = task_id
+
+            left, right = node.left, node.right
+            if abs(self._get_balance(node)) > 1:
+                result['balanced'] = False
+            if node.height != 1 + max(self._get_height(left), self._get_height(right)):
+                result['heights'] = False
+            if node.size != 1 + self._get_size(left) + self._get_size(right):
+                result['sizes'] = False
+
+        if self.validate:
+            self._order_violations = 0 if result['sorted'] else 1
+            valid = result['balanced'] and result['heights'] and result['sizes']
+            self._balance_violations = 0 if valid else 1
+
+        return result
@@ -0,0 +1,240 @@
+from src.models.max_heap import MaxHeap
+from src.models.task import Priority
+
+
+class BucketQueue:
+    """
+    Cola de prioridad por cubetas, alternativa a MaxHeap con la misma API.
+    Aprovecha que solo existen tres niveles de prioridad (BAJA, MEDIA, ALTA):
+    mantiene una cubeta por prioridad, ordenada internamente por fecha de
+    vencimiento (y por ID a igualdad de fecha), y encuentra la tarea más
+    prioritaria revisando como máximo tres cubetas.
+
+    Cada cubeta es un MaxHeap indexado y con claves, por lo que la inserción,
+    extracción y eliminación por ID cuestan O(log m), con m el tamaño de la
+    cubeta afectada. Con lazy=True las cubetas usan el modo perezoso de
+    MaxHeap (eliminación por tombstones); arity fija la aridad de cada cubeta.
+    """
+
+    def __init__(self, lazy=False, arity=2):
+        # Cubetas de mayor a menor prioridad
+        self.priorities = sorted((p.value for p in Priority), reverse=True)
+        self.heap_options = {'indexed': True, 'keyed': True, 'lazy': lazy, 'arity': arity}
+        self.buckets = {priority: MaxHeap(**self.heap_options) for priority in self.priorities}
+        self.bucket_of = {}  # task_id -> prioridad de la cubeta que contiene la tarea
+
+    @classmethod
+    def from_tasks(cls, tasks, lazy=False, arity=2):
+        """
+        Construye la cola repartiendo las tareas en cubetas y aplicando
+        heapify de abajo hacia arriba en cada una.
+        Complejidad: O(n)
+
+        Args:
+            tasks (iterable): Tareas a cargar
+            lazy (bool): Usar el modo perezoso en las cubetas
+            arity (int): Aridad del heap de cada cubeta
+
+        Returns:
+            BucketQueue: Cola con todas las tareas
+
+        Raises:
+            ValueError: Si hay IDs repetidos o fuera de rango
+        """
+        queue = cls(lazy=lazy, arity=arity)
+        grouped = {priority: [] for priority in queue.priorities}
+        for task in tasks:
+            if task.task_id in queue.bucket_of:
+                raise ValueError("Hay tareas con IDs repetidos")
+            grouped[task.priority].append(task)
+            queue.bucket_of[task.task_id] = task.priority
+
+        for priority, bucket_tasks in grouped.items():
+            queue.buckets[priority] = MaxHeap.from_tasks(bucket_tasks, **queue.heap_options)
+
+        return queue
+
+    def _top_bucket(self):
+        """Retorna la cubeta no vacía de mayor prioridad, o None"""
+        for priority in self.priorities:
+            bucket = self.buckets[priority]
+            if not bucket.is_empty():
+                return bucket
+        return None
+
+    def insert(self, task):
+        """
+        Inserta una nueva tarea en la cubeta de su prioridad.
+        Complejidad: O(log m)
+        """
+        if task.task_id in self.bucket_of:
+            raise ValueError(f"La tarea con ID {task.task_id} ya está en la cola")
+
+        self.buckets[task.priority].insert(task)
+        self.bucket_of[task.task_id] = task.priority
+
+    def extract_max(self):
+        """
+        Extrae y retorna la tarea con mayor prioridad.
+        Complejidad: O(log m)
+        """
+        bucket = self._top_bucket()
+        if bucket is None:
+            return None
+
+        task = bucket.extract_max()
+        del self.bucket_of[task.task_id]
+        return task
+
+    def extract_top(self, k):
+        """
+        Extrae las k tareas con mayor prioridad, en orden de prioridad.
+        Complejidad: O(k log m)
+        """
+        tasks = []
+        for priority in self.priorities:
+            if len(tasks) >= k:
+                break
+            tasks.extend(self.buckets[priority].extract_top(k - len(tasks)))
+
+        for task in tasks:
+            del self.bucket_of[task.task_id]
+        return tasks
+
+    def peek(self):
+        """
+        Retorna la tarea con mayor prioridad sin extraerla.
+        Complejidad: O(1)
+        """
+        bucket = self._top_bucket()
+        return bucket.peek() if bucket else None
+
+    def remove(self, task_id):
+        """
+        Elimina una tarea específica por su ID.
+        Complejidad: O(log m)
+        """
+        priority = self.bucket_of.pop(task_id, None)
+        if priority is None:
+            return False
+
+        return self.buckets[priority].remove(task_id)
+
+    def update_key(self, task_id):
+        """
+        Reubica una tarea cuya prioridad o fecha de vencimiento cambió.
+        Si cambió la prioridad, la mueve a la cubeta correspondiente.
+        Complejidad: O(log m)
+
+        Raises:
+            ValueError: Si el ID está fuera de rango (la cola no se modifica)
+        """
+        priority = self.bucket_of.get(task_id)
+        if priority is None:
+            return False
+
+        bucket = self.buckets[priority]
+        task = bucket.get(task_id)
+        if task.priority == priority:
+            return bucket.update_key(task_id)
+
+        # Insertar primero en la nueva cubeta: si la inserción falla, la
+        # tarea sigue en la cubeta anterior
+        self.buckets[task.priority].insert(task)
+        bucket.remove(task_id)
+        self.bucket_of[task_id] = task.priority
+        return True
+
+    def replace(self, task):
+        """
+        Sustituye la tarea con el mismo ID por task (otra versión de la misma
+        tarea) y la reubica, cambiándola de cubeta si cambió la prioridad.
+        Complejidad: O(log m)
+
+        Returns:
+            bool: True si había una tarea con ese ID, False en caso contrario
+
+        Raises:
+            ValueError: Si el ID está fuera de rango (la cola no se modifica)
+        """
+        priority = self.bucket_of.get(task.task_id)
+        if priority is None:
+            return False
+
+        if task.priority == priority:
+            return self.buckets[priority].replace(task)
+
+        # Insertar primero en la nueva cubeta: si la inserción falla, la
+        # versión anterior sigue en su cubeta
+        self.buckets[task.priority].insert(task)
+        self.buckets[priority].remove(task.task_id)
+        self.bucket_of[task.task_id] = task.priority
+        return True
+
+    def contains(self, task_id):
+        """
+        Verifica si una tarea con el ID dado está en la cola.
+        Complejidad: O(1)
+        """
+        return task_id in self.bucket_of
+
+    def get(self, task_id):
+        """
+        Retorna la tarea con el ID dado sin extraerla, o None si no está.
+        Complejidad: O(1)
+        """
+        priority = self.bucket_of.get(task_id)
+        return self.buckets[priority].get(task_id) if priority is not None else None
+
+    def is_empty(self):
+        """Verifica si la cola está vacía"""
+        return not self.bucket_of
+
+    def size(self):
+        """Retorna el número de elementos en la cola"""
+        return len(self.bucket_of)
+
+    def get_all_tasks(self):
+        """Retorna todas las tareas, agrupadas por cubeta de mayor a menor prioridad"""
+        tasks = []
+        for priority in self.priorities:
+            tasks.extend(self.buckets[priority].get_all_tasks())
+        return tasks
+
+    def iter_sorted(self):
+        """
+        Genera las tareas en orden de prioridad sin modificar la cola,
+        recorriendo cada cubeta de mayor a menor prioridad.
+        Las primeras k tareas cuestan O(k log k).
+
+        Yields:
+            Task: Tareas de mayor a menor prioridad
+        """
+        for priority in self.priorities:
+            yield from self.buckets[priority].iter_sorted()
+
+    def get_heap_representation(self):
+        """
+        Retorna una representación visual de las cubetas.
+
+        Returns:
+            str: Representación de cada cubeta como arreglo
+        """
+        if self.is_empty():
+            return "Cubetas vacías: []"
+
+        parts = []
+        for priority in self.priorities:
+            name = Priority(priority).name
+            parts.append(f"{name}: {self.buckets[priority].get_heap_representation()}")
+        return "\n".join(parts)
+
+    def get_heap_levels(self):
+        """
+        Retorna las tareas organizadas por cubeta para visualización.
+
+        Returns:
+            list: Una lista de tareas por cubeta no vacía, de mayor a menor prioridad
+        """
+        return [self.buckets[p].get_all_tasks() for p in self.priorities
+                if not self.buckets[p].is_empty()]
@@ -0,0 +1,191 @@
+from bisect import bisect_left, insort
+from heapq import merge
+from datetime import date
+
+from src.models.task import parse_due_date
+
+
+class DueDateIndex:
+    """
+    Índice secundario ordenado por (fecha de vencimiento, ID).
+    Permite consultar las tareas vencidas o que vencen en un rango de fechas
+    sin recorrer todas las tareas.
+
+    Las tareas se agrupan por día: un diccionario ordinal de la fecha -> IDs
+    ordenados de ese día, y un arreglo ordenado con los días distintos. Las
+    altas y bajas solo desplazan la lista de un día (y la de días, cuando un
+    día aparece o se vacía), no un arreglo con todas las tareas; las
+    consultas por rango buscan los días extremos con búsqueda binaria y
+    recorren solo las k tareas del resultado.
+
+    El índice guarda solo IDs: las consultas retornan IDs y el dueño del
+    índice (TaskController) los resuelve con su propio mapa de tareas.
+    """
+
+    def __init__(self):
+        self.days = []  # Ordinales de las fechas con tareas, ordenados
+        self.ids_by_day = {}  # ordinal de la fecha -> IDs ordenados de ese día
+        self.day_of = {}  # task_id -> ordinal con el que se indexó la tarea
+
+    @classmethod
+    def from_tasks(cls, tasks):
+        """
+        Construye el índice a partir de una colección de tareas, usando el
+        ordinal de fecha que cada tarea ya tiene calculado.
+        Complejidad: O(n log n)
+        """
+        index = cls()
+        for task in tasks:
+            day = task.due_ordinal
+            index.day_of[task.task_id] = day
+            index.ids_by_day.setdefault(day, []).append(task.task_id)
+        for ids in index.ids_by_day.values():
+            ids.sort()
+        index.days = sorted(index.ids_by_day)
+        return index
+
+    @classmethod
+    def merge(cls, *indexes):
+        """
+        Combina varios índices con IDs disjuntos en uno nuevo, intercalando
+        las listas ya ordenadas de cada día en lugar de reordenarlas.
+        Complejidad: O(n log k) para k índices, más O(d log d) para los días
+        """
+        index = cls()
+        lists_by_day = {}
+        for other in indexes:
+            index.day_of.update(other.day_of)
+            for day, ids in other.ids_by_day.items():
+                lists_by_day.setdefault(day, []).append(ids)
+        index.ids_by_day = {day: list(merge(*lists)) if len(lists) > 1 else list(lists[0])
+                            for day, lists in lists_by_day.items()}
+        index.days = sorted(index.ids_by_day)
+        return index
+
+    @staticmethod
+    def _ordinal(due_date):
+        """Convierte una fecha YYYY-MM-DD en su ordinal (lanza ValueError si es inválida)"""
+        return parse_due_date(due_date)
+
+    def add(self, task):
+        """
+        Agrega una tarea al índice.
+        Complejidad: O(log n) de búsqueda (más el desplazamiento de la lista
+        del día y, si el día es nuevo, del arreglo de días)
+        """
+        day = task.due_ordinal
+        ids = self.ids_by_day.get(day)
+        if ids is None:
+            self.ids_by_day[day] = [task.task_id]
+            insort(self.days, day)
+        elif task.task_id > ids[-1]:
+            ids.append(task.task_id)  # Caso habitual: IDs crecientes
+        else:
+            insort(ids, task.task_id)
+        self.day_of[task.task_id] = day
+
+    def remove(self, task_id):
+        """
+        Elimina una tarea del índice por su ID.
+        Complejidad: O(log n) de búsqueda (más el desplazamiento de la lista
+        del día y, si el día queda vacío, del arreglo de días)
+
+        Returns:
+            bool: True si la tarea estaba indexada
+        """
+        day = self.day_of.pop(task_id, None)
+        if day is None:
+            return False
+
+        ids = self.ids_by_day[day]
+        del ids[bisect_left(ids, task_id)]
+        if not ids:
+            del self.ids_by_day[day]
+            del self.days[bisect_left(self.days, day)]
+        return True
+
+    def remove_many(self, task_ids):
+        """
+        Elimina un lote de tareas del índice filtrando una sola vez la lista
+        de cada día afectado, en lugar de desplazarla una vez por tarea.
+        Complejidad: O(k + tamaño de los días afectados + d)
+
+        Args:
+            task_ids (iterable): IDs a eliminar (los inexistentes se ignoran)
+        """
+        removed_by_day = {}
+        for task_id in task_ids:
+            day = self.day_of.pop(task_id, None)
+            if day is None:
+                continue
+            removed_by_day.setdefault(day, set()).add(task_id)
+
+        emptied = False
+        for day, removed in removed_by_day.items():
+            ids = [task_id for task_id in self.ids_by_day[day] if task_id not in removed]
+            if ids:
+                self.ids_by_day[day] = ids
+            else:
+                del self.ids_by_day[day]
+                emptied = True
+
+        if emptied:
+            self.days = [day for day in self.days if day in self.ids_by_day]
+
+    def update(self, task):
+        """
+        Reindexa una tarea cuya fecha de vencimiento cambió.
+        Complejidad: la de remove + add
+        """
+        if self.remove(task.task_id):
+            self.add(task)
+
+    def size(self):
+        """Retorna el número de tareas indexadas"""
+        return len(self.day_of)
+
+    def _ids_in_days(self, low, high):
+        """IDs de los días en las posiciones [low, high) del arreglo de días"""
+        ids_by_day = self.ids_by_day
+        return [task_id for day in self.days[low:high] for task_id in ids_by_day[day]]
+
+    def ids_due_between(self, start, end):
+        """
+        Retorna los IDs de las tareas que vencen entre dos fechas (ambas
+        inclusive), ordenados por fecha y luego por ID.
+        Complejidad: O(log n + k)
+
+        Args:
+            start (str): Fecha inicial (YYYY-MM-DD)
+            end (str): Fecha final (YYYY-MM-DD)
+
+        Returns:
+            list: IDs del rango
+        """
+        low = bisect_left(self.days, self._ordinal(start))
+        high = bisect_left(self.days, self._ordinal(end) + 1)
+        return self._ids_in_days(low, high)
+
+    def overdue_ids(self, today):
+        """
+        Retorna los IDs de las tareas vencidas (fecha anterior a today), de
+        la más antigua a la más reciente.
+        Complejidad: O(log n + k)
+
+        Args:
+            today (str): Fecha de referencia (YYYY-MM-DD)
+
+        Returns:
+            list: IDs de las tareas vencidas
+        """
+        return self._ids_in_days(0, bisect_left(self.days, self._ordinal(today)))
+
+    def count_due_by_day(self):
+        """
+        Retorna cuántas tareas vencen cada día, en orden de fecha.
+        Complejidad: O(d), con d el número de días distintos
+
+        Returns:
+            dict: Fecha (YYYY-MM-DD) -> número de tareas
+        """
+        return {date.fromordinal(day).isoformat(): len(self.ids_by_day[day]) for day in self.days}
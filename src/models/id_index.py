@@ -0,0 +1,209 @@
+import heapq
+import time
+from abc import ABC, abstractmethod
+from collections import deque
+from operator import itemgetter
+
+# Códigos de operación del registro de eventos de los índices por ID
+OP_INSERT = 1
+OP_DELETE = 2
+OP_ROTATE_RIGHT = 3
+OP_ROTATE_LEFT = 4
+OP_BULK_BUILD = 5
+OP_BATCH_DELETE = 6
+OP_SPLIT = 7
+OP_JOIN = 8
+OP_BLOCK_SPLIT = 9
+OP_BLOCK_MERGE = 10
+
+# Formato de cada evento; solo se aplica al leer el registro
+OPERATION_FORMATS = {
+    OP_INSERT: "Insercion ID:{}",
+    OP_DELETE: "Eliminacion ID:{}",
+    OP_ROTATE_RIGHT: "Rotacion Derecha en nodo ID:{}",
+    OP_ROTATE_LEFT: "Rotacion Izquierda en nodo ID:{}",
+    OP_BULK_BUILD: "Construccion masiva: {} tareas",
+    OP_BATCH_DELETE: "Eliminacion por lote: {} IDs",
+    OP_SPLIT: "Division en ID:{}",
+    OP_JOIN: "Union: {} tareas",
+    OP_BLOCK_SPLIT: "Division de bloque en ID:{}",
+    OP_BLOCK_MERGE: "Union de bloques en ID:{}",
+}
+
+
+class IdIndex(ABC):
+    """
+    Interfaz común de los índices de tareas por ID (AVLTree,
+    SortedBlockIndex). TaskController solo usa estas operaciones, por lo que
+    cualquier implementación puede reemplazar al árbol AVL.
+
+    Las subclases implementan las operaciones primitivas (inserción,
+    búsqueda, eliminación, recorridos con rango opcional [lo, hi],
+    estadísticos de orden, división/unión e instantáneas), declaradas como
+    métodos abstractos: un índice al que le falte alguna falla al
+    construirse. Esta clase aporta el registro de operaciones (buffer
+    circular de eventos compactos) y las versiones en lista de los
+    recorridos.
+    """
+
+    def __init__(self, log_capacity=100, log_operations=True):
+        # Últimas operaciones como tuplas (código, ID, timestamp); las más
+        # antiguas se descartan solas
+        self.operations = deque(maxlen=log_capacity)
+        self.log_operations = log_operations
+
+    @classmethod
+    @abstractmethod
+    def from_sorted(cls, tasks, **options):
+        """Construye el índice a partir de tareas ordenadas por ID, en O(n)"""
+
+    @abstractmethod
+    def insert(self, task):
+        """Inserta una tarea (si el ID ya existe, la reemplaza)"""
+
+    @abstractmethod
+    def search(self, task_id):
+        """Retorna la tarea con ese ID, o None"""
+
+    @abstractmethod
+    def delete(self, task_id):
+        """Elimina la tarea con ese ID (si no existe, no hace nada)"""
+
+    @abstractmethod
+    def delete_many(self, task_ids):
+        """Elimina un lote de tareas por ID (los inexistentes se ignoran)"""
+
+    @abstractmethod
+    def size(self):
+        """Retorna el número de tareas"""
+
+    def is_empty(self):
+        """Verifica si el índice está vacío"""
+        return self.size() == 0
+
+    @abstractmethod
+    def height(self):
+        """Retorna la altura del árbol (0 si está vacío)"""
+
+    @abstractmethod
+    def rank(self, task_id):
+        """Retorna el número de tareas con ID menor que task_id"""
+
+    @abstractmethod
+    def select(self, k):
+        """Retorna la tarea en la posición k (desde 0) del orden por ID, o None"""
+
+    @abstractmethod
+    def split(self, key):
+        """Divide el índice en (IDs < key, IDs >= key); este queda vacío"""
+
+    @classmethod
+    @abstractmethod
+    def join(cls, left, right):
+        """Une dos índices con rangos de IDs disjuntos; ambos quedan vacíos"""
+
+    @abstractmethod
+    def snapshot(self):
+        """Retorna una versión independiente del índice en este instante"""
+
+    @abstractmethod
+    def is_shared(self):
+        """True si otra versión viva (instantánea) puede compartir tareas con el índice"""
+
+    @abstractmethod
+    def iter_tasks(self, lo=None, hi=None):
+        """Genera las tareas ordenadas por ID, opcionalmente en [lo, hi]"""
+
+    @abstractmethod
+    def iter_inorder(self, lo=None, hi=None):
+        """Genera los IDs en inorden, opcionalmente en [lo, hi]"""
+
+    @abstractmethod
+    def iter_preorder(self, lo=None, hi=None):
+        """Genera los IDs en preorden, opcionalmente en [lo, hi]"""
+
+    @abstractmethod
+    def iter_postorder(self, lo=None, hi=None):
+        """Genera los IDs en postorden, opcionalmente en [lo, hi]"""
+
+    @abstractmethod
+    def is_balanced(self):
+        """Verifica que el índice esté balanceado"""
+
+    @abstractmethod
+    def is_inorder_sorted(self):
+        """Verifica que los IDs estén ordenados"""
+
+    @abstractmethod
+    def verify(self):
+        """Comprobación completa de invariantes (dict de nombre -> bool)"""
+
+    def get_all_tasks(self):
+        """
+        Retorna todas las tareas en orden (in-order traversal).
+        Las tareas estarán ordenadas por ID.
+        """
+        return list(self.iter_tasks())
+
+    def get_preorder(self):
+        """Retorna recorrido en preorden (raíz-izq-der)"""
+        return list(self.iter_preorder())
+
+    def get_inorder(self):
+        """Retorna recorrido en inorden (izq-raíz-der)"""
+        return list(self.iter_inorder())
+
+    def get_postorder(self):
+        """Retorna recorrido en postorden (izq-der-raíz)"""
+        return list(self.iter_postorder())
+
+    def _log(self, op_code, value):
+        """
+        Registra un evento en el buffer circular de operaciones.
+        Complejidad: O(1)
+
+        Args:
+            op_code (int): Código de operación (OP_*)
+            value (int): ID de la tarea afectada (o cantidad en operaciones masivas)
+        """
+        if self.log_operations:
+            self.operations.append((op_code, value, time.time()))
+
+    def _take_operations(self, *sources):
+        """
+        Reemplaza el registro de este índice por los eventos de sources,
+        intercalados por timestamp (conservando los más recientes que quepan
+        en la capacidad), y deja vacíos los registros de sources. Lo usan
+        split y join para que el historial pase al índice resultante.
+        Complejidad: O(m) para m eventos en total
+        """
+        merged = heapq.merge(*(source.operations for source in sources), key=itemgetter(2))
+        self.operations = deque(merged, maxlen=self.operations.maxlen)
+        for source in sources:
+            source.operations = deque(maxlen=source.operations.maxlen)
+
+    def get_recent_operations(self, count=10):
+        """
+        Retorna las últimas N operaciones
+        Args:
+            count (int): Número de operaciones a retornar
+
+        Returns:
+            list: Últimas operaciones, formateadas como texto
+        """
+        return [OPERATION_FORMATS[op_code].format(value)
+                for op_code, value, _ in self.get_recent_events(count)]
+
+    def get_recent_events(self, count=10):
+        """
+        Retorna los últimos N eventos sin formatear.
+
+        Args:
+            count (int): Número de eventos a retornar
+
+        Returns:
+            list: Tuplas (código, ID, timestamp) de la más antigua a la más reciente
+        """
+        if count <= 0:
+            return []
+        return list(self.operations)[-count:]
@@ -1,145 +1,497 @@
+import heapq
+from datetime import date
+
+
 class MaxHeap:
     """
-    Max-Heap binario para gestionar tareas por prioridad.
+    Max-Heap d-ario (binario por defecto) para gestionar tareas por prioridad.
     El elemento con mayor prioridad siempre estará en la raíz.
     Prioridad: Alta=3, Media=2, Baja=1
+
+    Aridad (arity=d): cada nodo tiene hasta d hijos, almacenados de forma
+    contigua en el arreglo. Un d mayor (4, 8) produce un heap menos profundo:
+    la inserción recorre menos niveles, a cambio de comparar más hijos por
+    nivel al extraer.
+
+    Modo indexado (indexed=True): mantiene un mapa task_id -> posición en el
+    arreglo, de modo que buscar, verificar pertenencia y eliminar por ID no
+    requieren recorrer todo el heap.
+
+    Modo con claves (keyed=True): guarda en paralelo una clave entera
+    precalculada por tarea (ver Task.sort_key), de modo que cada comparación
+    es una comparación nativa de enteros en lugar de Task.__gt__.
+
+    Modo perezoso (lazy=True): remove solo marca la entrada como eliminada
+    (tombstone); extract_max y peek descartan las entradas marcadas al llegar
+    a la raíz, y el heap se reconstruye cuando la fracción de entradas
+    marcadas supera compact_threshold. size() e is_empty() siguen siendo
+    exactos y O(1).
     """
 
-    def __init__(self):
+    def __init__(self, indexed=False, keyed=False, lazy=False, compact_threshold=0.5, arity=2):
+        if arity < 2:
+            raise ValueError("La aridad del heap debe ser al menos 2")
+
         self.heap = []
+        self.arity = arity
+        self.indexed = indexed
+        self.positions = {}  # task_id -> índice en self.heap (solo en modo indexado)
+        self.keyed = keyed
+        self.keys = []  # Claves paralelas a self.heap (solo en modo con claves)
+        self.lazy = lazy
+        self.compact_threshold = compact_threshold
+        self.dead = set()  # IDs de entradas marcadas como eliminadas (solo en modo perezoso)
+
+    def _values(self):
+        """Retorna la lista usada para comparar: las claves o las tareas"""
+        return self.keys if self.keyed else self.heap
+
+    @classmethod
+    def from_tasks(cls, tasks, **options):
+        """
+        Construye un heap a partir de una colección de tareas con el
+        algoritmo de Floyd (heapify de abajo hacia arriba).
+        Complejidad: O(n), frente a O(n log n) de n inserciones
+
+        Args:
+            tasks (iterable): Tareas a cargar
+            **options: Opciones del constructor (indexed, keyed, lazy, arity)
+
+        Returns:
+            MaxHeap: Heap con todas las tareas
+
+        Raises:
+            ValueError: Si hay IDs repetidos en modo indexado, o un ID fuera
+                de rango en modo con claves
+        """
+        heap = cls(**options)
+        heap.heap = list(tasks)
+
+        if heap.keyed:
+            heap.keys = [task.sort_key for task in heap.heap]
+
+        if heap.indexed:
+            heap.positions = {task.task_id: i for i, task in enumerate(heap.heap)}
+            if len(heap.positions) != len(heap.heap):
+                raise ValueError("Hay tareas con IDs repetidos")
+
+        heap._heapify()
+        return heap
+
+    def _heapify(self):
+        """
+        Restablece la propiedad del heap sobre todo el arreglo, aplicando
+        _heapify_down desde el último nodo interno hasta la raíz.
+        Complejidad: O(n)
+        """
+        for index in range(self._parent(len(self.heap) - 1), -1, -1):
+            self._heapify_down(index)
 
     def _parent(self, index):
         """Retorna el índice del padre"""
-        return (index - 1) // 2
+        return (index - 1) // self.arity
 
-    def _left_child(self, index):
-        """Retorna el índice del hijo izquierdo"""
-        return 2 * index + 1
-
-    def _right_child(self, index):
-        """Retorna el índice del hijo derecho"""
-        return 2 * index + 2
+    def _first_child(self, index):
+        """Retorna el índice del primer hijo (los d hijos son contiguos)"""
+        return self.arity * index + 1
 
     def _swap(self, i, j):
         """Intercambia dos elementos en el heap"""
         self.heap[i], self.heap[j] = self.heap[j], self.heap[i]
 
+        if self.keyed:
+            self.keys[i], self.keys[j] = self.keys[j], self.keys[i]
+
+        if self.indexed:
+            self.positions[self.heap[i].task_id] = i
+            self.positions[self.heap[j].task_id] = j
+
+    def _find_index(self, task_id):
+        """
+        Retorna el índice de la tarea con el ID dado, o -1 si no está
+        (o si está marcada como eliminada).
+        Complejidad: O(1) en modo indexado, O(n) en caso contrario
+        """
+        if task_id in self.dead:
+            return -1
+
+        if self.indexed:
+            return self.positions.get(task_id, -1)
+
+        for i, task in enumerate(self.heap):
+            if task.task_id == task_id:
+                return i
+        return -1
+
     def _heapify_up(self, index):
         """
         Mantiene la propiedad del max-heap moviendo el elemento hacia arriba.
         Se ejecuta después de insertar un nuevo elemento.
-        Usa el operador > de Task que considera prioridad Y fecha de vencimiento.
+        Usa el operador > de Task que considera prioridad Y fecha de vencimiento
+        (o las claves precalculadas en modo con claves).
+
+        Versión iterativa: en lugar de intercambiar en cada nivel, baja a los
+        padres menores y coloca el elemento una sola vez en su posición final.
         """
-        parent = self._parent(index)
+        heap = self.heap
+        keys = self.keys
+        values = self._values()
+        positions = self.positions
+        arity = self.arity
+
+        task = heap[index]
+        value = values[index]
 
         # Mientras no sea la raíz y el elemento sea mayor que su padre
-        if index > 0 and self.heap[index] > self.heap[parent]:
-            self._swap(index, parent)
-            self._heapify_up(parent)
+        while index > 0:
+            parent = (index - 1) // arity
+            if not value > values[parent]:
+                break
+
+            heap[index] = heap[parent]
+            if self.keyed:
+                keys[index] = keys[parent]
+            if self.indexed:
+                positions[heap[index].task_id] = index
+            index = parent
+
+        heap[index] = task
+        if self.keyed:
+            keys[index] = value
+        if self.indexed:
+            positions[task.task_id] = index
 
     def _heapify_down(self, index):
         """
         Mantiene la propiedad del max-heap moviendo el elemento hacia abajo.
         Se ejecuta después de extraer el elemento máximo.
-        Usa el operador > de Task que considera prioridad Y fecha de vencimiento.
+        Usa el operador > de Task que considera prioridad Y fecha de vencimiento
+        (o las claves precalculadas en modo con claves).
+
+        Versión iterativa: sube al hijo mayor en cada nivel y coloca el
+        elemento una sola vez en su posición final.
         """
-        largest = index
-        left = self._left_child(index)
-        right = self._right_child(index)
+        heap = self.heap
+        keys = self.keys
+        values = self._values()
+        positions = self.positions
+        arity = self.arity
+        size = len(heap)
+
+        task = heap[index]
+        value = values[index]
+
+        while True:
+            first = arity * index + 1
+            if first >= size:
+                break
 
-        # Encontrar el mayor entre el nodo actual y sus hijos
-        if left < len(self.heap) and self.heap[left] > self.heap[largest]:
-            largest = left
+            # Encontrar el mayor entre los hijos (contiguos en el arreglo)
+            largest = first
+            largest_value = values[first]
+            for child in range(first + 1, min(first + arity, size)):
+                if values[child] > largest_value:
+                    largest = child
+                    largest_value = values[child]
+
+            # Si ningún hijo es mayor que el elemento, ya está en su lugar
+            if not largest_value > value:
+                break
 
-        if right < len(self.heap) and self.heap[right] > self.heap[largest]:
-            largest = right
+            heap[index] = heap[largest]
+            if self.keyed:
+                keys[index] = keys[largest]
+            if self.indexed:
+                positions[heap[index].task_id] = index
+            index = largest
 
-        # Si el mayor no es el nodo actual, intercambiar y continuar
-        if largest != index:
-            self._swap(index, largest)
-            self._heapify_down(largest)
+        heap[index] = task
+        if self.keyed:
+            keys[index] = value
+        if self.indexed:
+            positions[task.task_id] = index
 
     def insert(self, task):
         """
         Inserta una nueva tarea en el heap.
         Complejidad: O(log n)
         """
+        if task.task_id in self.dead:
+            # Descartar la entrada eliminada con el mismo ID antes de reinsertar
+            self._compact()
+
+        if self.indexed and task.task_id in self.positions:
+            raise ValueError(f"La tarea con ID {task.task_id} ya está en el heap")
+
+        if self.keyed:
+            # Calcular la clave antes de modificar el heap (puede lanzar ValueError)
+            self.keys.append(task.sort_key)
+
+        if self.indexed:
+            self.positions[task.task_id] = len(self.heap)
+
         self.heap.append(task)
         self._heapify_up(len(self.heap) - 1)
 
     def extract_max(self):
         """
         Extrae y retorna la tarea con mayor prioridad.
-        Complejidad: O(log n)
+        En modo perezoso descarta antes las entradas eliminadas de la raíz.
+        Complejidad: O(log n) (amortizado en modo perezoso)
         """
-        if self.is_empty():
-            return None
+        self._discard_dead_top()
 
-        if len(self.heap) == 1:
-            return self.heap.pop()
+        if not self.heap:
+            return None
 
-        # Guardar el máximo
         max_task = self.heap[0]
+        self._remove_at(0)
 
-        # Mover el último elemento a la raíz
-        self.heap[0] = self.heap.pop()
+        return max_task
 
-        # Reequilibrar el heap
-        self._heapify_down(0)
+    def extract_top(self, k):
+        """
+        Extrae las k tareas con mayor prioridad, en orden de prioridad.
+        Complejidad: O(k log n)
 
-        return max_task
+        Args:
+            k (int): Número de tareas a extraer
+
+        Returns:
+            list: Hasta k tareas (menos si el heap tiene menos elementos)
+        """
+        extract_max = self.extract_max
+        return [extract_max() for _ in range(min(k, self.size()))]
 
     def peek(self):
         """
         Retorna la tarea con mayor prioridad sin extraerla.
-        Complejidad: O(1)
+        Complejidad: O(1) (amortizado en modo perezoso)
         """
-        return self.heap[0] if not self.is_empty() else None
+        self._discard_dead_top()
+        return self.heap[0] if self.heap else None
 
     def remove(self, task_id):
         """
         Elimina una tarea específica del heap por su ID.
-        Complejidad: O(n) para buscar + O(log n) para reequilibrar
+        En modo perezoso solo la marca como eliminada (tombstone) y compacta
+        el heap cuando la fracción de entradas eliminadas supera el umbral.
+        Complejidad: O(log n) en modo indexado (O(1) amortizado si además es
+        perezoso); O(n) para buscar en caso contrario
         """
         # Buscar el índice de la tarea
-        index = -1
-        for i, task in enumerate(self.heap):
-            if task.task_id == task_id:
-                index = i
-                break
+        index = self._find_index(task_id)
 
         if index == -1:
             return False  # Tarea no encontrada
 
+        if self.lazy:
+            self.dead.add(task_id)
+            if len(self.dead) > self.compact_threshold * len(self.heap):
+                self._compact()
+            return True
+
+        self._remove_at(index)
+        return True
+
+    def _remove_at(self, index):
+        """
+        Quita físicamente la entrada en la posición dada, reemplazándola por
+        el último elemento y reequilibrando.
+        Complejidad: O(log n)
+        """
         # Si es el último elemento, simplemente eliminarlo
         if index == len(self.heap) - 1:
-            self.heap.pop()
-            return True
+            removed = self.heap.pop()
+            if self.keyed:
+                self.keys.pop()
+            if self.indexed:
+                self.positions.pop(removed.task_id, None)
+            return
+
+        removed = self.heap[index]
 
         # Reemplazar con el último elemento
         self.heap[index] = self.heap.pop()
 
+        if self.keyed:
+            self.keys[index] = self.keys.pop()
+
+        if self.indexed:
+            self.positions.pop(removed.task_id, None)
+            self.positions[self.heap[index].task_id] = index
+
         # Reequilibrar (puede necesitar subir o bajar)
+        self._sift(index)
+
+    def _discard_dead_top(self):
+        """
+        Quita de la raíz las entradas marcadas como eliminadas (modo perezoso),
+        de modo que heap[0], si existe, sea una tarea viva.
+        Complejidad: O(log n) por entrada descartada
+        """
+        while self.dead and self.heap and self.heap[0].task_id in self.dead:
+            self.dead.discard(self.heap[0].task_id)
+            self._remove_at(0)
+
+    def _compact(self):
+        """
+        Reconstruye el heap solo con las tareas vivas, descartando todas las
+        entradas marcadas como eliminadas.
+        Complejidad: O(n)
+        """
+        if not self.dead:
+            return
+
+        live = [i for i, task in enumerate(self.heap) if task.task_id not in self.dead]
+        if self.keyed:
+            self.keys = [self.keys[i] for i in live]
+        self.heap = [self.heap[i] for i in live]
+        if self.indexed:
+            self.positions = {task.task_id: i for i, task in enumerate(self.heap)}
+
+        self.dead.clear()
+        self._heapify()
+
+    def update_key(self, task_id):
+        """
+        Reubica una tarea cuya prioridad o fecha de vencimiento cambió,
+        subiéndola o bajándola desde su posición actual (aumentar/disminuir
+        clave) en lugar de eliminarla y reinsertarla.
+        La tarea debe modificarse antes de llamar a este método.
+        Complejidad: O(log n) en modo indexado, O(n) para buscar en caso contrario
+
+        Args:
+            task_id (int): ID de la tarea modificada
+
+        Returns:
+            bool: True si la tarea estaba en el heap, False en caso contrario
+
+        Raises:
+            ValueError: Si el ID está fuera de rango en modo con claves
+                (el heap no se modifica)
+        """
+        index = self._find_index(task_id)
+        if index == -1:
+            return False
+
+        if self.keyed:
+            self.keys[index] = self.heap[index].sort_key
+
+        self._sift(index)
+        return True
+
+    def replace(self, task):
+        """
+        Sustituye la tarea del heap que tiene el mismo ID por task (otra
+        versión de la misma tarea, por ejemplo con otra prioridad) y la
+        reubica desde su posición actual.
+        Complejidad: O(log n) en modo indexado, O(n) para buscar en caso contrario
+
+        Args:
+            task (Task): Nueva versión de la tarea
+
+        Returns:
+            bool: True si había una tarea con ese ID, False en caso contrario
+
+        Raises:
+            ValueError: Si el ID está fuera de rango en modo con claves
+                (el heap no se modifica)
+        """
+        index = self._find_index(task.task_id)
+        if index == -1:
+            return False
+
+        if self.keyed:
+            self.keys[index] = task.sort_key
+        self.heap[index] = task
+
+        self._sift(index)
+        return True
+
+    def _sift(self, index):
+        """
+        Sube o baja la entrada en la posición dada hasta su lugar.
+        Complejidad: O(log n)
+        """
+        values = self._values()
         parent = self._parent(index)
-        if index > 0 and self.heap[index] > self.heap[parent]:
+        if index > 0 and values[index] > values[parent]:
             self._heapify_up(index)
         else:
             self._heapify_down(index)
 
-        return True
+    def contains(self, task_id):
+        """
+        Verifica si una tarea con el ID dado está en el heap.
+        Complejidad: O(1) en modo indexado, O(n) en caso contrario
+        """
+        return self._find_index(task_id) != -1
+
+    def get(self, task_id):
+        """
+        Retorna la tarea con el ID dado sin extraerla, o None si no está.
+        Complejidad: O(1) en modo indexado, O(n) en caso contrario
+        """
+        index = self._find_index(task_id)
+        return self.heap[index] if index != -1 else None
 
     def is_empty(self):
         """Verifica si el heap está vacío"""
-        return len(self.heap) == 0
+        return self.size() == 0
 
     def size(self):
-        """Retorna el número de elementos en el heap"""
-        return len(self.heap)
+        """Retorna el número de elementos en el heap (sin contar los eliminados)"""
+        return len(self.heap) - len(self.dead)
 
     def get_all_tasks(self):
         """Retorna todas las tareas en el heap (sin orden específico)"""
+        if self.dead:
+            return [task for task in self.heap if task.task_id not in self.dead]
         return self.heap.copy()
 
+    def iter_sorted(self):
+        """
+        Genera las tareas en orden de prioridad sin modificar el heap.
+        Usa una frontera auxiliar (min-heap de índices): empieza en la raíz y,
+        al emitir un nodo, agrega sus hijos, de modo que obtener las primeras
+        k tareas cuesta O(k log k) (O(k d log k) en un heap d-ario),
+        independientemente del tamaño del heap.
+        El heap no debe modificarse mientras se consume el generador.
+
+        Yields:
+            Task: Tareas de mayor a menor prioridad
+        """
+        heap = self.heap
+        if not heap:
+            return
+
+        arity = self.arity
+        size = len(heap)
+        dead = self.dead
+
+        # Entradas (orden, índice): la clave se niega porque heapq es un min-heap;
+        # sin claves se usa la tarea, cuyo __lt__ ordena por mayor prioridad
+        if self.keyed:
+            keys = self.keys
+            order = lambda i: -keys[i]
+        else:
+            order = heap.__getitem__
+
+        frontier = [(order(0), 0)]
+        while frontier:
+            _, index = heapq.heappop(frontier)
+
+            first = arity * index + 1
+            for child in range(first, min(first + arity, size)):
+                heapq.heappush(frontier, (order(child), child))
+
+            # Las entradas eliminadas (modo perezoso) no se emiten, pero sus
+            # hijos sí pueden ser tareas vivas
+            task = heap[index]
+            if task.task_id not in dead:
+                yield task
+
     def get_heap_representation(self):
         """
         Retorna una representación visual del heap como arreglo.
@@ -151,14 +503,15 @@ class MaxHeap:
         if self.is_empty():
             return "Heap vacío: []"
 
-        representation = "["
-        for i, task in enumerate(self.heap):
-            representation += f"({task.task_id}:{task.priority_name[0]}{task.due_date[8:]})"
-            if i < len(self.heap) - 1:
-                representation += ", "
-        representation += "]"
+        # Solo lectura: las entradas eliminadas se omiten sin compactar
+        dead = self.dead
+        entries = []
+        for task in self.heap:
+            if task.task_id not in dead:
+                day = date.fromordinal(task.due_ordinal).day
+                entries.append(f"({task.task_id}:{task.priority_name[0]}{day:02d})")
 
-        return representation
+        return "[" + ", ".join(entries) + "]"
 
     def get_heap_levels(self):
         """
@@ -166,21 +519,24 @@ class MaxHeap:
 
         Returns:
             list: Lista de niveles, donde cada nivel es una lista de tareas
+                (en modo perezoso se omiten las entradas eliminadas, sin
+                compactar el heap)
         """
         if self.is_empty():
             return []
 
+        # El nivel l tiene arity**l nodos, empezando donde termina el anterior
+        dead = self.dead
         levels = []
-        level = 0
-        while True:
-            start_idx = 2**level - 1
-            end_idx = 2**(level + 1) - 1
-
-            if start_idx >= len(self.heap):
-                break
-
-            level_tasks = self.heap[start_idx:min(end_idx, len(self.heap))]
-            levels.append(level_tasks)
-            level += 1
+        start_idx = 0
+        level_size = 1
+        while start_idx < len(self.heap):
+            end_idx = start_idx + level_size
+            level = self.heap[start_idx:min(end_idx, len(self.heap))]
+            if dead:
+                level = [task for task in level if task.task_id not in dead]
+            levels.append(level)
+            start_idx = end_idx
+            level_size *= self.arity
 
         return levels
@@ -0,0 +1,497 @@
+from bisect import bisect_left
+
+from src.models.id_index import (
+    IdIndex, OP_INSERT, OP_DELETE, OP_BULK_BUILD, OP_BATCH_DELETE, OP_SPLIT, OP_JOIN,
+    OP_BLOCK_SPLIT, OP_BLOCK_MERGE,
+)
+
+
+class SortedBlockIndex(IdIndex):
+    """
+    Índice por ID como lista ordenada por bloques, alternativa a AVLTree con
+    la misma API.
+
+    Las tareas se guardan en bloques contiguos (listas de Python) de como
+    máximo 2 * block_size elementos, ordenados por ID, junto con el mayor ID
+    de cada bloque. Una búsqueda son dos búsquedas binarias sobre arreglos
+    contiguos (los máximos de los bloques y el bloque elegido), sin recorrer
+    nodos enlazados por punteros; insertar o eliminar desplaza como mucho un
+    bloque. Cada tarea ocupa dos referencias (ID y tarea) en lugar de un nodo
+    con cinco atributos.
+
+    Los recorridos preorden y postorden son los del árbol binario
+    perfectamente balanceado implícito en la secuencia ordenada (el mismo
+    que construiría AVLTree.from_sorted), por lo que el índice siempre está
+    balanceado y su altura es n.bit_length().
+
+    Instantáneas: snapshot() copia solo las listas de bloques
+    (O(n / block_size)); los bloques se comparten y cada versión copia un
+    bloque compartido la primera vez que lo modifica.
+    """
+
+    def __init__(self, block_size=512, log_capacity=100, log_operations=True):
+        if block_size < 1:
+            raise ValueError("El tamaño de bloque debe ser al menos 1")
+
+        super().__init__(log_capacity, log_operations)
+        self.block_size = block_size
+        self.ids = []  # Bloques de IDs ordenados
+        self.blocks = []  # Bloques de tareas, paralelos a ids
+        self.maxes = []  # Mayor ID de cada bloque
+        self._size = 0
+        # id() de los bloques propios tras una instantánea (None: todos son propios)
+        self._owned = None
+        # Resultado de la última verificación completa
+        self._sorted = True
+        self._balanced = True
+
+    @classmethod
+    def from_sorted(cls, tasks, **options):
+        """
+        Construye el índice cortando en bloques una secuencia ordenada por ID.
+        Complejidad: O(n)
+
+        Args:
+            tasks (iterable): Tareas ordenadas de forma estrictamente creciente por ID
+            **options: Opciones del constructor (block_size...)
+
+        Returns:
+            SortedBlockIndex: Índice con todas las tareas
+
+        Raises:
+            ValueError: Si los IDs no son estrictamente crecientes
+        """
+        tasks = list(tasks)
+        for i in range(len(tasks) - 1):
+            if tasks[i].task_id >= tasks[i + 1].task_id:
+                raise ValueError("Las tareas deben estar ordenadas por ID y sin repetidos")
+
+        index = cls(**options)
+        index._log(OP_BULK_BUILD, len(tasks))
+        for start in range(0, len(tasks), index.block_size):
+            block = tasks[start:start + index.block_size]
+            index.blocks.append(block)
+            index.ids.append([task.task_id for task in block])
+            index.maxes.append(block[-1].task_id)
+        index._size = len(tasks)
+        return index
+
+    def _empty_like(self):
+        """Crea un índice vacío con la misma configuración que este"""
+        return type(self)(block_size=self.block_size,
+                          log_capacity=self.operations.maxlen,
+                          log_operations=self.log_operations)
+
+    def _own_block(self, pos):
+        """
+        Copia el bloque pos si está compartido con una instantánea.
+        Complejidad: O(block_size) la primera vez, O(1) después
+        """
+        if self._owned is None or id(self.ids[pos]) in self._owned:
+            return
+
+        self.ids[pos] = list(self.ids[pos])
+        self.blocks[pos] = list(self.blocks[pos])
+        self._owned.add(id(self.ids[pos]))
+
+    def _drop_block(self, pos):
+        """Quita el bloque pos de las listas de bloques"""
+        if self._owned is not None:
+            self._owned.discard(id(self.ids[pos]))
+        del self.ids[pos]
+        del self.blocks[pos]
+        del self.maxes[pos]
+
+    def _locate(self, task_id):
+        """
+        Busca la posición de un ID.
+
+        Returns:
+            tuple: (bloque, posición en el bloque), o None si no existe
+        """
+        pos = bisect_left(self.maxes, task_id)
+        if pos == len(self.maxes):
+            return None
+
+        ids = self.ids[pos]
+        i = bisect_left(ids, task_id)
+        if ids[i] != task_id:
+            return None
+        return pos, i
+
+    def _split_block(self, pos):
+        """Divide en dos un bloque que superó 2 * block_size elementos"""
+        ids = self.ids[pos]
+        tasks = self.blocks[pos]
+        half = len(ids) // 2
+
+        self.ids.insert(pos + 1, ids[half:])
+        self.blocks.insert(pos + 1, tasks[half:])
+        self.maxes.insert(pos + 1, ids[-1])
+        if self._owned is not None:
+            self._owned.add(id(self.ids[pos + 1]))
+
+        del ids[half:]
+        del tasks[half:]
+        self.maxes[pos] = ids[-1]
+        self._log(OP_BLOCK_SPLIT, ids[-1])
+
+    def _merge_block(self, pos):
+        """Une un bloque con menos de block_size / 2 elementos a un vecino"""
+        left = pos if pos + 1 < len(self.ids) else pos - 1
+        self._own_block(left)
+        self.ids[left].extend(self.ids[left + 1])
+        self.blocks[left].extend(self.blocks[left + 1])
+        self.maxes[left] = self.maxes[left + 1]
+        self._drop_block(left + 1)
+        self._log(OP_BLOCK_MERGE, self.maxes[left])
+
+        if len(self.ids[left]) > 2 * self.block_size:
+            self._split_block(left)
+
+    def insert(self, task):
+        """
+        Inserta una tarea en su bloque (si el ID ya existe, la reemplaza).
+        Complejidad: O(log n + block_size)
+        """
+        self._log(OP_INSERT, task.task_id)
+
+        if not self.ids:
+            self.ids.append([task.task_id])
+            self.blocks.append([task])
+            self.maxes.append(task.task_id)
+            if self._owned is not None:
+                self._owned.add(id(self.ids[0]))
+            self._size = 1
+            return
+
+        # Un nuevo máximo va al final del último bloque
+        pos = min(bisect_left(self.maxes, task.task_id), len(self.maxes) - 1)
+        self._own_block(pos)
+        ids = self.ids[pos]
+        i = bisect_left(ids, task.task_id)
+
+        if i < len(ids) and ids[i] == task.task_id:
+            # ID duplicado - actualizar la tarea existente
+            self.blocks[pos][i] = task
+            return
+
+        ids.insert(i, task.task_id)
+        self.blocks[pos].insert(i, task)
+        self.maxes[pos] = ids[-1]
+        self._size += 1
+
+        if len(ids) > 2 * self.block_size:
+            self._split_block(pos)
+
+    def search(self, task_id):
+        """
+        Busca una tarea por su ID.
+        Complejidad: O(log n)
+        """
+        location = self._locate(task_id)
+        if location is None:
+            return None
+        pos, i = location
+        return self.blocks[pos][i]
+
+    def _remove(self, task_id):
+        """Elimina un ID de su bloque, uniendo bloques que quedan pequeños"""
+        location = self._locate(task_id)
+        if location is None:
+            return
+
+        pos, i = location
+        self._own_block(pos)
+        ids = self.ids[pos]
+        del ids[i]
+        del self.blocks[pos][i]
+        self._size -= 1
+
+        if not ids:
+            self._drop_block(pos)
+            return
+
+        self.maxes[pos] = ids[-1]
+        if len(ids) < self.block_size // 2 and len(self.ids) > 1:
+            self._merge_block(pos)
+
+    def delete(self, task_id):
+        """
+        Elimina una tarea del índice por su ID.
+        Complejidad: O(log n + block_size)
+        """
+        self._log(OP_DELETE, task_id)
+        self._remove(task_id)
+
+    def delete_many(self, task_ids):
+        """
+        Elimina un lote de tareas por ID.
+        Complejidad: O(k (log n + block_size))
+
+        Args:
+            task_ids (iterable): IDs a eliminar (los inexistentes se ignoran)
+        """
+        ids = sorted(set(task_ids))
+        if not ids or not self.ids:
+            return
+
+        self._log(OP_BATCH_DELETE, len(ids))
+        for task_id in ids:
+            self._remove(task_id)
+
+    def size(self):
+        """
+        Retorna el número de tareas.
+        Complejidad: O(1)
+        """
+        return self._size
+
+    def height(self):
+        """
+        Retorna la altura del árbol balanceado implícito.
+        Complejidad: O(1)
+        """
+        return self._size.bit_length()
+
+    def rank(self, task_id):
+        """
+        Retorna el número de tareas con ID menor que task_id.
+        Complejidad: O(log n + n / block_size)
+        """
+        pos = bisect_left(self.maxes, task_id)
+        rank = sum(len(ids) for ids in self.ids[:pos])
+        if pos < len(self.ids):
+            rank += bisect_left(self.ids[pos], task_id)
+        return rank
+
+    def select(self, k):
+        """
+        Retorna la tarea en la posición k (desde 0) del orden por ID.
+        Complejidad: O(n / block_size)
+
+        Returns:
+            Task: La tarea en la posición k, o None si k está fuera de rango
+        """
+        if not 0 <= k < self._size:
+            return None
+
+        for tasks in self.blocks:
+            if k < len(tasks):
+                return tasks[k]
+            k -= len(tasks)
+        return None
+
+    def split(self, key):
+        """
+        Divide el índice en dos: las tareas con ID menor que key y las
+        tareas con ID mayor o igual que key. Este índice queda vacío y su
+        registro de operaciones pasa al índice derecho.
+        Complejidad: O(n / block_size + block_size)
+
+        Returns:
+            tuple: (SortedBlockIndex con IDs < key, SortedBlockIndex con IDs >= key)
+        """
+        self._log(OP_SPLIT, key)
+
+        left = self._empty_like()
+        right = self._empty_like()
+        pos = bisect_left(self.maxes, key)
+        i = bisect_left(self.ids[pos], key) if pos < len(self.ids) else 0
+
+        # El bloque que contiene key se corta en dos copias nuevas
+        left.ids, left.blocks = self.ids[:pos], self.blocks[:pos]
+        right.ids, right.blocks = self.ids[pos + 1:], self.blocks[pos + 1:]
+        if pos < len(self.ids):
+            if i > 0:
+                left.ids.append(self.ids[pos][:i])
+                left.blocks.append(self.blocks[pos][:i])
+            right.ids.insert(0, self.ids[pos][i:])
+            right.blocks.insert(0, self.blocks[pos][i:])
+
+        for index in (left, right):
+            index.maxes = [ids[-1] for ids in index.ids]
+            index._size = sum(len(ids) for ids in index.ids)
+            # Los bloques pueden estar compartidos con instantáneas previas
+            index._owned = None if self._owned is None else set()
+        right._take_operations(self)
+
+        self._clear()
+        return left, right
+
+    @classmethod
+    def join(cls, left, right):
+        """
+        Une dos índices en uno nuevo, suponiendo que todos los IDs de left
+        son menores que todos los de right. Ambos índices quedan vacíos y sus
+        registros de operaciones se combinan en el del índice nuevo.
+        Complejidad: O(n / block_size)
+
+        Raises:
+            ValueError: Si los rangos de IDs se solapan
+        """
+        if left.ids and right.ids and left.maxes[-1] >= right.ids[0][0]:
+            raise ValueError("Todos los IDs del índice izquierdo deben ser menores que los del derecho")
+
+        index = left._empty_like()
+        index._take_operations(left, right)
+        index._log(OP_JOIN, left.size() + right.size())
+        index.ids = left.ids + right.ids
+        index.blocks = left.blocks + right.blocks
+        index.maxes = left.maxes + right.maxes
+        index._size = left._size + right._size
+        if left._owned is not None or right._owned is not None:
+            index._owned = set()
+
+        left._clear()
+        right._clear()
+        return index
+
+    def _clear(self):
+        """Deja el índice vacío"""
+        self.ids = []
+        self.blocks = []
+        self.maxes = []
+        self._size = 0
+
+    def snapshot(self):
+        """
+        Crea una instantánea del índice que comparte todos los bloques. Cada
+        versión copia un bloque compartido la primera vez que lo modifica.
+        Complejidad: O(n / block_size)
+
+        Returns:
+            SortedBlockIndex: Versión del índice en este instante
+        """
+        snapshot = self._empty_like()
+        snapshot.ids = list(self.ids)
+        snapshot.blocks = list(self.blocks)
+        snapshot.maxes = list(self.maxes)
+        snapshot._size = self._size
+        snapshot._owned = set()
+
+        # Los bloques actuales pasan a ser compartidos
+        self._owned = set()
+        return snapshot
+
+    def is_shared(self):
+        """
+        Indica si el índice puede compartir bloques (y tareas) con una
+        instantánea: a partir de la primera, los bloques se copian en
+        escritura.
+        Complejidad: O(1)
+        """
+        return self._owned is not None
+
+    def iter_tasks(self, lo=None, hi=None):
+        """
+        Genera las tareas ordenadas por ID, opcionalmente limitadas al rango
+        [lo, hi].
+        Complejidad: O(log n + k) para k tareas generadas
+        """
+        first = 0 if lo is None else bisect_left(self.maxes, lo)
+        for pos in range(first, len(self.ids)):
+            ids = self.ids[pos]
+            tasks = self.blocks[pos]
+            start = bisect_left(ids, lo) if pos == first and lo is not None else 0
+            for i in range(start, len(ids)):
+                if hi is not None and ids[i] > hi:
+                    return
+                yield tasks[i]
+
+    def iter_inorder(self, lo=None, hi=None):
+        """
+        Genera los IDs en inorden (orden creciente), opcionalmente limitados
+        al rango [lo, hi].
+        Complejidad: O(log n + k) para k IDs generados
+        """
+        for task in self.iter_tasks(lo, hi):
+            yield task.task_id
+
+    def _all_ids(self):
+        """Retorna todos los IDs en orden en una sola lista"""
+        return [task_id for ids in self.ids for task_id in ids]
+
+    def iter_preorder(self, lo=None, hi=None):
+        """
+        Genera los IDs en preorden del árbol balanceado implícito (raíz en el
+        elemento central de cada rango), opcionalmente limitados a [lo, hi].
+        Complejidad: O(n)
+        """
+        ids = self._all_ids()
+        stack = [(0, len(ids) - 1)] if ids else []
+        while stack:
+            low, high = stack.pop()
+            if low > high or (lo is not None and ids[high] < lo) or (hi is not None and ids[low] > hi):
+                continue
+
+            mid = (low + high) // 2
+            if (lo is None or ids[mid] >= lo) and (hi is None or ids[mid] <= hi):
+                yield ids[mid]
+            stack.append((mid + 1, high))
+            stack.append((low, mid - 1))
+
+    def iter_postorder(self, lo=None, hi=None):
+        """
+        Genera los IDs en postorden del árbol balanceado implícito,
+        opcionalmente limitados a [lo, hi].
+        Complejidad: O(n)
+        """
+        ids = self._all_ids()
+        # Pila de (inicio, fin, hijos_ya_apilados)
+        stack = [(0, len(ids) - 1, False)] if ids else []
+        while stack:
+            low, high, expanded = stack.pop()
+            mid = (low + high) // 2
+            if expanded:
+                if (lo is None or ids[mid] >= lo) and (hi is None or ids[mid] <= hi):
+                    yield ids[mid]
+                continue
+
+            if low > high or (lo is not None and ids[high] < lo) or (hi is not None and ids[low] > hi):
+                continue
+            stack.append((low, high, True))
+            stack.append((mid + 1, high, False))
+            stack.append((low, mid - 1, False))
+
+    def is_balanced(self):
+        """
+        Verifica que el índice esté balanceado: el árbol implícito siempre lo
+        está, así que solo depende de la última verificación completa.
+        Complejidad: O(1)
+        """
+        return self._balanced
+
+    def is_inorder_sorted(self):
+        """
+        Verifica que los IDs estén ordenados. Las inserciones usan búsqueda
+        binaria, así que el orden se mantiene por construcción; solo depende
+        de la última verificación completa.
+        Complejidad: O(1)
+        """
+        return self._sorted
+
+    def verify(self):
+        """
+        Comprueba de forma completa los invariantes del índice (para
+        depuración): IDs estrictamente crecientes, bloques no vacíos y de
+        como máximo 2 * block_size elementos, máximos de bloque y tamaño.
+        Complejidad: O(n)
+
+        Returns:
+            dict: 'sorted', 'balanced' (tamaño de los bloques), 'heights'
+                (máximos de bloque) y 'sizes' (True si se cumplen), con las
+                mismas claves que AVLTree.verify()
+        """
+        ids = self._all_ids()
+        result = {
+            'sorted': all(ids[i] < ids[i + 1] for i in range(len(ids) - 1)),
+            'balanced': all(0 < len(block) <= 2 * self.block_size for block in self.ids),
+            'heights': self.maxes == [block[-1] for block in self.ids if block],
+            'sizes': (self._size == len(ids)
+                      and [len(block) for block in self.ids] == [len(block) for block in self.blocks]
+                      and all(task.task_id == task_id for task_id, task in zip(ids, self.iter_tasks()))),
+        }
+        self._sorted = result['sorted']
+        self._balanced = result['balanced'] and result['heights'] and result['sizes']
+        return result
@@ -1,4 +1,6 @@
-from datetime import datetime
+import sys
+import time
+from datetime import date, datetime
 from enum import Enum
 
 
@@ -9,6 +11,41 @@ class Priority(Enum):
     ALTA = 3
 
 
+# Valor numérico de cada nombre de prioridad
+PRIORITY_VALUES = {priority.name: priority.value for priority in Priority}
+
+# Nombres de prioridad internados: todas las tareas comparten el mismo objeto str
+_PRIORITY_NAMES = {priority.name: sys.intern(priority.name) for priority in Priority}
+
+# Distribución de bits de la clave entera de ordenamiento (ver Task.sort_key)
+_ID_BITS = 40
+_DATE_BITS = 22
+_ID_LIMIT = (1 << _ID_BITS) - 1
+_DATE_LIMIT = (1 << _DATE_BITS) - 1
+
+
+def parse_due_date(due_date):
+    """
+    Valida una fecha de vencimiento YYYY-MM-DD y la convierte a su ordinal.
+    Es la única validación de fechas del sistema (tareas, índice por fecha
+    y filtros del controlador); strptime se comporta igual en todas las
+    versiones de Python soportadas.
+
+    Args:
+        due_date (str): Fecha (YYYY-MM-DD)
+
+    Returns:
+        int: Ordinal del día (date.toordinal)
+
+    Raises:
+        ValueError: Si la fecha es inválida
+    """
+    try:
+        return datetime.strptime(due_date, "%Y-%m-%d").toordinal()
+    except (TypeError, ValueError):
+        raise ValueError(f"Formato de fecha inválido: {due_date!r}. Use YYYY-MM-DD") from None
+
+
 class Task:
     """
     Representa una tarea en el sistema de gestión.
@@ -20,8 +57,20 @@ class Task:
         priority_name (str): Nombre de la prioridad (Baja, Media, Alta)
         due_date (str): Fecha de vencimiento en formato YYYY-MM-DD
         created_at (datetime): Fecha y hora de creación
+
+    Representación compacta: la clase usa __slots__ (sin __dict__ por
+    instancia), los nombres de prioridad se comparten entre tareas y las
+    fechas se guardan como enteros (ordinal del día de vencimiento y
+    microsegundos desde la época de la creación). due_date y created_at se
+    convierten a str/datetime solo al leerlos.
+
+    La fecha de vencimiento se valida y se convierte a ordinal una sola vez,
+    al asignarla. La clave de ordenamiento (sort_key) no se guarda: se arma
+    con desplazamientos a partir de la prioridad y el ordinal al pedirla.
     """
 
+    __slots__ = ('task_id', 'description', '_priority', '_priority_name', '_due_ordinal', '_created_us')
+
     def __init__(self, task_id, description, priority_name, due_date):
         """
         Inicializa una nueva tarea.
@@ -31,13 +80,99 @@ class Task:
             description (str): Descripción de la tarea
             priority_name (str): Prioridad ('BAJA', 'MEDIA', 'ALTA')
             due_date (str): Fecha de vencimiento (YYYY-MM-DD)
+
+        Raises:
+            ValueError: Si la fecha de vencimiento no es YYYY-MM-DD
         """
         self.task_id = task_id
         self.description = description
         self.priority_name = priority_name.upper()
-        self.priority = self._get_priority_value(self.priority_name)
-        self.due_date = due_date
-        self.created_at = datetime.now()
+        self._priority = self._get_priority_value(self.priority_name)
+        self._due_ordinal = parse_due_date(due_date)
+        self._created_us = time.time_ns() // 1000
+
+    @property
+    def priority(self):
+        """Prioridad numérica (1=Baja, 2=Media, 3=Alta)"""
+        return self._priority
+
+    @priority.setter
+    def priority(self, value):
+        self._priority = value
+
+    @property
+    def priority_name(self):
+        """Nombre de la prioridad"""
+        return self._priority_name
+
+    @priority_name.setter
+    def priority_name(self, value):
+        self._priority_name = _PRIORITY_NAMES.get(value, value)
+
+    @property
+    def due_date(self):
+        """Fecha de vencimiento como texto YYYY-MM-DD"""
+        return date.fromordinal(self._due_ordinal).isoformat()
+
+    @due_date.setter
+    def due_date(self, value):
+        # Lanza ValueError si la fecha es inválida, sin modificar la tarea
+        self._due_ordinal = parse_due_date(value)
+
+    @property
+    def due_ordinal(self):
+        """Fecha de vencimiento como ordinal del día (date.toordinal)"""
+        return self._due_ordinal
+
+    @property
+    def sort_key(self):
+        """
+        Orden de la tarea codificado en un único entero: a mayor clave, mayor
+        prioridad en el max-heap.
+
+        Los bits más significativos guardan la prioridad, los siguientes la
+        fecha de vencimiento invertida (la fecha más cercana produce una clave
+        mayor) y los menos significativos el ID invertido (a igualdad, gana el
+        ID menor).
+        Complejidad: O(1)
+
+        Raises:
+            ValueError: Si el ID está fuera de rango
+        """
+        if not 0 <= self.task_id <= _ID_LIMIT:
+            raise ValueError(f"ID fuera de rango para la clave del heap: {self.task_id}")
+        return ((self._priority << (_DATE_BITS + _ID_BITS))
+                | ((_DATE_LIMIT - self._due_ordinal) << _ID_BITS)
+                | (_ID_LIMIT - self.task_id))
+
+    @property
+    def created_us(self):
+        """Marca de creación en microsegundos desde la época"""
+        return self._created_us
+
+    @property
+    def created_at(self):
+        """Fecha y hora de creación"""
+        seconds, micros = divmod(self._created_us, 1_000_000)
+        return datetime.fromtimestamp(seconds).replace(microsecond=micros)
+
+    def with_id(self, task_id):
+        """
+        Retorna una copia de la tarea con otro ID (mismos datos y misma
+        fecha de creación). La tarea original no se modifica, así que las
+        referencias existentes (por ejemplo, instantáneas del AVL) no cambian.
+
+        Args:
+            task_id (int): ID de la copia
+
+        Returns:
+            Task: Nueva tarea
+        """
+        copy = Task.__new__(Task)
+        for slot in Task.__slots__:
+            setattr(copy, slot, getattr(self, slot))
+        copy.task_id = task_id
+        return copy
 
     def _get_priority_value(self, priority_name):
         """
@@ -49,12 +184,7 @@ class Task:
         Returns:
             int: Valor numérico de la prioridad (1, 2, o 3)
         """
-        priority_map = {
-            'BAJA': Priority.BAJA.value,
-            'MEDIA': Priority.MEDIA.value,
-            'ALTA': Priority.ALTA.value
-        }
-        return priority_map.get(priority_name, Priority.MEDIA.value)
+        return PRIORITY_VALUES.get(priority_name, Priority.MEDIA.value)
 
     def __str__(self):
         """Representación en string de la tarea"""
@@ -78,10 +208,10 @@ class Task:
         if not isinstance(other, Task):
             return NotImplemented
 
-        if self.priority != other.priority:
-            return self.priority > other.priority  # Mayor prioridad primero
+        if self._priority != other._priority:
+            return self._priority > other._priority  # Mayor prioridad primero
 
-        return self.due_date < other.due_date  # Fecha más cercana primero
+        return self._due_ordinal < other._due_ordinal  # Fecha más cercana primero
 
     def __gt__(self, other):
         """
@@ -93,11 +223,11 @@ class Task:
         if not isinstance(other, Task):
             return NotImplemented
 
-        if self.priority != other.priority:
-            return self.priority > other.priority
+        if self._priority != other._priority:
+            return self._priority > other._priority
 
         # Si tienen la misma prioridad, la fecha más cercana es "mayor" (más urgente)
-        return self.due_date < other.due_date
+        return self._due_ordinal < other._due_ordinal
 
     def __le__(self, other):
         """Menor o igual que"""
@@ -0,0 +1,225 @@
+from array import array
+from collections import Counter
+from datetime import date
+
+from src.models.task import Priority
+
+try:
+    import numpy as np
+except ImportError:  # NumPy es opcional: sin él se usan bucles sobre los arreglos
+    np = None
+
+
+class TaskStore:
+    """
+    Almacén columnar de tareas para estadísticas y filtros sobre todas las
+    tareas. Guarda una fila por tarea en arreglos tipados paralelos (módulo
+    array): ID, prioridad, ordinal de la fecha de vencimiento y marca de
+    creación (microsegundos desde la época), además de un mapa ID -> fila.
+
+    Los conteos, histogramas y filtros recorren los arreglos en bloque: con
+    NumPy (opcional, use_numpy=None lo detecta) se operan como vectores sin
+    copiar los datos; sin NumPy se usan array.count, Counter y bucles sobre
+    las columnas, sin tocar los objetos Task.
+
+    Las eliminaciones mueven la última fila al hueco, por lo que el orden de
+    las filas no es significativo.
+    """
+
+    def __init__(self, use_numpy=None):
+        if use_numpy and np is None:
+            raise ValueError("NumPy no está instalado")
+
+        self.use_numpy = np is not None if use_numpy is None else use_numpy
+        self.ids = array('q')  # ID de cada fila
+        self.priorities = array('b')  # Prioridad numérica (1, 2, 3)
+        self.due = array('i')  # Ordinal de la fecha de vencimiento
+        self.created = array('q')  # Creación en microsegundos desde la época
+        self.row_of = {}  # task_id -> fila
+
+    @classmethod
+    def from_tasks(cls, tasks, use_numpy=None):
+        """
+        Construye el almacén a partir de una colección de tareas.
+        Complejidad: O(n)
+
+        Raises:
+            ValueError: Si hay IDs repetidos
+        """
+        store = cls(use_numpy=use_numpy)
+        for task in tasks:
+            store.add(task)
+        return store
+
+    def _columns(self):
+        """Retorna las columnas en un orden fijo"""
+        return self.ids, self.priorities, self.due, self.created
+
+    def add(self, task):
+        """
+        Agrega una fila para la tarea.
+        Complejidad: O(1) amortizado
+
+        Raises:
+            ValueError: Si la tarea ya está en el almacén
+        """
+        if task.task_id in self.row_of:
+            raise ValueError(f"La tarea con ID {task.task_id} ya está en el almacén")
+
+        self.row_of[task.task_id] = len(self.ids)
+        self.ids.append(task.task_id)
+        self.priorities.append(task.priority)
+        self.due.append(task.due_ordinal)
+        self.created.append(task.created_us)
+
+    def remove(self, task_id):
+        """
+        Elimina la fila de una tarea, ocupando su lugar con la última fila.
+        Complejidad: O(1)
+
+        Returns:
+            bool: True si la tarea estaba en el almacén
+        """
+        row = self.row_of.pop(task_id, None)
+        if row is None:
+            return False
+
+        last = len(self.ids) - 1
+        if row != last:
+            for column in self._columns():
+                column[row] = column[last]
+            self.row_of[self.ids[row]] = row
+        for column in self._columns():
+            column.pop()
+        return True
+
+    def remove_many(self, task_ids):
+        """
+        Elimina un lote de filas.
+        Complejidad: O(k)
+        """
+        for task_id in task_ids:
+            self.remove(task_id)
+
+    def update(self, task):
+        """
+        Actualiza la prioridad y la fecha de una tarea ya almacenada.
+        Complejidad: O(1)
+
+        Returns:
+            bool: True si la tarea estaba en el almacén
+        """
+        row = self.row_of.get(task.task_id)
+        if row is None:
+            return False
+
+        self.priorities[row] = task.priority
+        self.due[row] = task.due_ordinal
+        return True
+
+    def size(self):
+        """Retorna el número de filas"""
+        return len(self.ids)
+
+    def _vector(self, column):
+        """Vista NumPy (sin copia) de una columna"""
+        return np.frombuffer(column, dtype=f'i{column.itemsize}')
+
+    def count_by_priority(self):
+        """
+        Cuenta las tareas de cada prioridad.
+        Complejidad: O(n) en bloque
+
+        Returns:
+            dict: Nombre de la prioridad -> número de tareas
+        """
+        if self.use_numpy:
+            counts = np.bincount(self._vector(self.priorities), minlength=len(Priority) + 1)
+            return {priority.name: int(counts[priority.value]) for priority in Priority}
+        return {priority.name: self.priorities.count(priority.value) for priority in Priority}
+
+    def due_histogram(self, width=1):
+        """
+        Histograma de fechas de vencimiento en intervalos de width días.
+
+        Args:
+            width (int): Días por intervalo (1 = conteo por día)
+
+        Returns:
+            dict: Fecha de inicio del intervalo (YYYY-MM-DD) -> número de
+                tareas, ordenado por fecha
+
+        Raises:
+            ValueError: Si width no es positivo
+
+        Complejidad: O(n) en bloque + O(b log b) para b intervalos
+        """
+        if width < 1:
+            raise ValueError("El ancho del intervalo debe ser positivo")
+
+        if self.use_numpy:
+            starts, counts = np.unique(self._vector(self.due) // width * width, return_counts=True)
+            histogram = zip(starts.tolist(), counts.tolist())
+        elif width == 1:
+            histogram = sorted(Counter(self.due).items())
+        else:
+            histogram = sorted(Counter(day // width * width for day in self.due).items())
+
+        return {date.fromordinal(start).isoformat(): count for start, count in histogram}
+
+    def _mask(self, priority, due_from, due_to):
+        """
+        Filtro booleano (conjunción) sobre las columnas.
+
+        Returns:
+            Máscara NumPy, o lista de filas que cumplen el filtro sin NumPy
+        """
+        if self.use_numpy:
+            mask = np.ones(len(self.ids), dtype=bool)
+            if priority is not None:
+                mask &= self._vector(self.priorities) == priority
+            if due_from is not None:
+                mask &= self._vector(self.due) >= due_from
+            if due_to is not None:
+                mask &= self._vector(self.due) <= due_to
+            return mask
+
+        rows = range(len(self.ids))
+        if priority is not None:
+            rows = [row for row in rows if self.priorities[row] == priority]
+        if due_from is not None:
+            rows = [row for row in rows if self.due[row] >= due_from]
+        if due_to is not None:
+            rows = [row for row in rows if self.due[row] <= due_to]
+        return rows
+
+    def select_ids(self, priority=None, due_from=None, due_to=None):
+        """
+        Retorna los IDs de las tareas que cumplen todas las condiciones
+        indicadas (las que son None se ignoran).
+
+        Args:
+            priority (int): Prioridad numérica exacta
+            due_from (int): Ordinal mínimo de la fecha de vencimiento (inclusive)
+            due_to (int): Ordinal máximo de la fecha de vencimiento (inclusive)
+
+        Returns:
+            list: IDs en el orden de las filas
+
+        Complejidad: O(n) en bloque
+        """
+        mask = self._mask(priority, due_from, due_to)
+        if self.use_numpy:
+            return self._vector(self.ids)[mask].tolist()
+        return [self.ids[row] for row in mask]
+
+    def count(self, priority=None, due_from=None, due_to=None):
+        """
+        Cuenta las tareas que cumplen todas las condiciones indicadas (ver
+        select_ids), sin construir la lista de IDs.
+        Complejidad: O(n) en bloque
+        """
+        mask = self._mask(priority, due_from, due_to)
+        if self.use_numpy:
+            return int(np.count_nonzero(mask))
+        return len(mask)
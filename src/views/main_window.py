@@ -363,13 +363,7 @@ class MainWindow:
                 messagebox.showwarning("Advertencia", "Por favor ingrese una fecha de vencimiento")
                 return
 
-            try:
-                datetime.strptime(due_date, "%Y-%m-%d")
-            except ValueError:
-                messagebox.showerror("Error", "Formato de fecha inválido. Use YYYY-MM-DD")
-                return
-
-            # Agregar tarea
+            # Agregar tarea (el modelo valida el formato de la fecha)
             task = self.controller.add_task(description, priority, due_date)
 
             # Limpiar campos
@@ -490,9 +484,10 @@ class MainWindow:
         self.heap_viz_textbox.insert("end", "Donde: A=Alta, M=Media, B=Baja\n")
         self.heap_viz_textbox.configure(state="disabled")
 
-        # Actualizar recorridos del AVL Tree
-        traversals = self.controller.get_avl_traversals()
-        avl_stats = self.controller.get_avl_stats()
+        # Actualizar recorridos del AVL Tree (desde una misma instantánea)
+        snapshot = self.controller.get_avl_snapshot()
+        traversals = self.controller.get_avl_traversals(snapshot)
+        avl_stats = self.controller.get_avl_stats(snapshot)
 
         self.avl_traversals_textbox.configure(state="normal")
         self.avl_traversals_textbox.delete("1.0", "end")
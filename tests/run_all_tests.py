@@ -2,8 +2,13 @@ import sys
 import os
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
+from tests.test_task import run_all_tests as test_task
 from tests.test_max_heap import run_all_tests as test_heap
+from tests.test_bucket_queue import run_all_tests as test_buckets
 from tests.test_avl_tree import run_all_tests as test_avl
+from tests.test_sorted_block_index import run_all_tests as test_blocks
+from tests.test_task_store import run_all_tests as test_store
+from tests.test_task_controller import run_all_tests as test_controller
 
 
 def main():
@@ -12,22 +17,52 @@ def main():
     print(" SUITE COMPLETA DE PRUEBAS - SISTEMA DE GESTIÓN DE TAREAS")
     print("="*70)
 
+    # Ejecutar pruebas de Task
+    task_passed = test_task()
+
+    print("\n")
+
     # Ejecutar pruebas del MaxHeap
     heap_passed = test_heap()
 
     print("\n")
 
+    # Ejecutar pruebas del BucketQueue
+    buckets_passed = test_buckets()
+
+    print("\n")
+
     # Ejecutar pruebas del AVL Tree
     avl_passed = test_avl()
 
+    print("\n")
+
+    # Ejecutar pruebas del SortedBlockIndex
+    blocks_passed = test_blocks()
+
+    print("\n")
+
+    # Ejecutar pruebas del TaskStore
+    store_passed = test_store()
+
+    print("\n")
+
+    # Ejecutar pruebas del TaskController
+    controller_passed = test_controller()
+
     # Resumen final
     print("\n" + "="*70)
     print(" RESUMEN FINAL")
     print("="*70)
+    print(f"Task: {'✓ PASADO' if task_passed else '✗ FALLADO'}")
     print(f"Max-Heap: {'✓ PASADO' if heap_passed else '✗ FALLADO'}")
+    print(f"Bucket Queue: {'✓ PASADO' if buckets_passed else '✗ FALLADO'}")
     print(f"AVL Tree: {'✓ PASADO' if avl_passed else '✗ FALLADO'}")
+    print(f"Sorted Block Index: {'✓ PASADO' if blocks_passed else '✗ FALLADO'}")
+    print(f"Task Store: {'✓ PASADO' if store_passed else '✗ FALLADO'}")
+    print(f"TaskController: {'✓ PASADO' if controller_passed else '✗ FALLADO'}")
 
-    if heap_passed and avl_passed:
+    if task_passed and heap_passed and buckets_passed and avl_passed and blocks_passed and store_passed and controller_passed:
         print("\nTODAS LAS PRUEBAS PASARON EXITOSAMENTE")
         print("="*70)
         return 0
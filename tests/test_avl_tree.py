@@ -2,9 +2,10 @@ import sys
 import os
 import time
 import math
+import random
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
-from src.models.avl_tree import AVLTree
+from src.models.avl_tree import AVLTree, OPERATION_FORMATS
 from src.models.task import Task
 
 """
@@ -241,6 +242,419 @@ def test_search_performance_complexity():
     print(f"✓ Complejidad verificada: O(log n)")
 
 
+def _check_structure(node, low=None, high=None):
+    """Verifica recursivamente orden BST, alturas y balance; retorna la altura"""
+    if not node:
+        return 0
+
+    task_id = node.task.task_id
+    assert low is None or task_id > low, "Orden BST violado"
+    assert high is None or task_id < high, "Orden BST violado"
+
+    left_height = _check_structure(node.left, low, task_id)
+    right_height = _check_structure(node.right, task_id, high)
+    assert node.height == 1 + max(left_height, right_height), f"Altura incorrecta en ID {task_id}"
+    left_size = node.left.size if node.left else 0
+    right_size = node.right.size if node.right else 0
+    assert node.size == 1 + left_size + right_size, f"Tamaño de subárbol incorrecto en ID {task_id}"
+    assert abs(left_height - right_height) <= 1, f"Nodo desbalanceado en ID {task_id}"
+    return node.height
+
+
+def test_random_operations_and_traversals():
+    """Prueba de inserciones y eliminaciones aleatorias contra un conjunto de referencia"""
+    print("\n=== Test 7: Operaciones aleatorias y recorridos ===")
+
+    def preorder(node):
+        return [node.task.task_id] + preorder(node.left) + preorder(node.right) if node else []
+
+    def postorder(node):
+        return postorder(node.left) + postorder(node.right) + [node.task.task_id] if node else []
+
+    rng = random.Random(7)
+    tree = AVLTree()
+    expected = set()
+
+    for _ in range(2000):
+        task_id = rng.randint(1, 300)
+        if rng.random() < 0.6:
+            tree.insert(Task(task_id, f"Tarea {task_id}", "MEDIA", "2024-12-31"))
+            expected.add(task_id)
+        else:
+            tree.delete(task_id)
+            expected.discard(task_id)
+
+        _check_structure(tree.root)
+
+    assert tree.get_inorder() == sorted(expected), "El inorden debe coincidir con el conjunto"
+    assert tree.size() == len(expected), "El tamaño debe coincidir con el conjunto"
+    assert tree.get_preorder() == preorder(tree.root), "Preorden incorrecto"
+    assert tree.get_postorder() == postorder(tree.root), "Postorden incorrecto"
+    assert tree.is_balanced() and tree.is_inorder_sorted(), "El árbol debería ser un AVL válido"
+
+    for task_id in range(1, 301):
+        found = tree.search(task_id)
+        assert (found is not None) == (task_id in expected), f"Búsqueda incorrecta para {task_id}"
+
+    print(f"Tareas finales: {tree.size()}, altura: {tree.root.height if tree.root else 0}")
+    print("✓ Test 7 pasado exitosamente")
+
+
+def test_from_sorted():
+    """Prueba de construcción balanceada a partir de tareas ordenadas por ID"""
+    print("\n=== Test 8: Construcción masiva desde lista ordenada ===")
+
+    for n in [0, 1, 2, 3, 10, 100, 1023, 1024]:
+        tasks = [Task(i * 2, f"Tarea {i}", "MEDIA", "2024-12-31") for i in range(n)]
+        tree = AVLTree.from_sorted(tasks)
+
+        _check_structure(tree.root)
+        assert tree.get_inorder() == [t.task_id for t in tasks], "Inorden incorrecto"
+        assert tree.size() == n, f"Debería tener {n} nodos"
+
+        # El árbol construido sigue siendo un AVL operable
+        tree.insert(Task(-1, "Nueva", "ALTA", "2024-12-31"))
+        tree.delete(0)
+        _check_structure(tree.root)
+
+    try:
+        AVLTree.from_sorted([Task(2, "A", "MEDIA", "2024-12-31"), Task(1, "B", "MEDIA", "2024-12-31")])
+        assert False, "Una lista desordenada debería lanzar ValueError"
+    except ValueError:
+        pass
+
+    print("✓ Test 8 pasado exitosamente")
+
+
+def test_delete_many():
+    """Prueba de eliminación por lote contra un conjunto de referencia"""
+    print("\n=== Test 9: Eliminación por lote ===")
+
+    rng = random.Random(11)
+    for n, k in [(1, 1), (50, 5), (500, 50), (500, 400), (1000, 1000), (1000, 300)]:
+        tree = AVLTree()
+        ids = list(range(1, n + 1))
+        rng.shuffle(ids)
+        for task_id in ids:
+            tree.insert(Task(task_id, f"Tarea {task_id}", "MEDIA", "2024-12-31"))
+
+        # Lote con IDs concentrados en un lado, dispersos e inexistentes
+        to_delete = set(rng.sample(range(1, n + 1), k))
+        to_delete.update(range(1, min(n, k) // 2 + 1))
+        tree.delete_many(list(to_delete) + [n + 10])
+
+        _check_structure(tree.root)
+        expected = [i for i in range(1, n + 1) if i not in to_delete]
+        assert tree.get_inorder() == expected, f"Inorden incorrecto tras lote (n={n}, k={k})"
+
+    # Vaciar casi todo un lado de un árbol grande: los subárboles se unen
+    # por diferencia de alturas, sin reconstruirlos
+    n = 1 << 15
+    tree = AVLTree.from_sorted((Task(i, f"Tarea {i}", "MEDIA", "2024-12-31") for i in range(n)), validate=True)
+    tree.delete_many(i for i in range(n) if i < n // 2 + 1000 and i % 97)
+    _check_structure(tree.root)
+    assert all(tree.verify().values()), "El árbol debe cumplir sus invariantes tras el lote"
+    assert tree.size() == n - (n // 2 + 1000) + len(range(0, n // 2 + 1000, 97)), "Tamaño incorrecto tras el lote"
+
+    tree.delete_many([])
+    print("✓ Test 9 pasado exitosamente")
+
+
+def test_rank_and_select():
+    """Prueba de estadísticos de orden: rank, select y size en O(1)"""
+    print("\n=== Test 10: Rank y select ===")
+
+    rng = random.Random(13)
+    tree = AVLTree()
+    ids = rng.sample(range(1, 2000), 400)
+    for task_id in ids:
+        tree.insert(Task(task_id, f"Tarea {task_id}", "MEDIA", "2024-12-31"))
+    tree.delete_many(ids[:50])
+    for task_id in ids[50:80]:
+        tree.delete(task_id)
+
+    expected = sorted(ids[80:])
+    _check_structure(tree.root)
+    assert tree.size() == len(expected) == tree._count_nodes(tree.root), "size() debe ser exacto"
+
+    for k, task_id in enumerate(expected):
+        assert tree.select(k).task_id == task_id, f"select({k}) incorrecto"
+        assert tree.rank(task_id) == k, f"rank({task_id}) incorrecto"
+
+    assert tree.rank(0) == 0 and tree.rank(5000) == len(expected), "rank fuera del rango de IDs"
+    missing = next(i for i in range(expected[10], 2000) if i not in expected)
+    assert tree.rank(missing) == sum(1 for i in expected if i < missing), \
+        "rank de un ID inexistente cuenta los IDs menores"
+    assert tree.select(-1) is None and tree.select(len(expected)) is None, "select fuera de rango"
+
+    print("✓ Test 10 pasado exitosamente")
+
+
+def test_range_iterators():
+    """Prueba de iteradores perezosos con rango de IDs"""
+    print("\n=== Test 11: Iteradores por rango de IDs ===")
+
+    def preorder(node):
+        return [node.task.task_id] + preorder(node.left) + preorder(node.right) if node else []
+
+    def postorder(node):
+        return postorder(node.left) + postorder(node.right) + [node.task.task_id] if node else []
+
+    rng = random.Random(17)
+    tree = AVLTree()
+    ids = rng.sample(range(0, 1000, 3), 200)
+    for task_id in ids:
+        tree.insert(Task(task_id, f"Tarea {task_id}", "MEDIA", "2024-12-31"))
+
+    full_pre, full_post = preorder(tree.root), postorder(tree.root)
+    assert tree.get_preorder() == full_pre and tree.get_postorder() == full_post, "Recorridos completos"
+
+    for lo, hi in [(None, None), (100, 400), (None, 250), (600, None), (301, 302), (2000, 3000), (500, 100)]:
+        def in_range(i):
+            return (lo is None or i >= lo) and (hi is None or i <= hi)
+
+        assert list(tree.iter_inorder(lo, hi)) == sorted(i for i in ids if in_range(i)), \
+            f"Inorden incorrecto en [{lo}, {hi}]"
+        assert [t.task_id for t in tree.iter_tasks(lo, hi)] == list(tree.iter_inorder(lo, hi)), \
+            "iter_tasks debe coincidir con iter_inorder"
+        assert list(tree.iter_preorder(lo, hi)) == [i for i in full_pre if in_range(i)], \
+            f"Preorden incorrecto en [{lo}, {hi}]"
+        assert list(tree.iter_postorder(lo, hi)) == [i for i in full_post if in_range(i)], \
+            f"Postorden incorrecto en [{lo}, {hi}]"
+
+    assert list(AVLTree().iter_postorder()) == [], "Un árbol vacío no genera IDs"
+
+    print("✓ Test 11 pasado exitosamente")
+
+
+class FullPathTree(AVLTree):
+    """AVLTree que rebalancea todo el camino de cada inserción (sin corte temprano)"""
+
+    def _rebalance_insert_path(self, path):
+        return self._rebalance_path(path)
+
+
+def test_sequential_ingest():
+    """Prueba de inserción de IDs crecientes con corte temprano del rebalanceo"""
+    print("\n=== Test 12: Inserción de IDs crecientes ===")
+
+    fast = AVLTree()
+    general = FullPathTree()
+    for i in range(1, 1001):
+        for tree in (fast, general):
+            tree.insert(Task(i, f"Tarea {i}", "MEDIA", "2024-12-31"))
+
+    _check_structure(fast.root)
+    assert fast.get_preorder() == general.get_preorder(), "El corte temprano debe producir el mismo árbol"
+
+    # Eliminar el máximo y mezclar inserciones no crecientes
+    for task_id in [1000, 999, 500]:
+        fast.delete(task_id)
+    fast.delete_many([998, 997])
+    fast.insert(Task(998, "Reinsertada", "ALTA", "2024-12-31"))
+    fast.insert(Task(500, "Reinsertada", "ALTA", "2024-12-31"))
+    for i in range(1001, 1101):
+        fast.insert(Task(i, f"Tarea {i}", "MEDIA", "2024-12-31"))
+
+    _check_structure(fast.root)
+    expected = [i for i in range(1, 1101) if i not in (1000, 999, 997)]
+    assert fast.get_inorder() == expected, "Inorden incorrecto tras mezclar operaciones"
+    assert fast.root.height <= 1.45 * math.log2(len(expected) + 2), "La altura debe ser logarítmica"
+
+    print("✓ Test 12 pasado exitosamente")
+
+
+def test_operation_log():
+    """Prueba del registro circular de operaciones"""
+    print("\n=== Test 13: Registro de operaciones acotado ===")
+
+    tree = AVLTree(log_capacity=5)
+    for i in range(1, 4):
+        tree.insert(Task(i, f"Tarea {i}", "MEDIA", "2024-12-31"))
+    tree.delete(2)
+
+    assert tree.get_recent_operations(10) == [
+        "Insercion ID:1", "Insercion ID:2", "Insercion ID:3",
+        "Rotacion Izquierda en nodo ID:1", "Eliminacion ID:2"], "Operaciones registradas incorrectas"
+
+    for i in range(4, 104):
+        tree.insert(Task(i, f"Tarea {i}", "MEDIA", "2024-12-31"))
+    assert len(tree.operations) == 5, "El registro no debe superar su capacidad"
+    assert "Insercion ID:103" in tree.get_recent_operations(5), "Debe conservar lo más reciente"
+    assert "Insercion ID:3" not in tree.get_recent_operations(5), "Debe descartar lo más antiguo"
+    op_code, task_id, timestamp = tree.get_recent_events(5)[-1]
+    assert op_code in OPERATION_FORMATS and timestamp > 0, "Los eventos guardan código y marca de tiempo"
+
+    quiet = AVLTree(log_operations=False)
+    for i in range(1, 50):
+        quiet.insert(Task(i, f"Tarea {i}", "MEDIA", "2024-12-31"))
+    assert quiet.get_recent_operations() == [], "Con el registro apagado no se guarda nada"
+
+    print("✓ Test 13 pasado exitosamente")
+
+
+def test_split_and_join():
+    """Prueba de división y unión de árboles por ID"""
+    print("\n=== Test 14: Split y join ===")
+
+    rng = random.Random(19)
+    for n in [0, 1, 2, 10, 100, 777]:
+        ids = rng.sample(range(1, 5 * n + 2), n)
+        for key in [0, 1, n, 2 * n, 5 * n + 5] + rng.sample(range(1, 5 * n + 2), min(n, 5)):
+            tree = AVLTree()
+            for task_id in ids:
+                tree.insert(Task(task_id, f"Tarea {task_id}", "MEDIA", "2024-12-31"))
+
+            left, right = tree.split(key)
+            assert tree.is_empty(), "El árbol original debe quedar vacío"
+            _check_structure(left.root)
+            _check_structure(right.root)
+            assert left.get_inorder() == sorted(i for i in ids if i < key), f"Mitad izquierda incorrecta ({key})"
+            assert right.get_inorder() == sorted(i for i in ids if i >= key), f"Mitad derecha incorrecta ({key})"
+
+            joined = AVLTree.join(left, right)
+            _check_structure(joined.root)
+            assert joined.get_inorder() == sorted(ids), "La unión debe recuperar todos los IDs"
+            assert left.is_empty() and right.is_empty(), "Los árboles unidos deben quedar vacíos"
+
+            # El árbol unido sigue siendo operable
+            joined.insert(Task(10 * n + 10, "Nueva", "ALTA", "2024-12-31"))
+            _check_structure(joined.root)
+
+    # Unión de árboles de alturas muy distintas
+    big = AVLTree.from_sorted([Task(i, f"Tarea {i}", "MEDIA", "2024-12-31") for i in range(1000)])
+    small = AVLTree.from_sorted([Task(i, f"Tarea {i}", "MEDIA", "2024-12-31") for i in range(2000, 2003)])
+    joined = AVLTree.join(big, small)
+    _check_structure(joined.root)
+    assert joined.size() == 1003 and joined.select(1000).task_id == 2000, "Unión asimétrica incorrecta"
+
+    # El registro de operaciones sobrevive a split y join
+    left, right = joined.split(500)
+    assert right.get_recent_operations(1) == ["Division en ID:500"], "El árbol derecho hereda el registro"
+    assert not left.operations and not joined.operations, "Los demás árboles quedan sin registro"
+    joined = AVLTree.join(left, right)
+    events = joined.get_recent_events(100)
+    assert joined.get_recent_operations(1) == ["Union: 1003 tareas"], "La unión se registra en el árbol nuevo"
+    assert "Division en ID:500" in joined.get_recent_operations(100), "La unión conserva los registros previos"
+    assert [t for _, _, t in events] == sorted(t for _, _, t in events), "Los eventos siguen en orden temporal"
+
+    try:
+        overlap = AVLTree.from_sorted([Task(5, "A", "MEDIA", "2024-12-31")])
+        AVLTree.join(overlap, AVLTree.from_sorted([Task(3, "B", "MEDIA", "2024-12-31")]))
+        assert False, "Rangos solapados deberían lanzar ValueError"
+    except ValueError:
+        pass
+
+    print("✓ Test 14 pasado exitosamente")
+
+
+def test_snapshots():
+    """Prueba de instantáneas persistentes con copia de caminos"""
+    print("\n=== Test 15: Instantáneas persistentes ===")
+
+    tree = AVLTree()
+    for i in range(1, 101):
+        tree.insert(Task(i, f"Tarea {i}", "MEDIA", "2024-12-31"))
+
+    snapshot = tree.snapshot()
+    original_root = tree.root
+
+    # Modificar el árbol no altera la instantánea
+    tree.insert(Task(50, "Reemplazada", "ALTA", "2024-01-01"))
+    for i in range(1, 101, 3):
+        tree.delete(i)
+    tree.delete_many(range(60, 70))
+    for i in range(101, 151):
+        tree.insert(Task(i, f"Tarea {i}", "BAJA", "2024-12-31"))
+
+    assert snapshot.root is original_root, "La instantánea conserva su raíz"
+    assert snapshot.get_inorder() == list(range(1, 101)), "La instantánea no debe cambiar"
+    assert snapshot.search(50).description == "Tarea 50", "La instantánea conserva las tareas originales"
+    assert snapshot.size() == 100 and snapshot.is_balanced(), "Las estadísticas de la instantánea se conservan"
+    _check_structure(snapshot.root)
+    _check_structure(tree.root)
+
+    expected = [i for i in range(1, 151) if (i > 100 or i % 3 != 1) and not 60 <= i < 70]
+    assert tree.get_inorder() == expected, "El árbol debe reflejar las modificaciones"
+    assert tree.search(50).description == "Reemplazada", "El árbol debe tener la tarea nueva"
+
+    # Modificar la instantánea tampoco altera el árbol ni instantáneas previas
+    second = snapshot.snapshot()
+    snapshot.delete(1)
+    assert second.search(1) and not snapshot.search(1) and tree.search(2), "Las versiones son independientes"
+
+    # Al liberar las instantáneas el árbol deja de copiar nodos
+    assert tree._persistent, "Con instantáneas vivas el árbol copia en escritura"
+    del snapshot, second
+    assert not tree._persistent, "Sin instantáneas vivas no hay nodos compartidos"
+    root = tree.root
+    tree.insert(Task(root.task.task_id, "Sin copia", "ALTA", "2024-12-31"))
+    assert tree.root is root, "La modificación debe hacerse en el lugar"
+
+    # Secuencia aleatoria con instantáneas intermedias
+    rng = random.Random(23)
+    tree = AVLTree()
+    live = set()
+    versions = []
+    for step in range(2000):
+        task_id = rng.randint(1, 300)
+        if rng.random() < 0.6:
+            tree.insert(Task(task_id, f"Tarea {task_id}", "MEDIA", "2024-12-31"))
+            live.add(task_id)
+        else:
+            tree.delete(task_id)
+            live.discard(task_id)
+        if step % 200 == 0:
+            versions.append((tree.snapshot(), sorted(live)))
+
+    for version, ids in versions:
+        assert version.get_inorder() == ids, "Cada instantánea debe conservar su estado"
+        _check_structure(version.root)
+    assert tree.get_inorder() == sorted(live), "El árbol final debe ser correcto"
+
+    print("✓ Test 15 pasado exitosamente")
+
+
+def test_validated_mode():
+    """Prueba del modo validado con invariantes incrementales"""
+    print("\n=== Test 16: Modo validado ===")
+
+    rng = random.Random(29)
+    tree = AVLTree(validate=True)
+    for step in range(3000):
+        task_id = rng.randint(1, 500)
+        if rng.random() < 0.6:
+            tree.insert(Task(task_id, f"Tarea {task_id}", "MEDIA", "2024-12-31"))
+        else:
+            tree.delete(task_id)
+    tree.delete_many(rng.sample(range(1, 501), 100))
+    left, right = tree.split(250)
+    tree = AVLTree.join(left, right)
+
+    assert tree.validate, "Las operaciones en bloque conservan el modo validado"
+    assert tree.is_balanced() and tree.is_inorder_sorted(), "Sin violaciones en un AVL correcto"
+    assert tree.verify() == {'sorted': True, 'balanced': True, 'heights': True, 'sizes': True}, \
+        "La verificación completa debe coincidir"
+
+    built = AVLTree.from_sorted([Task(i, f"Tarea {i}", "MEDIA", "2024-12-31") for i in range(1, 64)],
+                                validate=True)
+    assert built.validate and built.is_balanced(), "from_sorted acepta opciones del constructor"
+
+    # Corromper el orden: se detecta al rebalancear el nodo afectado
+    built.root.left.task = Task(1000, "Corrupta", "MEDIA", "2024-12-31")
+    assert built.is_inorder_sorted(), "Sin rebalancear, la corrupción aún no se detecta"
+    built.delete(built.root.left.left.task.task_id)
+    assert not built.is_inorder_sorted(), "El rebalanceo del camino debe detectar la corrupción"
+
+    # verify() recalcula el estado completo
+    result = built.verify()
+    assert not result['sorted'] and result['balanced'], f"Verificación incorrecta: {result}"
+    built.root.left.task = Task(16, "Reparada", "MEDIA", "2024-12-31")
+    assert built.verify()['sorted'] and built.is_inorder_sorted(), "verify() reinicia los contadores"
+
+    print("✓ Test 16 pasado exitosamente")
+
+
 def run_all_tests():
     """Ejecuta todas las pruebas del AVL Tree"""
     print("\n" + "="*60)
@@ -254,6 +668,16 @@ def run_all_tests():
         test_inorder_traversal()
         test_update_existing()
         test_search_performance_complexity()
+        test_random_operations_and_traversals()
+        test_from_sorted()
+        test_delete_many()
+        test_rank_and_select()
+        test_range_iterators()
+        test_sequential_ingest()
+        test_operation_log()
+        test_split_and_join()
+        test_snapshots()
+        test_validated_mode()
 
         print("\n" + "="*60)
         print("✓ TODAS LAS PRUEBAS DE AVL TREE PASARON EXITOSAMENTE")
@@ -0,0 +1,111 @@
+import sys
+import os
+import random
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.models.bucket_queue import BucketQueue
+from src.models.max_heap import MaxHeap
+from src.models.task import Task
+
+"""
+Casos de prueba para BucketQueue.
+Verifica que la cola por cubetas se comporte igual que el MaxHeap con claves.
+"""
+PRIORITIES = ["BAJA", "MEDIA", "ALTA"]
+
+
+def _random_task(rng, task_id):
+    due_date = f"2024-{rng.randint(1, 12):02d}-{rng.randint(1, 28):02d}"
+    return Task(task_id, f"Tarea {task_id}", rng.choice(PRIORITIES), due_date)
+
+
+def test_same_order_as_heap():
+    """Prueba de orden: las cubetas extraen en el mismo orden que el heap"""
+    print("\n=== Test 1: Mismo orden que MaxHeap ===")
+
+    rng = random.Random(3)
+    tasks = [_random_task(rng, i) for i in range(1, 301)]
+
+    queue = BucketQueue()
+    heap = MaxHeap(indexed=True, keyed=True)
+    for task in tasks:
+        queue.insert(task)
+        heap.insert(task)
+
+    assert queue.size() == 300 and queue.peek() is heap.peek(), "Tamaño o tope incorrecto"
+
+    for task_id in [5, 77, 150, 299]:
+        assert queue.remove(task_id) and heap.remove(task_id), f"Debería eliminar {task_id}"
+    assert not queue.remove(5), "No debería eliminar dos veces la misma tarea"
+    assert not queue.contains(5) and queue.contains(6), "Pertenencia incorrecta"
+
+    top = queue.extract_top(20)
+    assert [t.task_id for t in top] == [t.task_id for t in heap.extract_top(20)], \
+        "extract_top debería coincidir con el heap"
+
+    while not heap.is_empty():
+        assert queue.extract_max() is heap.extract_max(), "El orden de extracción difiere"
+
+    assert queue.is_empty() and queue.extract_max() is None and queue.peek() is None, \
+        "La cola debería quedar vacía"
+
+    print("✓ Test 1 pasado exitosamente")
+
+
+def test_update_and_bulk_load():
+    """Prueba de cambio de prioridad entre cubetas y carga masiva"""
+    print("\n=== Test 2: Actualización y carga masiva ===")
+
+    rng = random.Random(5)
+    tasks = [_random_task(rng, i) for i in range(1, 101)]
+    queue = BucketQueue.from_tasks(tasks)
+    assert queue.size() == 100, "Deberían cargarse todas las tareas"
+
+    # Mover una tarea BAJA a ALTA con la fecha más cercana
+    task = next(t for t in tasks if t.priority_name == "BAJA")
+    task.priority_name, task.priority, task.due_date = "ALTA", 3, "2023-01-01"
+    assert queue.update_key(task.task_id), "Debería actualizar la tarea"
+    assert queue.peek() is task, "La tarea actualizada debería ser la prioritaria"
+    assert queue.get(task.task_id) is task and queue.size() == 100, "La tarea no debe duplicarse"
+
+    # Una fecha inválida se rechaza al asignarla: ni la tarea ni la cola cambian
+    try:
+        task.due_date = "sin-fecha"
+        assert False, "Una fecha inválida debería lanzar ValueError"
+    except ValueError:
+        pass
+    assert task.due_date == "2023-01-01", "La tarea no debe modificarse"
+    assert queue.size() == 100 and queue.contains(task.task_id), "La cola no debe modificarse"
+
+    try:
+        BucketQueue.from_tasks(tasks[:2] + tasks[:1])
+        assert False, "IDs repetidos deberían lanzar ValueError"
+    except ValueError:
+        pass
+
+    print("✓ Test 2 pasado exitosamente")
+
+
+def run_all_tests():
+    """Ejecuta todas las pruebas del BucketQueue"""
+    print("\n" + "="*60)
+    print("EJECUTANDO PRUEBAS DE BUCKET QUEUE")
+    print("="*60)
+
+    try:
+        test_same_order_as_heap()
+        test_update_and_bulk_load()
+
+        print("\n" + "="*60)
+        print("✓ TODAS LAS PRUEBAS DE BUCKET QUEUE PASARON EXITOSAMENTE")
+        print("="*60)
+
+    except AssertionError as e:
+        print(f"\n✗ PRUEBA FALLIDA: {e}")
+        return False
+
+    return True
+
+
+if __name__ == "__main__":
+    run_all_tests()
@@ -138,6 +138,289 @@ def test_peek():
     print("✓ Test 4 pasado exitosamente")
 
 
+def test_indexed_remove():
+    """Prueba del modo indexado: posiciones sincronizadas y eliminación por ID"""
+    print("\n=== Test 5: Heap indexado por ID ===")
+
+    heap = MaxHeap(indexed=True)
+
+    priorities = ["BAJA", "MEDIA", "ALTA"]
+    for i in range(1, 51):
+        heap.insert(Task(i, f"Tarea {i}", priorities[i % 3], f"2024-12-{(i % 28) + 1:02d}"))
+
+    def check_positions():
+        assert len(heap.positions) == heap.size(), "El mapa debe tener una entrada por tarea"
+        for index, task in enumerate(heap.heap):
+            assert heap.positions[task.task_id] == index, \
+                f"Posición desincronizada para la tarea {task.task_id}"
+
+    check_positions()
+
+    # Eliminar por ID, incluyendo la raíz y la última posición
+    for task_id in [heap.peek().task_id, heap.heap[-1].task_id, 7, 23, 42]:
+        assert heap.contains(task_id), f"La tarea {task_id} debería estar en el heap"
+        assert heap.remove(task_id), f"Debería eliminar la tarea {task_id}"
+        assert not heap.contains(task_id), f"La tarea {task_id} no debería estar"
+        check_positions()
+
+    assert not heap.remove(999), "No debería eliminar una tarea inexistente"
+    assert heap.get(10).task_id == 10, "get debería retornar la tarea por ID"
+
+    # La extracción mantiene el orden y el mapa sincronizado
+    previous = heap.extract_max()
+    while not heap.is_empty():
+        current = heap.extract_max()
+        assert not current > previous, "El orden de extracción se rompió"
+        previous = current
+        check_positions()
+
+    print("✓ Test 5 pasado exitosamente")
+
+
+def test_keyed_order():
+    """Prueba del modo con claves: mismo orden que las comparaciones de Task"""
+    print("\n=== Test 6: Heap con claves enteras precalculadas ===")
+
+    plain = MaxHeap()
+    keyed = MaxHeap(indexed=True, keyed=True)
+
+    priorities = ["BAJA", "MEDIA", "ALTA"]
+    for i in range(1, 101):
+        task = Task(i, f"Tarea {i}", priorities[(i * 7) % 3], f"2024-{(i % 12) + 1:02d}-{(i % 28) + 1:02d}")
+        plain.insert(task)
+        keyed.insert(task)
+
+    # Claves consistentes con Task.__gt__
+    high = Task(1, "Alta", "ALTA", "2024-12-31")
+    low = Task(2, "Media", "MEDIA", "2024-01-01")
+    soon = Task(3, "Media pronto", "MEDIA", "2023-12-31")
+    assert soon.sort_key > low.sort_key, "La fecha más cercana debe dar mayor clave"
+    assert high.sort_key > soon.sort_key, "La prioridad domina sobre la fecha"
+
+    keyed.remove(50)
+    plain.remove(50)
+    assert keyed.keys == [t.sort_key for t in keyed.heap], "Claves desincronizadas"
+
+    while not plain.is_empty():
+        expected = plain.extract_max()
+        actual = keyed.extract_max()
+        assert (actual.priority, actual.due_date) == (expected.priority, expected.due_date), \
+            "El heap con claves debe extraer en el mismo orden"
+
+    assert keyed.is_empty() and keyed.keys == [], "El heap con claves debería quedar vacío"
+
+    try:
+        keyed.insert(Task(1, "Fecha inválida", "ALTA", "31/12/2024"))
+        assert False, "Una fecha inválida debería lanzar ValueError"
+    except ValueError:
+        pass
+    assert keyed.size() == 0, "Una inserción fallida no debe modificar el heap"
+
+    print("✓ Test 6 pasado exitosamente")
+
+
+def test_from_tasks():
+    """Prueba de construcción masiva con heapify de abajo hacia arriba"""
+    print("\n=== Test 7: Construcción masiva (Floyd) ===")
+
+    priorities = ["BAJA", "MEDIA", "ALTA"]
+    tasks = [Task(i, f"Tarea {i}", priorities[(i * 5) % 3], f"2024-{(i % 12) + 1:02d}-10")
+             for i in range(1, 201)]
+
+    for options in [{}, {"indexed": True, "keyed": True}]:
+        heap = MaxHeap.from_tasks(tasks, **options)
+        assert heap.size() == len(tasks), "Deberían cargarse todas las tareas"
+
+        # Verificar la propiedad del heap en cada nodo
+        for i in range(1, heap.size()):
+            assert not heap.heap[i] > heap.heap[(i - 1) // 2], "Propiedad del heap violada"
+
+        if heap.indexed:
+            assert all(heap.positions[t.task_id] == i for i, t in enumerate(heap.heap)), \
+                "Posiciones desincronizadas"
+            assert heap.keys == [t.sort_key for t in heap.heap], "Claves desincronizadas"
+
+        previous = heap.extract_max()
+        while not heap.is_empty():
+            current = heap.extract_max()
+            assert not current > previous, "El orden de extracción se rompió"
+            previous = current
+
+    try:
+        MaxHeap.from_tasks(tasks + [tasks[0]], indexed=True)
+        assert False, "IDs repetidos deberían lanzar ValueError"
+    except ValueError:
+        pass
+
+    assert MaxHeap.from_tasks([]).is_empty(), "Heap vacío a partir de lista vacía"
+
+    print("✓ Test 7 pasado exitosamente")
+
+
+def test_update_key():
+    """Prueba de aumento y disminución de clave desde la posición actual"""
+    print("\n=== Test 8: Actualización de clave ===")
+
+    for options in [{}, {"indexed": True, "keyed": True}]:
+        heap = MaxHeap(**options)
+        tasks = [Task(i, f"Tarea {i}", "MEDIA", f"2024-06-{i:02d}") for i in range(1, 21)]
+        for task in tasks:
+            heap.insert(task)
+
+        # Aumentar: la tarea 15 pasa a ALTA y debe quedar en la raíz
+        tasks[14].priority_name, tasks[14].priority = "ALTA", 3
+        assert heap.update_key(15), "Debería actualizar una tarea existente"
+        assert heap.peek().task_id == 15, "La tarea con mayor prioridad debería subir a la raíz"
+
+        # Disminuir: la raíz pasa a BAJA y debe bajar
+        tasks[14].priority_name, tasks[14].priority = "BAJA", 1
+        heap.update_key(15)
+        assert heap.peek().task_id == 1, "La tarea con menor prioridad debería bajar"
+
+        # Cambiar la fecha
+        tasks[9].due_date = "2024-01-01"
+        heap.update_key(10)
+        assert heap.peek().task_id == 10, "La fecha más cercana debería subir a la raíz"
+
+        assert not heap.update_key(999), "No debería actualizar una tarea inexistente"
+
+        # Sustituir por otra versión de la tarea sin modificar la original
+        copy = Task(5, "Copia", "ALTA", "2023-12-31")
+        assert heap.replace(copy) and heap.peek() is copy, "La copia más urgente debería subir a la raíz"
+        assert tasks[4].priority == 2, "La versión anterior no debe modificarse"
+        assert not heap.replace(Task(999, "Ausente", "ALTA", "2024-01-01")), "Sin esa tarea no hay sustitución"
+        heap.extract_max()
+
+        order = [heap.extract_max().task_id for _ in range(heap.size())]
+        assert order[0] == 10 and order[-1] == 15, "Orden de extracción incorrecto tras actualizar"
+
+    print("✓ Test 8 pasado exitosamente")
+
+
+def test_lazy_deletion():
+    """Prueba del modo perezoso: tombstones, tamaño exacto y compactación"""
+    print("\n=== Test 9: Eliminación perezosa con compactación ===")
+
+    for options in [{"lazy": True}, {"lazy": True, "indexed": True, "keyed": True}]:
+        heap = MaxHeap(compact_threshold=0.5, **options)
+        tasks = [Task(i, f"Tarea {i}", ["BAJA", "MEDIA", "ALTA"][i % 3], f"2024-03-{i % 28 + 1:02d}")
+                 for i in range(1, 41)]
+        for task in tasks:
+            heap.insert(task)
+
+        # Eliminar la raíz y otras tareas sin reestructurar
+        root_id = heap.peek().task_id
+        removed = [root_id, 3, 6, 9]
+        for task_id in removed:
+            assert heap.remove(task_id), f"Debería eliminar la tarea {task_id}"
+        assert not heap.remove(3), "Una tarea eliminada no se puede eliminar otra vez"
+        assert len(heap.heap) == 40 and heap.size() == 36, "Las entradas quedan marcadas, no quitadas"
+        assert not heap.contains(3) and heap.get(3) is None, "Una tarea eliminada no debe encontrarse"
+        assert heap.peek().task_id != root_id, "peek debe saltar las entradas eliminadas"
+
+        # Mostrar el heap no debe compactarlo
+        stored = len(heap.heap)
+        shown = heap.get_heap_representation()
+        levels = heap.get_heap_levels()
+        assert len(heap.heap) == stored and heap.dead, "Las vistas no deben compactar el heap"
+        assert shown.count("(") == 36 and "(3:" not in shown, "La representación omite las eliminadas"
+        assert sum(len(level) for level in levels) == 36, "Los niveles omiten las eliminadas"
+
+        # Reinsertar un ID eliminado
+        heap.insert(tasks[8])
+        assert heap.contains(9) and heap.size() == 37, "Debería poder reinsertarse un ID eliminado"
+
+        # Superar el umbral provoca la compactación
+        alive = {t.task_id for t in heap.get_all_tasks()}
+        for task_id in range(10, 31):
+            heap.remove(task_id)
+            alive.discard(task_id)
+        assert len(heap.dead) <= 0.5 * len(heap.heap), "Debería compactar al superar el umbral"
+        assert heap.size() == len(alive), "El tamaño debe ser exacto"
+
+        order = heap.extract_top(100)
+        assert {t.task_id for t in order} == alive and len(order) == len(alive), \
+            "Solo deberían extraerse las tareas vivas"
+        assert all(not order[i + 1] > order[i] for i in range(len(order) - 1)), "Orden incorrecto"
+        assert heap.is_empty() and heap.extract_max() is None, "El heap debería quedar vacío"
+
+    print("✓ Test 9 pasado exitosamente")
+
+
+def test_arity():
+    """Prueba de heaps d-arios: propiedad del heap y niveles para varias aridades"""
+    print("\n=== Test 10: Aridad configurable ===")
+
+    tasks = [Task(i, f"Tarea {i}", ["BAJA", "MEDIA", "ALTA"][(i * 7) % 3], f"2024-{i % 12 + 1:02d}-05")
+             for i in range(1, 151)]
+
+    for arity in [2, 3, 4, 8]:
+        for options in [{}, {"indexed": True, "keyed": True}]:
+            heap = MaxHeap(arity=arity, **options)
+            for task in tasks[:100]:
+                heap.insert(task)
+            bulk = MaxHeap.from_tasks(tasks, arity=arity, **options)
+
+            for h in (heap, bulk):
+                for i in range(1, h.size()):
+                    assert not h.heap[i] > h.heap[(i - 1) // arity], \
+                        f"Propiedad del heap violada con aridad {arity}"
+
+            levels = heap.get_heap_levels()
+            assert [len(level) for level in levels[:-1]] == [arity ** l for l in range(len(levels) - 1)], \
+                f"Niveles incorrectos con aridad {arity}"
+            assert sum(len(level) for level in levels) == heap.size(), "Los niveles deben cubrir el heap"
+
+            heap.remove(50)
+            previous = heap.extract_max()
+            while not heap.is_empty():
+                current = heap.extract_max()
+                assert not current > previous, f"Orden de extracción incorrecto con aridad {arity}"
+                previous = current
+
+    try:
+        MaxHeap(arity=1)
+        assert False, "Una aridad menor que 2 debería lanzar ValueError"
+    except ValueError:
+        pass
+
+    print("✓ Test 10 pasado exitosamente")
+
+
+def test_iter_sorted():
+    """Prueba de iteración ordenada sin modificar el heap"""
+    print("\n=== Test 11: Iteración en orden de prioridad ===")
+
+    tasks = [Task(i, f"Tarea {i}", ["BAJA", "MEDIA", "ALTA"][(i * 5) % 3], f"2024-{i % 12 + 1:02d}-{i % 28 + 1:02d}")
+             for i in range(1, 121)]
+
+    for options in [{}, {"indexed": True, "keyed": True, "arity": 4}, {"keyed": True, "lazy": True}]:
+        heap = MaxHeap.from_tasks(tasks, **options)
+        heap.remove(17)
+        heap.remove(60)
+        snapshot = list(heap.heap)
+
+        top = []
+        for task in heap.iter_sorted():
+            top.append(task)
+            if len(top) == 10:
+                break
+
+        ordered = list(heap.iter_sorted())
+        assert heap.heap == snapshot, "La iteración no debe modificar el heap"
+        assert ordered[:10] == top, "Las primeras tareas deben coincidir"
+        assert len(ordered) == heap.size() and not {17, 60} & {t.task_id for t in ordered}, \
+            "Solo deben generarse las tareas vivas"
+
+        extracted = [heap.extract_max() for _ in range(heap.size())]
+        assert [(t.priority, t.due_date) for t in ordered] == [(t.priority, t.due_date) for t in extracted], \
+            "El orden debe coincidir con el de extracción"
+
+    assert list(MaxHeap().iter_sorted()) == [], "Un heap vacío no genera tareas"
+
+    print("✓ Test 11 pasado exitosamente")
+
+
 def run_all_tests():
     """Ejecuta todas las pruebas del MaxHeap"""
     print("\n" + "="*60)
@@ -149,6 +432,13 @@ def run_all_tests():
         test_heap_property()
         test_remove_specific_task()
         test_peek()
+        test_indexed_remove()
+        test_keyed_order()
+        test_from_tasks()
+        test_update_key()
+        test_lazy_deletion()
+        test_arity()
+        test_iter_sorted()
 
         print("\n" + "="*60)
         print("✓ TODAS LAS PRUEBAS DE MAX-HEAP PASARON EXITOSAMENTE")
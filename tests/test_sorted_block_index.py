@@ -0,0 +1,138 @@
+import sys
+import os
+import random
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.models.sorted_block_index import SortedBlockIndex
+from src.models.avl_tree import AVLTree
+from src.models.id_index import IdIndex
+from src.models.task import Task
+
+"""
+Casos de prueba para SortedBlockIndex.
+Verifica que la lista ordenada por bloques se comporte igual que el AVLTree.
+"""
+
+
+def _task(task_id):
+    return Task(task_id, f"Tarea {task_id}", "MEDIA", "2024-12-31")
+
+
+def test_same_results_as_avl():
+    """Prueba de equivalencia: mismas respuestas que el AVL con operaciones aleatorias"""
+    print("\n=== Test 1: Mismos resultados que AVLTree ===")
+
+    # La interfaz es abstracta: un índice incompleto falla al construirse
+    class PartialIndex(IdIndex):
+        def search(self, task_id):
+            return None
+
+    try:
+        PartialIndex()
+        assert False, "Un índice incompleto debería lanzar TypeError al construirse"
+    except TypeError:
+        pass
+    assert isinstance(SortedBlockIndex(), IdIndex) and isinstance(AVLTree(), IdIndex), \
+        "Ambos índices implementan la interfaz completa"
+
+    rng = random.Random(31)
+    for block_size in [1, 4, 64]:
+        index = SortedBlockIndex(block_size=block_size)
+        tree = AVLTree()
+        for step in range(2000):
+            task_id = rng.randint(1, 400)
+            if rng.random() < 0.6:
+                task = _task(task_id)
+                index.insert(task)
+                tree.insert(task)
+            else:
+                index.delete(task_id)
+                tree.delete(task_id)
+
+        ids = rng.sample(range(1, 401), 50)
+        index.delete_many(ids)
+        tree.delete_many(ids)
+
+        assert all(index.verify().values()), f"Invariantes rotos con block_size={block_size}"
+        assert index.get_inorder() == tree.get_inorder(), "El orden por ID debe coincidir"
+        assert index.size() == tree.size(), "El tamaño debe coincidir"
+        assert list(index.iter_inorder(100, 200)) == list(tree.iter_inorder(100, 200)), "Rango incorrecto"
+        for task_id in range(0, 402, 7):
+            assert index.search(task_id) is tree.search(task_id), f"Búsqueda distinta para {task_id}"
+            assert index.rank(task_id) == tree.rank(task_id), f"Rank distinto para {task_id}"
+        for k in range(0, tree.size() + 2, 5):
+            expected = tree.select(k)
+            assert index.select(k) is expected, f"Select distinto para {k}"
+
+    # Los recorridos son los del árbol balanceado implícito
+    tasks = [_task(i) for i in range(1, 100, 2)]
+    index = SortedBlockIndex.from_sorted(tasks, block_size=8)
+    tree = AVLTree.from_sorted(tasks)
+    assert index.get_preorder() == tree.get_preorder(), "Preorden del árbol implícito incorrecto"
+    assert index.get_postorder() == tree.get_postorder(), "Postorden del árbol implícito incorrecto"
+    assert list(index.iter_preorder(20, 60)) == list(tree.iter_preorder(20, 60)), "Preorden por rango incorrecto"
+    assert index.height() == tree.height() and index.is_balanced(), "Altura del árbol implícito incorrecta"
+
+    try:
+        SortedBlockIndex(block_size=0)
+        assert False, "Un bloque vacío debería lanzar ValueError"
+    except ValueError:
+        pass
+
+    print("✓ Test 1 pasado exitosamente")
+
+
+def test_split_join_and_snapshots():
+    """Prueba de división, unión e instantáneas con copia de bloques"""
+    print("\n=== Test 2: Split, join e instantáneas ===")
+
+    index = SortedBlockIndex.from_sorted([_task(i) for i in range(1, 501)], block_size=16)
+    snapshot = index.snapshot()
+
+    left, right = index.split(200)
+    assert index.is_empty(), "El índice original debe quedar vacío"
+    assert left.get_inorder() == list(range(1, 200)), "Mitad izquierda incorrecta"
+    assert right.get_inorder() == list(range(200, 501)), "Mitad derecha incorrecta"
+
+    joined = SortedBlockIndex.join(left, right)
+    for task_id in range(1, 501, 4):
+        joined.delete(task_id)
+    joined.insert(Task(250, "Reemplazada", "ALTA", "2024-01-01"))
+    assert all(joined.verify().values()), "El índice unido debe ser válido"
+
+    assert snapshot.get_inorder() == list(range(1, 501)), "La instantánea no debe cambiar"
+    assert snapshot.search(250).description == "Tarea 250", "La instantánea conserva las tareas originales"
+    assert joined.search(250).description == "Reemplazada", "El índice debe tener la tarea nueva"
+
+    try:
+        SortedBlockIndex.join(SortedBlockIndex.from_sorted([_task(5)]), SortedBlockIndex.from_sorted([_task(3)]))
+        assert False, "Rangos solapados deberían lanzar ValueError"
+    except ValueError:
+        pass
+
+    print("✓ Test 2 pasado exitosamente")
+
+
+def run_all_tests():
+    """Ejecuta todas las pruebas del SortedBlockIndex"""
+    print("\n" + "="*60)
+    print("EJECUTANDO PRUEBAS DE SORTED BLOCK INDEX")
+    print("="*60)
+
+    try:
+        test_same_results_as_avl()
+        test_split_join_and_snapshots()
+
+        print("\n" + "="*60)
+        print("✓ TODAS LAS PRUEBAS DE SORTED BLOCK INDEX PASARON EXITOSAMENTE")
+        print("="*60)
+
+    except AssertionError as e:
+        print(f"\n✗ PRUEBA FALLIDA: {e}")
+        return False
+
+    return True
+
+
+if __name__ == "__main__":
+    run_all_tests()
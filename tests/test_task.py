@@ -0,0 +1,102 @@
+import sys
+import os
+from datetime import date, datetime
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.models.task import Task
+
+"""
+Casos de prueba para Task.
+Verifica la representación compacta de las tareas.
+"""
+
+
+def test_compact_representation():
+    """Prueba de la representación compacta (__slots__, fechas enteras)"""
+    print("\n=== Test 1: Representación compacta de Task ===")
+
+    before = datetime.now().replace(microsecond=0)
+    task = Task(1, "Revisar informe", "alta", "2024-03-09")
+    other = Task(2, "Otra", "".join(["AL", "TA"]), "2024-03-10")
+
+    assert not hasattr(task, "__dict__"), "Task no debe tener __dict__ por instancia"
+    assert len(Task.__slots__) == 6, "Task no debe guardar atributos derivados (como la clave de ordenamiento)"
+    assert task.priority_name == "ALTA" and task.priority == 3, "La prioridad debe normalizarse"
+    assert task.priority_name is other.priority_name, "Los nombres de prioridad deben estar internados"
+    assert task.due_date == "2024-03-09", "La fecha debe leerse como texto YYYY-MM-DD"
+    assert isinstance(task.created_at, datetime) and task.created_at >= before, "created_at debe ser un datetime"
+    assert task.to_dict()['due_date'] == "2024-03-09", "to_dict debe usar las fechas como texto"
+    assert task > other and not other > task, "A igual prioridad, la fecha más cercana es más urgente"
+
+    task.due_date = "2024-12-31"
+    assert task.due_date == "2024-12-31", "La fecha debe poder cambiarse"
+    for bad in ["31/12/2024", "2024-02-30", "sin-fecha", "20241210", "2024-W50-1", None]:
+        try:
+            task.due_date = bad
+            assert False, f"La fecha {bad} debería lanzar ValueError"
+        except ValueError:
+            pass
+    assert task.due_date == "2024-12-31", "Una fecha inválida no debe modificar la tarea"
+    task.due_date = "2024-1-5"
+    assert task.due_date == "2024-01-05", "Se aceptan mes y día sin ceros a la izquierda"
+
+    print("✓ Test 1 pasado exitosamente")
+
+
+def test_due_ordinal_and_sort_key():
+    """Prueba del ordinal de fecha precalculado y de la clave de ordenamiento"""
+    print("\n=== Test 2: Ordinal de fecha y clave de ordenamiento ===")
+
+    task = Task(7, "Tarea", "MEDIA", "2024-05-01")
+    assert task.due_ordinal == date(2024, 5, 1).toordinal(), "El ordinal debe calcularse al construir"
+
+    sooner = Task(8, "Antes", "MEDIA", "2024-04-30")
+    higher = Task(9, "Alta", "ALTA", "2025-01-01")
+    same_day = Task(6, "Mismo día", "MEDIA", "2024-05-01")
+    assert higher.sort_key > sooner.sort_key > task.sort_key, "Prioridad, luego fecha más cercana"
+    assert same_day.sort_key > task.sort_key, "A igualdad, gana el ID menor"
+
+    # La clave sigue a los cambios de prioridad y fecha
+    task.priority = 3
+    task.due_date = "2024-01-01"
+    assert task.sort_key > higher.sort_key, "La clave debe reflejar la nueva prioridad y fecha"
+    assert task.sort_key == Task(7, "Copia", "ALTA", "2024-01-01").sort_key, "La clave debe coincidir"
+
+    try:
+        Task(10, "Fecha inválida", "BAJA", "2024/01/01")
+        assert False, "Una fecha inválida debería lanzar ValueError al construir"
+    except ValueError:
+        pass
+
+    try:
+        Task(-1, "ID negativo", "BAJA", "2024-01-01").sort_key
+        assert False, "Un ID fuera de rango debería lanzar ValueError"
+    except ValueError:
+        pass
+
+    print("✓ Test 2 pasado exitosamente")
+
+
+def run_all_tests():
+    """Ejecuta todas las pruebas de Task"""
+    print("\n" + "="*60)
+    print("EJECUTANDO PRUEBAS DE TASK")
+    print("="*60)
+
+    try:
+        test_compact_representation()
+        test_due_ordinal_and_sort_key()
+
+        print("\n" + "="*60)
+        print("✓ TODAS LAS PRUEBAS DE TASK PASARON EXITOSAMENTE")
+        print("="*60)
+
+    except AssertionError as e:
+        print(f"\n✗ PRUEBA FALLIDA: {e}")
+        return False
+
+    return True
+
+
+if __name__ == "__main__":
+    run_all_tests()
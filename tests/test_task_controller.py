@@ -0,0 +1,583 @@
+import sys
+import os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.controllers.task_controller import TaskController
+from src.models.task import Task
+
+"""
+Casos de prueba para TaskController.
+Verifica que el heap y el árbol AVL se mantengan sincronizados.
+"""
+def _check_sync(controller):
+    """Verifica que el heap y el AVL contengan exactamente las mismas tareas"""
+    heap_ids = sorted(t.task_id for t in controller.get_all_tasks_by_priority())
+    avl_ids = [t.task_id for t in controller.get_all_tasks_by_id()]
+    assert heap_ids == avl_ids, "El heap y el AVL deberían contener las mismas tareas"
+    due_ids = sorted(t.task_id for t in controller.tasks_due_between("0001-01-01", "9999-12-31"))
+    assert due_ids == avl_ids, "El índice por fecha debería contener las mismas tareas"
+    due_index = controller.due_index
+    assert due_index.days == sorted(due_index.ids_by_day), "Los días del índice por fecha deberían estar ordenados"
+    assert all(ids == sorted(ids) and ids for ids in due_index.ids_by_day.values()), \
+        "Cada día debería tener sus IDs ordenados y no estar vacío"
+    assert all(due_index.day_of[task.task_id] == task.due_ordinal for task in controller.get_all_tasks_by_id()), \
+        "El índice por fecha debería registrar la fecha actual de cada tarea"
+    assert sorted(controller.tasks_by_id) == avl_ids, "El mapa de IDs debería contener las mismas tareas"
+    store = controller.task_store
+    assert sorted(store.ids) == avl_ids, "El almacén columnar debería contener las mismas tareas"
+    for task in controller.get_all_tasks_by_id():
+        row = store.row_of[task.task_id]
+        assert (store.priorities[row], store.due[row]) == (task.priority, task.due_ordinal), \
+            "Las columnas deberían reflejar la prioridad y la fecha actuales"
+    assert controller.verify_statistics(), "Los contadores de estadísticas deberían ser consistentes"
+    assert controller.avl_tree.is_balanced(), "El AVL debería estar balanceado"
+    assert all(controller.avl_tree.verify().values()), "El AVL debería cumplir todos sus invariantes"
+
+
+def test_load_tasks():
+    """Prueba de carga masiva de tareas"""
+    print("\n=== Test 1: Carga masiva de tareas ===")
+
+    controller = TaskController()
+    controller.add_task("Existente", "BAJA", "2024-12-20")
+
+    priorities = ["BAJA", "MEDIA", "ALTA"]
+    tasks = [Task(i, f"Tarea {i}", priorities[i % 3], f"2024-12-{(i % 28) + 1:02d}")
+             for i in range(10, 1010)]
+
+    loaded = controller.load_tasks(tasks)
+    assert loaded == 1000, "Deberían cargarse 1000 tareas"
+    assert controller.get_task_count() == 1001, "Deberían existir 1001 tareas"
+    _check_sync(controller)
+
+    # Los nuevos IDs no deben chocar con los cargados
+    task = controller.add_task("Nueva", "ALTA", "2024-11-30")
+    assert task.task_id == 1010, "El siguiente ID debería continuar tras el mayor cargado"
+    assert controller.search_task_by_id(500).task_id == 500, "Debería encontrar una tarea cargada"
+    assert [t.task_id for t in controller.get_tasks_by_position(100, 5)] == [109, 110, 111, 112, 113], \
+        "La página por posición debería seguir el orden por ID"
+    assert controller.get_task_position(109) == 100 and controller.get_task_position(5) is None, \
+        "La posición debería corresponder al orden por ID"
+    assert controller.get_highest_priority_task().task_id == 1010, "La nueva tarea es la más urgente"
+
+    # IDs repetidos: error sin modificar el estado
+    try:
+        controller.load_tasks([Task(500, "Repetida", "ALTA", "2024-12-01")])
+        assert False, "Un ID repetido debería lanzar ValueError"
+    except ValueError:
+        pass
+    assert controller.get_task_count() == 1002, "Una carga fallida no debe modificar el estado"
+    _check_sync(controller)
+
+    # Sin modo validado el AVL se mantiene igual de correcto
+    headless = TaskController(validate_index=False)
+    assert not headless.avl_tree.validate, "El AVL no debe crearse en modo validado"
+    headless.load_tasks(tasks)
+    assert not headless.avl_tree.validate, "La carga masiva respeta la opción"
+    headless.complete_n_highest_priority_tasks(100)
+    headless.delete_task_by_id(500)
+    _check_sync(headless)
+
+    print("✓ Test 1 pasado exitosamente")
+
+
+def test_complete_n_highest_priority_tasks():
+    """Prueba de completado de tareas por lote"""
+    print("\n=== Test 2: Completar las k tareas prioritarias ===")
+
+    batch = TaskController()
+    single = TaskController()
+    priorities = ["BAJA", "MEDIA", "ALTA"]
+    for i in range(200):
+        for controller in (batch, single):
+            controller.add_task(f"Tarea {i}", priorities[(i * 7) % 3], f"2024-{(i % 12) + 1:02d}-15")
+
+    completed = batch.complete_n_highest_priority_tasks(30)
+    expected = [single.complete_highest_priority_task() for _ in range(30)]
+    assert [t.task_id for t in completed] == [t.task_id for t in expected], \
+        "El lote debe completar las mismas tareas y en el mismo orden"
+    assert batch.get_task_count() == 170, "Deberían quedar 170 tareas"
+    _check_sync(batch)
+
+    # Pedir más tareas de las que hay vacía el sistema
+    remaining = batch.complete_n_highest_priority_tasks(1000)
+    assert len(remaining) == 170 and batch.is_empty(), "Deberían completarse todas las tareas"
+    assert batch.avl_tree.is_empty(), "El AVL debería quedar vacío"
+    assert batch.complete_n_highest_priority_tasks(5) == [], "Sin tareas retorna lista vacía"
+
+    print("✓ Test 2 pasado exitosamente")
+
+
+def test_update_task():
+    """Prueba de actualización en su lugar de prioridad y fecha"""
+    print("\n=== Test 3: Actualización de prioridad y fecha ===")
+
+    controller = TaskController()
+    for i in range(1, 21):
+        controller.add_task(f"Tarea {i}", "MEDIA", f"2024-06-{i:02d}")
+
+    root = controller.avl_tree.root
+    updated = controller.update_task(12, priority="alta")
+    assert updated.priority_name == "ALTA", "Debería cambiar la prioridad"
+    assert controller.get_highest_priority_task().task_id == 12, "La tarea 12 debería ser la prioritaria"
+    assert controller.avl_tree.root is root, "El AVL no debería reestructurarse"
+
+    controller.update_task(12, priority="BAJA", due_date="2024-01-01")
+    assert controller.get_highest_priority_task().task_id == 1, "La tarea 12 debería bajar"
+    assert controller.search_task_by_id(12).due_date == "2024-01-01", "Debería cambiar la fecha"
+
+    # Entradas inválidas no modifican la tarea
+    for kwargs in [{"priority": "URGENTE"}, {"priority": "ALTA", "due_date": "no-es-fecha"}]:
+        try:
+            controller.update_task(12, **kwargs)
+            assert False, "Una entrada inválida debería lanzar ValueError"
+        except ValueError:
+            pass
+        task = controller.search_task_by_id(12)
+        assert (task.priority_name, task.due_date) == ("BAJA", "2024-01-01"), \
+            "Una actualización fallida no debe modificar la tarea"
+
+    assert controller.update_task(999, priority="ALTA") is None, "Tarea inexistente retorna None"
+
+    order = [t.task_id for t in controller.complete_n_highest_priority_tasks(20)]
+    assert order[-1] == 12, "La tarea con prioridad BAJA debería completarse al final"
+    _check_sync(controller)
+
+    print("✓ Test 3 pasado exitosamente")
+
+
+def test_bucket_backend():
+    """Prueba del controlador con la cola por cubetas"""
+    print("\n=== Test 4: Controlador con cola por cubetas ===")
+
+    heap_controller = TaskController()
+    bucket_controller = TaskController(queue_backend='buckets')
+    priorities = ["BAJA", "MEDIA", "ALTA"]
+    for i in range(60):
+        for controller in (heap_controller, bucket_controller):
+            controller.add_task(f"Tarea {i}", priorities[(i * 5) % 3], f"2024-{(i % 12) + 1:02d}-20")
+
+    lazy_controller = TaskController(queue_backend='buckets', lazy_deletion=True)
+    for i in range(60):
+        lazy_controller.add_task(f"Tarea {i}", priorities[(i * 5) % 3], f"2024-{(i % 12) + 1:02d}-20")
+
+    for controller in (heap_controller, bucket_controller, lazy_controller):
+        controller.delete_task_by_id(10)
+        controller.update_task(20, priority="ALTA", due_date="2024-01-01")
+        _check_sync(controller)
+
+    assert bucket_controller.get_highest_priority_task().task_id == 20, "La tarea 20 debería ser la prioritaria"
+    assert [t.task_id for t in bucket_controller.iter_tasks_by_priority(limit=15)] == \
+        [t.task_id for t in heap_controller.iter_tasks_by_priority(limit=15)], \
+        "Ambas colas deberían listar la misma primera página"
+    expected = [t.task_id for t in heap_controller.complete_n_highest_priority_tasks(59)]
+    assert [t.task_id for t in bucket_controller.complete_n_highest_priority_tasks(59)] == expected, \
+        "Ambas colas deberían completar en el mismo orden"
+    assert [t.task_id for t in lazy_controller.complete_n_highest_priority_tasks(59)] == expected, \
+        "La eliminación perezosa no debe cambiar el orden"
+
+    try:
+        TaskController(queue_backend='lista')
+        assert False, "Una cola desconocida debería lanzar ValueError"
+    except ValueError:
+        pass
+
+    print("✓ Test 4 pasado exitosamente")
+
+
+def test_iter_tasks_by_id():
+    """Prueba de paginación por cursor sobre el índice por ID"""
+    print("\n=== Test 5: Paginación por cursor ===")
+
+    controller = TaskController()
+    for i in range(1, 101):
+        controller.add_task(f"Tarea {i}", "MEDIA", "2024-12-31")
+    controller.delete_task_by_id(51)
+
+    pages = []
+    cursor = None
+    while True:
+        page = list(controller.iter_tasks_by_id(start_after=cursor, limit=25))
+        if not page:
+            break
+        pages.append(page)
+        cursor = page[-1].task_id
+
+    assert [len(page) for page in pages] == [25, 25, 25, 24], "Tamaños de página incorrectos"
+    assert [t.task_id for page in pages for t in page] == [i for i in range(1, 101) if i != 51], \
+        "Las páginas deben cubrir todas las tareas en orden"
+    assert [t.task_id for t in controller.iter_tasks_by_id(start_after=51, limit=2)] == [52, 53], \
+        "Un cursor inexistente continúa desde el siguiente ID"
+
+    print("✓ Test 5 pasado exitosamente")
+
+
+def test_due_date_queries():
+    """Prueba del índice secundario por fecha de vencimiento"""
+    print("\n=== Test 6: Consultas por fecha de vencimiento ===")
+
+    controller = TaskController()
+    for i in range(1, 31):
+        controller.add_task(f"Tarea {i}", "MEDIA", f"2024-06-{i:02d}")
+        controller.add_task(f"Tarea {i}b", "ALTA", f"2024-06-{i:02d}")
+
+    week = controller.tasks_due_between("2024-06-10", "2024-06-16")
+    assert len(week) == 14, "Deberían vencer 14 tareas en la semana"
+    assert [t.due_date for t in week] == sorted(t.due_date for t in week), "Orden por fecha"
+
+    overdue = controller.overdue("2024-06-05")
+    assert [t.due_date for t in overdue] == ["2024-06-01"] * 2 + ["2024-06-02"] * 2 + \
+        ["2024-06-03"] * 2 + ["2024-06-04"] * 2, "Solo vencen las tareas anteriores a la fecha"
+
+    # Mantener el índice al completar, eliminar y actualizar
+    controller.complete_highest_priority_task()  # ALTA del 2024-06-01
+    controller.complete_n_highest_priority_tasks(2)  # ALTA del 2024-06-02 y 2024-06-03
+    controller.delete_task_by_id(1)  # MEDIA del 2024-06-01
+    controller.update_task(3, due_date="2024-07-15")  # MEDIA del 2024-06-02
+    _check_sync(controller)
+
+    counts = controller.count_due_by_day()
+    assert "2024-06-01" not in counts, "No deberían quedar tareas del 2024-06-01"
+    assert "2024-06-02" not in counts, "Los días sin tareas no deben aparecer"
+    assert counts["2024-06-03"] == 1 and counts["2024-07-15"] == 1, "Conteos por día incorrectos"
+    assert list(counts) == sorted(counts), "Los días deben estar ordenados"
+    assert sum(counts.values()) == controller.get_task_count(), "El conteo debe cubrir todas las tareas"
+
+    assert controller.tasks_due_between("2024-07-15", "2024-07-15")[0].task_id == 3, \
+        "La tarea actualizada debe indexarse con su nueva fecha"
+
+    for bad in ["20240715", "2024-W29-1"]:
+        try:
+            controller.tasks_due_between(bad, "2024-12-31")
+            assert False, f"La fecha {bad} debería lanzar ValueError"
+        except ValueError as e:
+            assert "YYYY-MM-DD" in str(e), "El error debe indicar el formato esperado"
+
+    controller.clear_all_tasks()
+    assert controller.count_due_by_day() == {} and controller.overdue("2030-01-01") == [], \
+        "Limpiar debe vaciar el índice"
+
+    print("✓ Test 6 pasado exitosamente")
+
+
+def test_archive_ids_below():
+    """Prueba de archivado masivo por ID"""
+    print("\n=== Test 7: Archivado de IDs menores a un umbral ===")
+
+    controller = TaskController()
+    priorities = ["BAJA", "MEDIA", "ALTA"]
+    for i in range(1, 201):
+        controller.add_task(f"Tarea {i}", priorities[i % 3], f"2024-{(i % 12) + 1:02d}-10")
+    controller.delete_task_by_id(50)
+
+    archived = controller.archive_ids_below(101)
+    assert [t.task_id for t in archived] == [i for i in range(1, 101) if i != 50], \
+        "Deberían archivarse los IDs menores a 101"
+    assert controller.get_task_count() == 100, "Deberían quedar 100 tareas"
+    assert controller.search_task_by_id(100) is None and controller.search_task_by_id(101), \
+        "El umbral es exclusivo"
+    operations = controller.get_avl_operations(200)
+    assert "Division en ID:101" in operations and "Insercion ID:200" in operations, \
+        "El registro de operaciones debe conservarse tras archivar"
+    _check_sync(controller)
+
+    assert controller.archive_ids_below(50) == [], "Sin tareas por debajo del umbral no se archiva nada"
+    task = controller.add_task("Nueva", "ALTA", "2024-01-01")
+    assert controller.get_highest_priority_task() is task, "El sistema sigue operando tras archivar"
+    _check_sync(controller)
+
+    print("✓ Test 7 pasado exitosamente")
+
+
+def test_merge():
+    """Prueba de unión de controladores con colisiones de ID"""
+    print("\n=== Test 8: Unión de controladores ===")
+
+    def build(count, first_date):
+        controller = TaskController()
+        for i in range(count):
+            controller.add_task(f"Tarea {i}", ["BAJA", "MEDIA", "ALTA"][i % 3], f"2024-{first_date + i % 3:02d}-15")
+        return controller
+
+    # Política 'remap': las colisiones reciben IDs nuevos al final
+    first = build(10, 1)
+    second = build(6, 4)
+    second.delete_task_by_id(2)
+    second.load_tasks([Task(20, "Importada", "ALTA", "2024-01-01")])
+    before = second.get_avl_snapshot()
+    original = second.search_task_by_id(3)
+
+    remapped = first.merge(second)
+    assert remapped == {1: 21, 3: 22, 4: 23, 5: 24, 6: 25}, f"Reasignación incorrecta: {remapped}"
+    assert first.get_task_count() == 16, "Deberían quedar todas las tareas"
+    assert second.is_empty(), "El controlador unido debe quedar vacío"
+    assert first.search_task_by_id(22).description == "Tarea 2", "La tarea reasignada conserva sus datos"
+    assert first.search_task_by_id(22).created_at == original.created_at, "La copia conserva la fecha de creación"
+    assert original.task_id == 3 and first.search_task_by_id(22) is not original, \
+        "Las tareas de other no deben renumerarse en su lugar"
+    assert before.get_inorder() == [1, 3, 4, 5, 6, 20] and before.verify()['sorted'], \
+        "Una instantánea previa de other no debe cambiar"
+    assert first.get_highest_priority_task().task_id == 20, "La tarea más urgente debe estar en el heap"
+    assert first.add_task("Siguiente", "BAJA", "2024-12-01").task_id == 26, "next_id debe continuar tras la unión"
+    _check_sync(first)
+
+    # Política 'skip': se conservan las tareas propias
+    first = build(5, 1)
+    second = build(8, 4)
+    assert first.merge(second, on_conflict='skip') == {}, "'skip' no reasigna IDs"
+    assert first.get_task_count() == 8 and first.search_task_by_id(3).due_date == "2024-03-15", \
+        "Las tareas propias tienen preferencia"
+    _check_sync(first)
+
+    # Política 'error': no se modifica ninguno de los dos controladores
+    first = build(3, 1)
+    second = build(3, 1)
+    try:
+        first.merge(second, on_conflict='error')
+        assert False, "Las colisiones deberían lanzar ValueError"
+    except ValueError:
+        pass
+    assert first.get_task_count() == 3 and second.get_task_count() == 3, "Nada debe cambiar tras el error"
+    _check_sync(second)
+
+    for args in [(first, 'replace'), (first, 'remap')]:
+        try:
+            args[0].merge(first, on_conflict=args[1])
+            assert False, "Debería lanzar ValueError"
+        except ValueError:
+            pass
+
+    print("✓ Test 8 pasado exitosamente")
+
+
+def test_avl_snapshot_reads():
+    """Prueba de lecturas consistentes del AVL mediante instantáneas"""
+    print("\n=== Test 9: Lecturas desde una instantánea del AVL ===")
+
+    controller = TaskController()
+    for i in range(20):
+        controller.add_task(f"Tarea {i}", "MEDIA", "2024-06-01")
+
+    snapshot = controller.get_avl_snapshot()
+    controller.complete_n_highest_priority_tasks(5)
+    controller.add_task("Nueva", "ALTA", "2024-01-01")
+
+    traversals = controller.get_avl_traversals(snapshot)
+    stats = controller.get_avl_stats(snapshot)
+    assert traversals['inorden'] == list(range(1, 21)), "Los recorridos deben ser los del instante de la instantánea"
+    assert stats['nodos'] == 20 and stats['balanceado'], "Las estadísticas deben ser las de la instantánea"
+    assert controller.get_avl_stats()['nodos'] == 16, "Sin instantánea se lee el árbol actual"
+    _check_sync(controller)
+
+    # Una actualización posterior no cambia las tareas de la instantánea
+    for backend in TaskController.INDEX_BACKENDS:
+        controller = TaskController(index_backend=backend)
+        for i in range(20):
+            controller.add_task(f"Tarea {i}", "MEDIA", "2024-06-01")
+        snapshot = controller.get_avl_snapshot()
+        updated = controller.update_task(8, priority="ALTA", due_date="2025-12-31")
+
+        old = snapshot.search(8)
+        assert (old.priority_name, old.due_date) == ("MEDIA", "2024-06-01"), \
+            "La instantánea debe conservar la prioridad y la fecha anteriores"
+        assert controller.search_task_by_id(8) is updated and updated is not old, "El sistema usa la copia"
+        assert controller.get_highest_priority_task() is updated, "El heap debe tener la copia actualizada"
+        assert controller.tasks_due_between("2025-12-31", "2025-12-31") == [updated], \
+            "El índice por fecha debe tener la copia actualizada"
+        assert controller.avl_tree.search(8) is updated, "El índice por ID debe tener la copia actualizada"
+        _check_sync(controller)
+
+    print("✓ Test 9 pasado exitosamente")
+
+
+def test_blocks_index_backend():
+    """Prueba del controlador con el índice por bloques"""
+    print("\n=== Test 10: Controlador con índice por bloques ===")
+
+    avl_controller = TaskController()
+    blocks_controller = TaskController(index_backend='blocks')
+    priorities = ["BAJA", "MEDIA", "ALTA"]
+    for controller in (avl_controller, blocks_controller):
+        for i in range(300):
+            controller.add_task(f"Tarea {i}", priorities[i % 3], f"2024-{(i % 12) + 1:02d}-05")
+        controller.delete_task_by_id(100)
+        controller.complete_n_highest_priority_tasks(40)
+        controller.update_task(7, priority="ALTA")
+        controller.archive_ids_below(20)
+        assert "Division en ID:20" in controller.get_avl_operations(), \
+            "El registro de operaciones debe conservarse tras archivar"
+        _check_sync(controller)
+
+    assert [t.task_id for t in blocks_controller.get_all_tasks_by_id()] == \
+        [t.task_id for t in avl_controller.get_all_tasks_by_id()], "Ambos índices deben tener las mismas tareas"
+    assert blocks_controller.get_task_position(150) == avl_controller.get_task_position(150), \
+        "Las posiciones deben coincidir"
+    assert blocks_controller.get_avl_traversals()['inorden'] == avl_controller.get_avl_traversals()['inorden'], \
+        "El recorrido inorden debe coincidir"
+    assert blocks_controller.get_avl_stats()['nodos'] == avl_controller.get_avl_stats()['nodos'], \
+        "Las estadísticas deben coincidir"
+
+    try:
+        TaskController(index_backend='hash')
+        assert False, "Un índice desconocido debería lanzar ValueError"
+    except ValueError:
+        pass
+
+    print("✓ Test 10 pasado exitosamente")
+
+
+def test_id_map_lookups():
+    """Prueba de búsquedas puntuales y en lote con el mapa de IDs"""
+    print("\n=== Test 11: Búsquedas por ID en O(1) ===")
+
+    controller = TaskController()
+    for i in range(50):
+        controller.add_task(f"Tarea {i}", "MEDIA", "2024-03-01")
+
+    controller.delete_task_by_id(10)
+    controller.complete_highest_priority_task()
+    controller.archive_ids_below(5)
+
+    assert controller.search_task_by_id(20) is controller.avl_tree.search(20), "Debe ser la misma tarea del AVL"
+    assert controller.search_task_by_id(10) is None and not controller.has_task(10), "La tarea 10 fue eliminada"
+    assert not controller.has_task(1) and not controller.has_task(3), "Las tareas archivadas no existen"
+    assert controller.has_task(50), "La tarea 50 existe"
+
+    found = controller.get_tasks_by_ids([7, 10, 49, 999])
+    assert [t.task_id if t else None for t in found] == [7, None, 49, None], \
+        "La búsqueda en lote debe respetar el orden y marcar los ausentes"
+    assert controller.get_tasks_by_ids([]) == [], "Un lote vacío no devuelve tareas"
+    _check_sync(controller)
+
+    controller.clear_all_tasks()
+    assert not controller.has_task(20) and controller.tasks_by_id == {}, "El mapa debe vaciarse"
+
+    print("✓ Test 11 pasado exitosamente")
+
+
+def test_columnar_filters():
+    """Prueba de estadísticas y filtros sobre el almacén columnar"""
+    print("\n=== Test 12: Estadísticas y filtros en bloque ===")
+
+    controller = TaskController()
+    priorities = ["BAJA", "MEDIA", "ALTA"]
+    for i in range(60):
+        controller.add_task(f"Tarea {i}", priorities[i % 3], f"2024-05-{i % 20 + 1:02d}")
+
+    controller.update_task(2, priority="ALTA", due_date="2024-04-01")
+    controller.delete_task_by_id(3)
+    controller.complete_n_highest_priority_tasks(5)
+    _check_sync(controller)
+
+    tasks = controller.get_all_tasks_by_id()
+    stats = controller.get_statistics()
+    assert stats['total'] == len(tasks), "El total debe coincidir"
+    for name in priorities:
+        assert stats[name.lower()] == sum(t.priority_name == name for t in tasks), f"Conteo de {name} incorrecto"
+
+    urgent = [t for t in tasks if t.priority_name == "ALTA" and t.due_date <= "2024-05-10"]
+    assert controller.filter_tasks("alta", due_to="2024-05-10") == urgent, "ALTA y vencidas hasta el día 10"
+    assert controller.count_tasks("ALTA", due_to="2024-05-10") == len(urgent), "El conteo debe coincidir"
+    assert controller.filter_tasks(due_from="2024-05-20") == [t for t in tasks if t.due_date >= "2024-05-20"], \
+        "El filtro por fecha mínima debe coincidir"
+    assert controller.due_histogram() == controller.count_due_by_day(), \
+        "El histograma diario debe coincidir con el índice por fecha"
+
+    for bad in [{"priority": "URGENTE"}, {"due_to": "2024/05/10"}, {"due_from": "20240510"}]:
+        try:
+            controller.filter_tasks(**bad)
+            assert False, f"El filtro {bad} debería lanzar ValueError"
+        except ValueError:
+            pass
+
+    controller.clear_all_tasks()
+    assert controller.count_tasks() == 0 and controller.get_statistics()['total'] == 0, "Debe vaciarse"
+
+    print("✓ Test 12 pasado exitosamente")
+
+
+def test_incremental_statistics():
+    """Prueba de los contadores incrementales de estadísticas"""
+    print("\n=== Test 13: Estadísticas incrementales ===")
+
+    controller = TaskController()
+    assert controller.get_statistics() == {'total': 0, 'alta': 0, 'media': 0, 'baja': 0,
+                                           'highest_priority': None}, "Sin tareas todo es cero"
+
+    for i in range(30):
+        controller.add_task(f"Tarea {i}", ["BAJA", "MEDIA", "ALTA"][i % 3], "2024-07-01")
+    stats = controller.get_statistics()
+    assert (stats['total'], stats['alta'], stats['media'], stats['baja']) == (30, 10, 10, 10), \
+        "Las altas deben contarse"
+
+    controller.complete_highest_priority_task()
+    controller.delete_task_by_id(1)
+    controller.update_task(2, priority="ALTA")
+    controller.update_task(5, due_date="2024-01-01")
+    stats = controller.get_statistics()
+    assert (stats['total'], stats['alta'], stats['media'], stats['baja']) == (28, 10, 9, 9), \
+        "Las bajas y los cambios de prioridad deben contarse"
+    assert stats['highest_priority'] is controller.get_highest_priority_task(), "Debe incluir la tarea prioritaria"
+    _check_sync(controller)
+
+    controller.complete_n_highest_priority_tasks(4)
+    controller.archive_ids_below(8)
+    controller.load_tasks([Task(100, "Cargada", "BAJA", "2024-08-01")])
+    other = TaskController()
+    other.add_task("Otra", "MEDIA", "2024-08-02")
+    controller.merge(other)
+    _check_sync(controller)
+    assert other.verify_statistics() and other.get_statistics()['total'] == 0, "other queda vacío"
+
+    # Una tarea cargada con un nombre de prioridad desconocido cuenta con su valor numérico
+    controller.load_tasks([Task(200, "Desconocida", "urgente", "2024-01-01")])
+    assert controller.verify_statistics(), "La tarea cargada debe contarse de forma consistente"
+    assert controller.delete_task_by_id(200), "La tarea cargada debe poder eliminarse"
+    _check_sync(controller)
+
+    # Un contador desfasado debe detectarse
+    controller.priority_counts[3] += 1
+    assert not controller.verify_statistics(), "La verificación debe detectar la inconsistencia"
+    assert controller.recompute_statistics()['alta'] == controller.priority_counts[3] - 1, \
+        "El recuento no debe usar los contadores"
+
+    controller.clear_all_tasks()
+    assert controller.verify_statistics() and controller.get_statistics()['total'] == 0, "Debe vaciarse"
+
+    print("✓ Test 13 pasado exitosamente")
+
+
+def run_all_tests():
+    """Ejecuta todas las pruebas del TaskController"""
+    print("\n" + "="*60)
+    print("EJECUTANDO PRUEBAS DE TASK CONTROLLER")
+    print("="*60)
+
+    try:
+        test_load_tasks()
+        test_complete_n_highest_priority_tasks()
+        test_update_task()
+        test_bucket_backend()
+        test_iter_tasks_by_id()
+        test_due_date_queries()
+        test_archive_ids_below()
+        test_merge()
+        test_avl_snapshot_reads()
+        test_blocks_index_backend()
+        test_id_map_lookups()
+        test_columnar_filters()
+        test_incremental_statistics()
+
+        print("\n" + "="*60)
+        print("✓ TODAS LAS PRUEBAS DE TASK CONTROLLER PASARON EXITOSAMENTE")
+        print("="*60)
+
+    except AssertionError as e:
+        print(f"\n✗ PRUEBA FALLIDA: {e}")
+        return False
+
+    return True
+
+
+if __name__ == "__main__":
+    run_all_tests()
@@ -0,0 +1,141 @@
+import sys
+import os
+import random
+from collections import Counter
+from datetime import date
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.models.task import Task
+from src.models import task_store
+from src.models.task_store import TaskStore
+
+"""
+Casos de prueba para TaskStore.
+Verifica las columnas, los conteos y los filtros contra recorridos de los objetos Task.
+"""
+
+
+def _modes():
+    """Modos disponibles: siempre el de Python puro, y NumPy si está instalado"""
+    return [False, True] if task_store.np is not None else [False]
+
+
+def _check_columns(store, tasks):
+    """Verifica que las filas correspondan exactamente a las tareas"""
+    by_id = {task.task_id: task for task in tasks}
+    assert store.size() == len(by_id), "El almacén debe tener una fila por tarea"
+    assert sorted(store.ids) == sorted(by_id), "Los IDs deben coincidir"
+    for task_id, row in store.row_of.items():
+        task = by_id[task_id]
+        assert store.ids[row] == task_id, "El mapa de filas debe apuntar a la fila correcta"
+        assert store.priorities[row] == task.priority, "La prioridad debe coincidir"
+        assert store.due[row] == task.due_ordinal, "La fecha debe coincidir"
+        assert store.created[row] == task.created_us, "La marca de creación debe coincidir"
+
+
+def test_columns_and_updates():
+    """Prueba de altas, bajas y actualizaciones de filas"""
+    print("\n=== Test 1: Columnas, bajas y actualizaciones ===")
+
+    for use_numpy in _modes():
+        tasks = [Task(i, f"Tarea {i}", ["BAJA", "MEDIA", "ALTA"][i % 3], f"2024-06-{i % 28 + 1:02d}")
+                 for i in range(1, 51)]
+        store = TaskStore.from_tasks(tasks, use_numpy=use_numpy)
+        _check_columns(store, tasks)
+
+        # Baja intermedia, última y repetida
+        assert store.remove(10) and store.remove(50), "Las bajas deben encontrar la fila"
+        assert not store.remove(10), "Una baja repetida debe retornar False"
+        store.remove_many([1, 2, 3, 999])
+        tasks = [task for task in tasks if task.task_id not in (1, 2, 3, 10, 50)]
+        _check_columns(store, tasks)
+
+        tasks[0].priority_name, tasks[0].priority = "ALTA", 3
+        tasks[0].due_date = "2025-01-01"
+        assert store.update(tasks[0]), "La actualización debe encontrar la fila"
+        assert not store.update(Task(500, "Ausente", "BAJA", "2024-01-01")), "Una tarea ausente no se actualiza"
+        _check_columns(store, tasks)
+
+        try:
+            store.add(tasks[1])
+            assert False, "Un ID repetido debería lanzar ValueError"
+        except ValueError:
+            pass
+
+    if task_store.np is None:
+        try:
+            TaskStore(use_numpy=True)
+            assert False, "Pedir NumPy sin tenerlo instalado debería lanzar ValueError"
+        except ValueError:
+            pass
+
+    print("✓ Test 1 pasado exitosamente")
+
+
+def test_counts_and_filters():
+    """Prueba de conteos, histogramas y filtros contra recorridos directos"""
+    print("\n=== Test 2: Conteos, histogramas y filtros ===")
+
+    rng = random.Random(11)
+    tasks = [Task(i, f"Tarea {i}", rng.choice(["BAJA", "MEDIA", "ALTA"]),
+                  f"2024-{rng.randint(1, 3):02d}-{rng.randint(1, 28):02d}")
+             for i in range(1, 401)]
+    today = date(2024, 2, 15).toordinal()
+
+    for use_numpy in _modes():
+        store = TaskStore.from_tasks(tasks, use_numpy=use_numpy)
+
+        expected = Counter(task.priority_name for task in tasks)
+        assert store.count_by_priority() == {name: expected[name] for name in ["BAJA", "MEDIA", "ALTA"]}, \
+            "Los conteos por prioridad deben coincidir"
+
+        by_day = Counter(task.due_date for task in tasks)
+        assert store.due_histogram() == dict(sorted(by_day.items())), "El histograma diario debe coincidir"
+        weekly = store.due_histogram(7)
+        assert sum(weekly.values()) == len(tasks), "El histograma semanal debe cubrir todas las tareas"
+        assert list(weekly) == sorted(weekly), "Los intervalos deben estar en orden de fecha"
+        for start in weekly:
+            assert date.fromisoformat(start).toordinal() % 7 == 0, "Los intervalos deben estar alineados"
+        try:
+            store.due_histogram(0)
+            assert False, "Un ancho no positivo debería lanzar ValueError"
+        except ValueError:
+            pass
+
+        # Filtro ALTA y vencidas hasta hoy
+        urgent = sorted(task.task_id for task in tasks if task.priority == 3 and task.due_ordinal <= today)
+        assert sorted(store.select_ids(priority=3, due_to=today)) == urgent, "El filtro combinado debe coincidir"
+        assert store.count(priority=3, due_to=today) == len(urgent), "El conteo filtrado debe coincidir"
+
+        window = [task.task_id for task in tasks if today <= task.due_ordinal <= today + 6]
+        assert sorted(store.select_ids(due_from=today, due_to=today + 6)) == sorted(window), \
+            "El filtro por rango debe coincidir"
+        assert store.count() == len(tasks), "Sin condiciones se cuentan todas las tareas"
+        assert store.select_ids(priority=3, due_from=today + 1, due_to=today) == [], "Rango vacío"
+
+    print("✓ Test 2 pasado exitosamente")
+
+
+def run_all_tests():
+    """Ejecuta todas las pruebas de TaskStore"""
+    print("\n" + "="*60)
+    print("EJECUTANDO PRUEBAS DE TASK STORE")
+    print("="*60)
+
+    try:
+        test_columns_and_updates()
+        test_counts_and_filters()
+
+        print("\n" + "="*60)
+        print("✓ TODAS LAS PRUEBAS DE TASK STORE PASARON EXITOSAMENTE")
+        print("="*60)
+
+    except AssertionError as e:
+        print(f"\n✗ PRUEBA FALLIDA: {e}")
+        return False
+
+    return True
+
+
+if __name__ == "__main__":
+    run_all_tests()